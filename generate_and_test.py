@@ -116,6 +116,22 @@ CommandLineParser.add_argument('--skip_systemrdl_name_and_desc_in_docstring',
                                     'attributes within the doc string of the built code. Setting '
                                     'this will skip this reducing the size of the python code '
                                     'generated')
+CommandLineParser.add_argument('--lazy_array_elements',
+                               action='store_true',
+                               dest='lazy_array_elements',
+                               help='build the elements of arrays when they are first accessed '
+                                    'rather than when the register model is built')
+CommandLineParser.add_argument('--lazy_children',
+                               action='store_true',
+                               dest='lazy_children',
+                               help='build the children of address maps, register files and '
+                                    'memories when they are first accessed rather than when the '
+                                    'register model is built')
+CommandLineParser.add_argument('--lazy_fields',
+                               action='store_true',
+                               dest='lazy_fields',
+                               help='build the fields of each register when they are first '
+                                    'accessed rather than when the register is built')
 CommandLineParser.add_argument('--hashing_mode',
                                dest='hashing_mode',
                                type=str,
@@ -229,6 +245,9 @@ if __name__ == '__main__':
         CommandLineArgs.skip_systemrdl_name_and_desc_properties,
         skip_systemrdl_name_and_desc_in_docstring=
         CommandLineArgs.skip_systemrdl_name_and_desc_in_docstring,
+        lazy_array_elements=CommandLineArgs.lazy_array_elements,
+        lazy_children=CommandLineArgs.lazy_children,
+        lazy_fields=CommandLineArgs.lazy_fields,
         hashing_method=NodeHashingMethod[CommandLineArgs.hashing_mode]
     )
     print(f'generation time {time.time() - start_time}s')
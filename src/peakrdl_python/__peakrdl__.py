@@ -115,6 +115,22 @@ class Exporter(ExporterSubcommandPlugin):
                                     'attributes within the doc string of the built code. Setting '
                                     'this will skip this reducing the size of the python code '
                                     'generated')
+        arg_group.add_argument('--lazy_array_elements', action='store_true',
+                               dest='lazy_array_elements',
+                               help='build the elements of arrays when they are first accessed '
+                                    'rather than when the register model is built, this reduces '
+                                    'the time and memory needed to build models with large '
+                                    'arrays')
+        arg_group.add_argument('--lazy_children', action='store_true',
+                               dest='lazy_children',
+                               help='build the children of address maps, register files and '
+                                    'memories when they are first accessed rather than when the '
+                                    'register model is built, this reduces the time needed to '
+                                    'build large register models')
+        arg_group.add_argument('--lazy_fields', action='store_true',
+                               dest='lazy_fields',
+                               help='build the fields of each register when they are first '
+                                    'accessed rather than when the register is built')
         arg_group.add_argument('--register_class_per_generated_file',
                                dest='register_class_per_generated_file',
                                type=int,
@@ -195,6 +211,9 @@ class Exporter(ExporterSubcommandPlugin):
                 options.skip_systemrdl_name_and_desc_properties,
             skip_systemrdl_name_and_desc_in_docstring=
                 options.skip_systemrdl_name_and_desc_in_docstring,
+            lazy_array_elements=options.lazy_array_elements,
+            lazy_children=options.lazy_children,
+            lazy_fields=options.lazy_fields,
             register_class_per_generated_file=options.register_class_per_generated_file,
             field_class_per_generated_file=options.field_class_per_generated_file,
             enum_field_class_per_generated_file=options.enum_field_class_per_generated_file,
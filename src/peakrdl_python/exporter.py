@@ -44,7 +44,7 @@ from .systemrdl_node_utility_functions import get_reg_writable_fields, \
     get_field_max_value_hex_string, get_reg_max_value_hex_string, \
     uses_enum, uses_memory, \
     get_memory_max_entry_value_hex_string, get_memory_width_bytes, \
-    get_field_default_value, get_enum_values, get_properties_to_include, \
+    get_field_default_value, field_has_side_effect, get_enum_values, get_properties_to_include, \
     HideNodeCallback, hide_based_on_property, \
     full_slice_accessor, ShowUDPCallback, \
     node_iterator_entry, simulator_field_definition
@@ -197,6 +197,9 @@ class PythonExporter:
                            legacy_enum_type: bool,
                            skip_systemrdl_name_and_desc_properties: bool,
                            skip_systemrdl_name_and_desc_in_docstring: bool,
+                           lazy_array_elements: bool,
+                           lazy_children: bool,
+                           lazy_fields: bool,
                            register_class_per_generated_file: int,
                            field_class_per_generated_file: int,
                            enum_field_class_per_generated_file: int,
@@ -266,6 +269,8 @@ class PythonExporter:
             'visible_nonsignal_node' : visible_nonsignal_node,
             'legacy_enum_type': legacy_enum_type,
             'skip_systemrdl_name_and_desc_properties': skip_systemrdl_name_and_desc_properties,
+            'lazy_array_elements': lazy_array_elements,
+            'lazy_children': lazy_children,
         }
         if legacy_block_access is True:
             context['get_array_typecode'] = get_array_typecode
@@ -297,6 +302,8 @@ class PythonExporter:
                    skip_systemrdl_name_and_desc_in_docstring,
                 unique_component_walker=unique_component_walker,
                 visible_nonsignal_node=visible_nonsignal_node,
+                lazy_array_elements=lazy_array_elements,
+                lazy_children=lazy_children,
                 memory_class_per_generated_file=memory_class_per_generated_file,
             )
 
@@ -312,6 +319,8 @@ class PythonExporter:
             skip_systemrdl_name_and_desc_in_docstring=skip_systemrdl_name_and_desc_in_docstring,
             unique_component_walker=unique_component_walker,
             visible_nonsignal_node=visible_nonsignal_node,
+            lazy_array_elements=lazy_array_elements,
+            lazy_fields=lazy_fields,
             register_class_per_generated_file=register_class_per_generated_file,
         )
 
@@ -364,6 +373,8 @@ class PythonExporter:
                                      skip_systemrdl_name_and_desc_in_docstring: bool,
                                      unique_component_walker: UniqueComponents,
                                      visible_nonsignal_node: Callable[[Node], int],
+                                     lazy_array_elements: bool,
+                                     lazy_fields: bool,
                                      register_class_per_generated_file: int) -> None:
         """
         Sub function of the __export_reg_model which exports the register class definitions into
@@ -438,6 +449,7 @@ class PythonExporter:
                         unique_component_walker.python_class_name,
                         async_library_classes=asyncoutput),
                     'get_field_default_value': get_field_default_value,
+                    'field_has_side_effect': field_has_side_effect,
                     'skip_lib_copy': skip_lib_copy,
                     'uses_enum': uses_enum(top_block),
                     'legacy_enum_type': legacy_enum_type,
@@ -450,6 +462,8 @@ class PythonExporter:
                     'dependent_fields': dependent_field_cls,
                     'hide_node_func': hide_node_func,
                     'visible_nonsignal_node': visible_nonsignal_node,
+                    'lazy_array_elements': lazy_array_elements,
+                    'lazy_fields': lazy_fields,
                 }
 
                 module_name = top_block.inst_name + f'_registers{index}'
@@ -474,6 +488,8 @@ class PythonExporter:
                                     skip_systemrdl_name_and_desc_in_docstring: bool,
                                     unique_component_walker: UniqueComponents,
                                     visible_nonsignal_node: Callable[[Node], int],
+                                    lazy_array_elements: bool,
+                                    lazy_children: bool,
                                     memory_class_per_generated_file: int) -> None:
         """
         Sub function of the __export_reg_model which exports the memory class definitions into
@@ -539,6 +555,7 @@ class PythonExporter:
                         unique_component_walker.python_class_name,
                         async_library_classes=asyncoutput),
                     'get_field_default_value': get_field_default_value,
+                    'field_has_side_effect': field_has_side_effect,
                     'skip_lib_copy': skip_lib_copy,
                     'uses_enum': uses_enum(top_block),
                     'legacy_enum_type': legacy_enum_type,
@@ -550,6 +567,8 @@ class PythonExporter:
                     'hide_node_func': hide_node_func,
                     'visible_nonsignal_node': visible_nonsignal_node,
                     'dependent_registers': dependent_reg_cls,
+                    'lazy_array_elements': lazy_array_elements,
+                    'lazy_children': lazy_children,
                 }
 
                 module_name = top_block.inst_name + f'_memories{index}'
@@ -868,6 +887,7 @@ class PythonExporter:
                 'get_field_inv_bitmask_hex_string': get_field_inv_bitmask_hex_string,
                 'get_field_max_value_hex_string': get_field_max_value_hex_string,
                 'get_field_default_value': get_field_default_value,
+                'field_has_side_effect': field_has_side_effect,
                 'get_reg_max_value_hex_string': get_reg_max_value_hex_string,
                 'get_reg_writable_fields': partial(get_reg_writable_fields,
                                                    hide_node_callback=hide_node_func),
@@ -976,6 +996,9 @@ class PythonExporter:
                legacy_enum_type: bool = False,
                skip_systemrdl_name_and_desc_properties: bool = False,
                skip_systemrdl_name_and_desc_in_docstring: bool = False,
+               lazy_array_elements: bool = False,
+               lazy_children: bool = False,
+               lazy_fields: bool = False,
                register_class_per_generated_file: int =
                    DEFAULT_REGISTER_CLASS_PER_GENERATED_FILE,
                field_class_per_generated_file: int =
@@ -1044,6 +1067,20 @@ class PythonExporter:
                                                                also increases file sizes. Setting
                                                                this option to ``True`` will exclude
                                                                them.
+            lazy_array_elements (bool) : Build the elements of arrays (registers, register files,
+                                         address maps and memories) when they are first
+                                         accessed rather than when the register model is
+                                         built. This reduces the time and memory to build
+                                         register models with large arrays.
+            lazy_children (bool) : Build the children of the address maps, register files and
+                                   memories when they are first accessed rather than when
+                                   the register model is built. This reduces the time to
+                                   build large register models where only a small part is
+                                   used.
+            lazy_fields (bool) : Build the fields of each register when they are first accessed
+                                 rather than when the register is built. The field properties
+                                 are shared by all instances of a register class in either
+                                 case.
             register_class_per_generated_file : Number of register class definitions to put in
                                                 each python module of the generated code.
                                                 Make sure this is set to ensure the file does not
@@ -1128,6 +1165,9 @@ class PythonExporter:
             legacy_enum_type=legacy_enum_type,
             skip_systemrdl_name_and_desc_properties=skip_systemrdl_name_and_desc_properties,
             skip_systemrdl_name_and_desc_in_docstring=skip_systemrdl_name_and_desc_in_docstring,
+            lazy_array_elements=lazy_array_elements,
+            lazy_children=lazy_children,
+            lazy_fields=lazy_fields,
             register_class_per_generated_file=register_class_per_generated_file,
             field_class_per_generated_file=field_class_per_generated_file,
             enum_field_class_per_generated_file=enum_field_class_per_generated_file,
@@ -23,6 +23,7 @@ from .callbacks import ReadCallback
 from .callbacks import ReadBlockCallback
 from .callbacks import WriteCallback
 from .callbacks import WriteBlockCallback
+from .callbacks import ReadBlockIntoCallback, WriteBlockBufferCallback
 from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
 from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
 from .callbacks import CallbackSet
@@ -36,6 +37,14 @@ from .sections import AsyncAddressMap
 from .sections import AsyncRegFile
 from .sections import AsyncAddressMapArray
 from .sections import AsyncRegFileArray
+from .section_access import SectionSnapshot
+from .section_access import RegisterRun
+from .section_access import WriteTransactionOrdering
+from .section_access import async_read_registers, async_read_registers_fields
+from .section_access import async_write_registers_fields
+from .shadow_cache import ShadowCache, AsyncShadowCache, ShadowCacheStatistics
+from .write_verify import WriteVerifyError, WriteVerifyMismatch
+from .fleet import Fleet, AsyncFleet, DeviceResult
 
 from .register_and_field import Reg
 from .register_and_field import RegArray
@@ -114,6 +123,7 @@ from .memory import MemoryArray
 from .async_memory import AsyncMemoryArray
 
 from .utility_functions import get_array_typecode
+from .utility_functions import swap_msb_lsb_ordering
 from .utility_functions import UnsupportedWidthError
 from .base import Node
 from .base import NodeArray
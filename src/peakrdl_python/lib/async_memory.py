@@ -22,14 +22,17 @@ memories
 from array import array as Array
 from typing import Union, TYPE_CHECKING, Optional
 from abc import ABC
-from collections.abc import Iterator, Iterable
+from collections.abc import Iterator, Iterable, AsyncIterator, AsyncIterable, Mapping
+from itertools import islice
+import mmap
+import os
 import sys
 
 from .base import NodeArray, IterationClassification
 from .sections import AsyncAddressMap
-from .memory import BaseMemory
+from .memory import BaseMemory, MemoryFileFormat, MemoryFileByteOrder
 
-from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
+from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy, Buffer
 
 # same bit of code exists in base so flags as duplicate
 # pylint: disable=duplicate-code
@@ -45,7 +48,7 @@ if TYPE_CHECKING:
     from .async_register_and_field import AsyncReg, AsyncRegArray
     from .async_register_and_field import ReadableAsyncRegister, WritableAsyncRegister
     from .async_register_and_field import ReadableAsyncRegisterArray, WriteableAsyncRegisterArray
-# pylint: disable=duplicate-code
+# pylint: disable=duplicate-code,too-many-lines
 
 
 class AsyncMemory(BaseMemory, Iterable[Union['AsyncReg', 'AsyncRegArray']], ABC):
@@ -98,14 +101,11 @@ class AsyncMemory(BaseMemory, Iterable[Union['AsyncReg', 'AsyncRegArray']], ABC)
 
     @property
     def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
-        # pylint: disable=protected-access
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
-
-        if isinstance(self.parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
-            return self.parent._callbacks
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
+            return callbacks
 
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
     def get_children(self, unroll: bool = False) -> Iterator[Union['AsyncReg', 'AsyncRegArray']]:
         """
@@ -280,6 +280,181 @@ class _MemoryAsyncReadOnly(AsyncMemory, ABC):
                            f'block callback:{read_block_callback}, '
                            f'normal callback:{read_callback}')
 
+    async def read_into(self, start_entry: int, buffer: Buffer) -> int:
+        """
+        Asynchronously read from the memory into a buffer, the number of entries read is set by
+        the size of the buffer. Each entry occupies ``width_in_bytes`` bytes of the buffer in the
+        native byte order, so an array.array or numpy array of the matching unsigned type can be
+        used (see :attr:`buffer_format`).
+
+        If the callback set has a ``read_block_into_callback`` the buffer is passed to it
+        directly, otherwise the entries are read with the other callbacks and copied into the
+        buffer.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            buffer: writable object supporting the buffer protocol
+
+        Returns: number of entries read
+
+        """
+        byte_view = self._buffer_view(buffer, writable=True)
+        number_entries = byte_view.nbytes // self.width_in_bytes
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        if number_entries == 0:
+            return 0
+
+        read_block_into_callback = self._callbacks.read_block_into_callback
+        if read_block_into_callback is not None:
+            await read_block_into_callback(addr=self.address_lookup(entry=start_entry),
+                                           width=self.width,
+                                           accesswidth=self.width,
+                                           buffer=byte_view)
+        else:
+            self._entries_to_buffer(await self._read(start_entry=start_entry,
+                                                     number_entries=number_entries), byte_view)
+        return number_entries
+
+    async def read_buffer(self, start_entry: int, number_entries: int) -> memoryview:
+        """
+        Asynchronously read from the memory into a new buffer, see :meth:`read_into`
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read
+
+        Returns: data read from memory, as a memoryview with the :attr:`buffer_format` (or bytes
+                 for memories wider than 64 bit)
+
+        """
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        buffer = bytearray(number_entries * self.width_in_bytes)
+        await self.read_into(start_entry=start_entry, buffer=buffer)
+        buffer_format = self.buffer_format
+        if buffer_format is None:
+            return memoryview(buffer)
+        return memoryview(buffer).cast(buffer_format)
+
+    def iter_read(self, start_entry: int, number_entries: int,
+                  chunk_entries: Optional[int] = None) -> AsyncIterator[list[int]]:
+        """
+        Asynchronously read a section of the memory as a series of smaller block reads, so that
+        a large memory can be processed without holding all of it. The block reads are only
+        made as the iterator is consumed, with ``async for``.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read
+            chunk_entries: maximum number of entries in each block read, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: asynchronous iterator of the data read from each block
+
+        """
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+
+        async def chunks() -> AsyncIterator[list[int]]:
+            for chunk_start in range(start_entry, start_entry + number_entries, chunk_size):
+                yield await self._read(start_entry=chunk_start,
+                                       number_entries=min(chunk_size, start_entry +
+                                                          number_entries - chunk_start))
+
+        return chunks()
+
+    async def read_entries(self, indices: Iterable[int], max_gap: int = 0) -> list[int]:
+        """
+        Asynchronously read a set of entries that need not be consecutive. The entries are
+        sorted and grouped into runs of consecutive entries, with one block read for each run.
+
+        Args:
+            indices: index of each entry to read, in any order and with repeats allowed
+            max_gap: largest gap between requested entries that is read as part of a single
+                     run, rather than starting a new run. Use this when a block read costs more
+                     than reading a few extra entries
+
+        Returns: data read from each entry, in the order of indices
+
+        """
+        indices = list(indices)
+        entry_values: dict[int, int] = {}
+        for run in self._entry_runs(indices, max_gap=max_gap):
+            entry_values.update(zip(run, await self._read(start_entry=run.start,
+                                                          number_entries=len(run))))
+        return [entry_values[index] for index in indices]
+
+    async def __dump_to_hex_file(self, path: Union[str, 'os.PathLike[str]'],
+                                 start_entry: int, number_entries: int,
+                                 chunk_entries: int) -> None:
+        """
+        Read from the memory into a hex file, see :meth:`dump_to_file`
+        """
+        chunk_buffer = memoryview(bytearray(min(chunk_entries, number_entries) *
+                                            self.width_in_bytes))
+        with open(path, 'w', encoding='ascii') as file:
+            for chunk_start, byte_slice in self._chunk_byte_slices(number_entries=number_entries,
+                                                                   chunk_size=chunk_entries):
+                with chunk_buffer[:byte_slice.stop - byte_slice.start] as chunk_view:
+                    await self.read_into(start_entry=start_entry + chunk_start,
+                                         buffer=chunk_view)
+                    file.write(self._buffer_to_hex(chunk_view))
+
+    # pylint: disable-next=too-many-arguments
+    async def dump_to_file(self, path: Union[str, 'os.PathLike[str]'], start_entry: int = 0,
+                           number_entries: Optional[int] = None, *,
+                           file_format: MemoryFileFormat = 'raw',
+                           byteorder: MemoryFileByteOrder = 'little',
+                           chunk_entries: Optional[int] = None) -> int:
+        """
+        Asynchronously read from the memory into a file, a chunk at a time (see
+        :meth:`iter_read`). The file is overwritten. The file itself is accessed synchronously.
+
+        A raw file holds each entry in ``width_in_bytes`` bytes with the given byte order. It is
+        memory mapped and each chunk is read into it with :meth:`read_into`, so the data is not
+        converted to python integers if the callback set has a ``read_block_into_callback``.
+
+        A hex file holds one entry per line as hexadecimal text, this can be loaded with the
+        verilog ``$readmemh``.
+
+        Args:
+            path: file to write
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read, None to read to the end of the memory
+            file_format: raw or hex
+            byteorder: byte order of each entry in a raw file, this is ignored for a hex file
+            chunk_entries: maximum number of entries in each block read, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: number of entries read
+
+        """
+        self._check_file_arguments(file_format=file_format, byteorder=byteorder)
+        number_entries = self._file_number_entries(start_entry=start_entry,
+                                                   number_entries=number_entries)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+
+        if file_format == 'hex':
+            await self.__dump_to_hex_file(path=path, start_entry=start_entry,
+                                          number_entries=number_entries,
+                                          chunk_entries=chunk_size)
+            return number_entries
+
+        with open(path, 'w+b') as file:
+            file.truncate(number_entries * self.width_in_bytes)
+            if number_entries == 0:
+                return 0
+            with mmap.mmap(file.fileno(), number_entries * self.width_in_bytes) as file_map, \
+                    memoryview(file_map) as file_view:
+                for chunk_start, byte_slice in self._chunk_byte_slices(
+                        number_entries=number_entries, chunk_size=chunk_size):
+                    with file_view[byte_slice] as chunk_view:
+                        await self.read_into(start_entry=start_entry + chunk_start,
+                                             buffer=chunk_view)
+                        if byteorder != sys.byteorder:
+                            self._swap_entry_bytes(chunk_view)
+        return number_entries
+
+
     def get_readable_registers(self, unroll: bool = False) -> \
             Iterator[Union['ReadableAsyncRegister', 'ReadableAsyncRegisterArray']]:
         """
@@ -425,6 +600,185 @@ class _MemoryAsyncWriteOnly(AsyncMemory, ABC):
         else:
             raise RuntimeError('No suitable callback')
 
+    async def write_from_buffer(self, start_entry: int, data: Buffer) -> None:
+        """
+        Asynchronously write data to memory from a buffer, the number of entries written is set
+        by the size of the buffer. Each entry occupies ``width_in_bytes`` bytes of the buffer in
+        the native byte order, so an array.array or numpy array of the matching unsigned type can
+        be used (see :attr:`buffer_format`).
+
+        If the callback set has a ``write_block_buffer_callback`` the buffer is passed to it
+        directly, otherwise the entries are decoded and written with the other callbacks.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            data: object supporting the buffer protocol
+
+        Returns: None
+
+        """
+        byte_view = self._buffer_view(data, writable=False)
+        number_entries = byte_view.nbytes // self.width_in_bytes
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        if number_entries == 0:
+            return
+
+        write_block_buffer_callback = self._callbacks.write_block_buffer_callback
+        if write_block_buffer_callback is not None:
+            self._check_buffer_data(byte_view)
+            await write_block_buffer_callback(addr=self.address_lookup(entry=start_entry),
+                                              width=self.width,
+                                              accesswidth=self.width,
+                                              data=byte_view)
+        else:
+            await self._write(start_entry=start_entry, data=self._buffer_to_entries(byte_view))
+
+    async def write_from_iterable(self, start_entry: int,
+                                  data: Union[Iterable[int], AsyncIterable[int]],
+                                  chunk_entries: Optional[int] = None) -> int:
+        """
+        Asynchronously write data to memory from an iterable or asynchronous iterable (for
+        example a generator) as a series of smaller block writes, so that a large memory can be
+        written without holding all the data.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            data: entries to write, these are only consumed as each block is written
+            chunk_entries: maximum number of entries in each block write, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: number of entries written
+
+        Raises:
+            ValueError: if the data does not fit in the memory, the entries that fit will
+                        already have been written
+
+        """
+        self._check_block(start_entry=start_entry, number_entries=0)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+        if isinstance(data, AsyncIterable):
+            async_data_iter = data.__aiter__()
+
+            async def next_chunk(length: int) -> list[int]:
+                chunk = []
+                async for value in async_data_iter:
+                    chunk.append(value)
+                    if len(chunk) == length:
+                        break
+                return chunk
+        else:
+            data_iter = iter(data)
+
+            async def next_chunk(length: int) -> list[int]:
+                return list(islice(data_iter, length))
+
+        entry = start_entry
+        while entry < self.entries:
+            chunk = await next_chunk(min(chunk_size, self.entries - entry))
+            if not chunk:
+                break
+            await self._write(start_entry=entry, data=chunk)
+            entry += len(chunk)
+        if entry == self.entries and await next_chunk(1):
+            raise ValueError(f'data does not fit in the memory, {self.entries - start_entry:d} '
+                             'entries were written')
+        return entry - start_entry
+
+    async def write_entries(self, values: Mapping[int, int]) -> None:
+        """
+        Asynchronously write a set of entries that need not be consecutive. The entries are
+        sorted and grouped into runs of consecutive entries, with one block write for each run,
+        in address order.
+
+        Args:
+            values: value to write keyed on the index of the entry
+
+        Returns: None
+
+        """
+        self._check_entry_values(values)
+        for run in self._entry_runs(values, max_gap=0):
+            await self._write(start_entry=run.start, data=[values[index] for index in run])
+
+    async def __load_from_hex_file(self, path: Union[str, 'os.PathLike[str]'],
+                                   start_entry: int, number_entries: Optional[int],
+                                   chunk_entries: int) -> int:
+        """
+        Write data from a hex file to the memory, see :meth:`load_from_file`
+        """
+        with open(path, encoding='ascii') as file:
+            values = self._hex_file_entries(file)
+            if number_entries is None:
+                return await self.write_from_iterable(start_entry=start_entry, data=values,
+                                                      chunk_entries=chunk_entries)
+            number_entries = self._file_number_entries(start_entry=start_entry,
+                                                       number_entries=number_entries)
+            written = await self.write_from_iterable(start_entry=start_entry,
+                                                     data=islice(values, number_entries),
+                                                     chunk_entries=chunk_entries)
+        if written != number_entries:
+            raise ValueError(f'file only holds {written:d} of the {number_entries:d} entries')
+        return written
+
+    # pylint: disable-next=too-many-arguments
+    async def load_from_file(self, path: Union[str, 'os.PathLike[str]'], start_entry: int = 0,
+                             number_entries: Optional[int] = None, *,
+                             file_format: MemoryFileFormat = 'raw',
+                             byteorder: MemoryFileByteOrder = 'little',
+                             chunk_entries: Optional[int] = None) -> int:
+        """
+        Asynchronously write data from a file to the memory, a chunk at a time. The file itself
+        is accessed synchronously. The file formats are described in
+        :meth:`MemoryAsyncReadOnly.dump_to_file`.
+
+        A raw file is memory mapped and each chunk is written from it with
+        :meth:`write_from_buffer`, so the data is not converted to python integers if the
+        callback set has a ``write_block_buffer_callback`` and the file uses the native byte
+        order.
+
+        Args:
+            path: file to read
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to write, None to write the whole file
+            file_format: raw or hex
+            byteorder: byte order of each entry in a raw file, this is ignored for a hex file
+            chunk_entries: maximum number of entries in each block write, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: number of entries written
+
+        """
+        self._check_file_arguments(file_format=file_format, byteorder=byteorder)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+
+        if file_format == 'hex':
+            return await self.__load_from_hex_file(path=path, start_entry=start_entry,
+                                                   number_entries=number_entries,
+                                                   chunk_entries=chunk_size)
+
+        with open(path, 'rb') as file:
+            number_entries = self._raw_file_number_entries(
+                file_size=os.fstat(file.fileno()).st_size, start_entry=start_entry,
+                number_entries=number_entries)
+            if number_entries == 0:
+                return 0
+            with mmap.mmap(file.fileno(), number_entries * self.width_in_bytes,
+                           access=mmap.ACCESS_READ) as file_map, \
+                    memoryview(file_map) as file_view:
+                for chunk_start, byte_slice in self._chunk_byte_slices(
+                        number_entries=number_entries, chunk_size=chunk_size):
+                    with file_view[byte_slice] as chunk_view:
+                        if byteorder == sys.byteorder:
+                            await self.write_from_buffer(
+                                start_entry=start_entry + chunk_start, data=chunk_view)
+                        else:
+                            swapped = memoryview(bytearray(chunk_view))
+                            self._swap_entry_bytes(swapped)
+                            await self.write_from_buffer(
+                                start_entry=start_entry + chunk_start, data=swapped)
+        return number_entries
+
+
     def get_writable_registers(self, unroll: bool = False) -> \
             Iterator[Union['WritableAsyncRegister', 'WriteableAsyncRegisterArray']]:
         """
@@ -493,7 +847,49 @@ class MemoryAsyncWriteOnlyLegacy(_MemoryAsyncWriteOnly, ABC):
         return await self._write(start_entry=start_entry, data=data)
 
 
-class MemoryAsyncReadWrite(MemoryAsyncReadOnly, MemoryAsyncWriteOnly, ABC):
+class _MemoryAsyncReadWrite(_MemoryAsyncReadOnly, _MemoryAsyncWriteOnly, ABC):
+    """
+    base class of memory wrappers which can be read and written
+
+    Note:
+        It is not expected that this class will be instantiated under normal
+        circumstances however, it is useful for type checking
+    """
+
+    __slots__: list[str] = []
+
+    async def write_entries(self, values: Mapping[int, int], max_gap: int = 0) -> None:
+        """
+        Asynchronously write a set of entries that need not be consecutive. The entries are
+        sorted and grouped into runs of consecutive entries, with one block write for each run,
+        in address order.
+
+        Args:
+            values: value to write keyed on the index of the entry
+            max_gap: largest gap between entries that is bridged to make a single run, the
+                     entries in the gap are read first and written back with their current
+                     value, so it must only be used if nothing else changes them
+
+        Returns: None
+
+        """
+        runs = self._entry_runs(values, max_gap=max_gap)
+        self._check_entry_values(values)
+        for run in runs:
+            if any(index not in values for index in run):
+                # the run bridges a gap, so the current value of the gap is needed
+                data = await self._read(start_entry=run.start, number_entries=len(run))
+                for offset, index in enumerate(run):
+                    if index in values:
+                        data[offset] = values[index]
+            else:
+                data = [values[index] for index in run]
+            await self._write(start_entry=run.start, data=data)
+
+
+# pylint: disable-next=too-many-ancestors
+class MemoryAsyncReadWrite(MemoryAsyncReadOnly, MemoryAsyncWriteOnly, _MemoryAsyncReadWrite,
+                           ABC):
     """
     base class of memory wrappers
 
@@ -505,7 +901,9 @@ class MemoryAsyncReadWrite(MemoryAsyncReadOnly, MemoryAsyncWriteOnly, ABC):
     __slots__: list[str] = []
 
 
-class MemoryAsyncReadWriteLegacy(MemoryAsyncReadOnlyLegacy, MemoryAsyncWriteOnlyLegacy, ABC):
+# pylint: disable-next=too-many-ancestors
+class MemoryAsyncReadWriteLegacy(MemoryAsyncReadOnlyLegacy, MemoryAsyncWriteOnlyLegacy,
+                                 _MemoryAsyncReadWrite, ABC):
     """
     base class of memory wrappers
 
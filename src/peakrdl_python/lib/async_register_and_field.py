@@ -25,6 +25,7 @@ from collections.abc import AsyncGenerator, Iterator, Iterable
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from array import array as Array
+import logging
 import sys
 from warnings import warn
 
@@ -36,7 +37,9 @@ from .async_memory import  MemoryAsyncReadOnlyLegacy, MemoryAsyncWriteOnlyLegacy
     MemoryAsyncReadWriteLegacy
 from .async_memory import ReadableAsyncMemoryLegacy, WritableAsyncMemoryLegacy
 from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
-from .base_register import BaseReg, BaseRegArray, RegisterWriteVerifyError
+from .base import invalidate_bound_callbacks
+from .base_register import BaseReg, BaseRegArray
+from .write_verify import RegisterWriteVerifyError
 from .base_field import FieldEnum, FieldSizeProps, FieldMiscProps, \
     _FieldReadOnlyFramework, _FieldWriteOnlyFramework, FieldType
 
@@ -93,14 +96,11 @@ class AsyncReg(BaseReg,
 
     @property
     def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
-        # pylint: disable=protected-access
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
+            return callbacks
 
-        if isinstance(self.parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
-            return self.parent._callbacks
-
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
     @property
     def fields(self) -> \
@@ -203,16 +203,48 @@ class RegAsyncReadOnly(AsyncReg, ABC):
 
         return filter(is_readable, self.fields)
 
+    @property
+    def _shadow_cache_bitmasks(self) -> Optional[tuple[int, int]]:
+        """
+        Bitmasks used by the shadow cache, these are the read only fields and the read/write
+        fields of the register (a value written to the read/write fields is the value read back).
+        This is None if any of the readable fields are volatile, as the value can be changed by
+        the hardware, or if any field has a side effect (for example rclr or woclr), as the
+        accesses must reach the hardware, so the register must not be cached.
+        """
+        # pylint: disable=duplicate-code
+        if any(field.has_side_effect for field in self.fields):
+            return None
+        read_only_bitmask = 0
+        read_write_bitmask = 0
+        for field in self.readable_fields:
+            if field.is_volatile:
+                return None
+            if isinstance(field, FieldAsyncReadWrite):
+                read_write_bitmask |= field.bitmask
+            else:
+                read_only_bitmask |= field.bitmask
+        return read_only_bitmask, read_write_bitmask
+
     async def read_fields(self) -> dict['str', Union[bool, Enum, int]]:
         """
         asynchronously read the register and return a dictionary of the field values
         """
-        return_dict: dict['str', Union[bool, Enum, int]] = {}
-        async with self.single_read() as reg:
-            for field in reg.readable_fields:
-                return_dict[field.inst_name] = await field.read()
+        return self._decode_fields(await self.read())
 
-        return return_dict
+    def _decode_fields(self, value: int) -> dict['str', Union[bool, Enum, int]]:
+        """
+        Decode all the readable fields from a register value, the generated registers replace
+        this with a version that decodes every field in a single pass
+
+        Args:
+            value: register value
+
+        Returns: dictionary of the field values keyed on the systemRDL name of the field
+        """
+        # pylint: disable-next=protected-access
+        return {field.inst_name: field._decode_read_value(value)
+                for field in self.readable_fields}
 
     @property
     def _is_readable(self) -> bool:
@@ -260,7 +292,9 @@ class RegAsyncWriteOnly(AsyncReg, ABC):
         self._validate_data(data=data)
 
         # pylint: disable=duplicate-code
-        self._logger.info(f'Writing data:0x{data:X} to 0x{self.address:X}')
+        # the message is only formatted when it will be used as this is on the write path
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(f'Writing data:0x{data:X} to 0x{self.address:X}')
         # pylint: enable=duplicate-code
 
         if self._callbacks.write_callback is not None:
@@ -302,6 +336,26 @@ class RegAsyncWriteOnly(AsyncReg, ABC):
 
         return filter(is_writable, self.fields)
 
+    @property
+    def _restore_bitmasks(self) -> tuple[int, int]:
+        """
+        Bitmasks used when restoring the register from a saved value:
+
+        * the writable fields that are not volatile, these are the fields that are restored
+        * the subset of these fields that can also be read back, so the value in the hardware
+          can be compared to the saved value
+        """
+        # pylint: disable=duplicate-code
+        restore_bitmask = 0
+        comparable_bitmask = 0
+        for field in self.writable_fields:
+            if field.is_volatile:
+                continue
+            restore_bitmask |= field.bitmask
+            if self._is_readable and isinstance(field, FieldAsyncReadOnly):
+                comparable_bitmask |= field.bitmask
+        return restore_bitmask, comparable_bitmask
+
     @abstractmethod
     async def write_fields(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
         """
@@ -424,6 +478,12 @@ class RegAsyncReadWrite(RegAsyncReadOnly, RegAsyncWriteOnly, ABC):
         else:
             await super().write(data)
             if verify:
+                verify_queue = self._write_verify_queue
+                if verify_queue is not None:
+                    verify_queue.defer(addr=self.address, width=self.width,
+                                       accesswidth=self.accesswidth, data=data,
+                                       inst_name=self.full_inst_name)
+                    return
                 read_back = await self.read()
                 if read_back != data:
                     raise RegisterWriteVerifyError(f'Readback {read_back:X} '
@@ -445,32 +505,16 @@ class RegAsyncReadWrite(RegAsyncReadOnly, RegAsyncWriteOnly, ABC):
 
         return await super().read()
 
-    async def read_fields(self) -> dict['str', Union[bool, Enum, int]]:
-        """
-        asynchronously read the register and return a dictionary of the field values
-        """
-        return_dict: dict['str', Union[bool, Enum, int]] = {}
-        async with self.single_read() as reg:
-            for field in reg.readable_fields:
-                return_dict[field.inst_name] = await field.read()
-
-        return return_dict
-
     async def write_fields(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
         """
         asynchronously read-modify-write to the register, updating any field included in
         the arguments
         """
+        # pylint: disable=duplicate-code
         if len(kwargs) == 0:
             raise ValueError('no command args')
 
-        async with self.single_read_modify_write() as reg:
-            for field_name, field_value in kwargs.items():
-                if field_name not in reg.systemrdl_python_child_name_map.values():
-                    raise ValueError(f'{field_name} is not a member of the register')
-
-                field = getattr(reg, field_name)
-                await field.write(field_value)
+        await self.write(self._encode_fields(await self.read(), kwargs))
 
     @property
     def _is_readable(self) -> bool:
@@ -500,7 +544,7 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
     # pylint: disable=too-many-arguments,duplicate-code
 
     __slots__: list[str] = ['__in_context_manager', '__register_cache',
-                            '__register_address_array']
+                            '__register_address_array', '__dirty_entries']
 
     def __init__(self, *,
                  logger_handle: str, inst_name: str,
@@ -513,7 +557,8 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
 
         self.__in_context_manager: bool = False
         self.__register_cache: Optional[Union[Array, list[int]]] = None
-        self.__register_address_array: Optional[list[int]] = None
+        self.__register_address_array: Optional[range] = None
+        self.__dirty_entries: Optional[set[int]] = None
 
         if not isinstance(parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
             raise TypeError(f'callback set type is wrong, got {type(parent._callbacks)}')
@@ -530,22 +575,28 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
     def __empty_list_cache(self) -> list[int]:
         return [0 for _ in range(self.__number_cache_entries)]
 
-    async def __block_read_legacy(self) -> Array:
+    @property
+    def __cache_addresses(self) -> range:
+        if self.__register_address_array is None:
+            raise RuntimeError('This address array has not be initialised')
+        return self.__register_address_array
+
+    async def __block_read_legacy(self, entries: range) -> Array:
         """
-        Read all the contents of the array in the most optimal way, ideally with a block operation
+        Read a range of the cache entries in the most optimal way, ideally with a block operation
         """
         if not isinstance(self._callbacks, AsyncCallbackSetLegacy):
             raise RuntimeError('This function should only be used with legacy callbacks')
 
         read_block_callback = self._callbacks.read_block_callback
         read_callback = self._callbacks.read_callback
+        addresses = self.__cache_addresses[entries.start:entries.stop]
 
         if read_block_callback is not None:
-
-            data_read = await read_block_callback(addr=self.address,
+            data_read = await read_block_callback(addr=addresses.start,
                                                   width=self.width,
                                                   accesswidth=self.accesswidth,
-                                                  length=self.__number_cache_entries)
+                                                  length=len(addresses))
 
             if not isinstance(data_read, Array):
                 raise TypeError('The read block callback is expected to return an array')
@@ -554,46 +605,37 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
-            data_array = self.__empty_array_cache
-
-            if self.__register_address_array is None:
-                raise RuntimeError('This address array has not be initialised')
-
-            for entry, address in enumerate(self.__register_address_array):
-                data_entry = await read_callback(addr=address,
-                                                 width=self.width,
-                                                 accesswidth=self.accesswidth)
-
-                data_array[entry] = data_entry
-
-            return data_array
+            return Array(get_array_typecode(self.width),
+                         [await read_callback(addr=address,
+                                              width=self.width,
+                                              accesswidth=self.accesswidth)
+                          for address in addresses])
 
         raise RuntimeError('There is no usable callback')
 
-    async def __block_write_legacy(self, data: Array, verify: bool) -> None:
+    async def __block_write_legacy(self, entries: range, verify: bool) -> None:
         """
-        Write all the contents of the array in the most optimal way, ideally with a block operation
+        Write a range of the cache entries in the most optimal way, ideally with a block operation
         """
         if not isinstance(self._callbacks, AsyncCallbackSetLegacy):
             raise RuntimeError('This function should only be used with legacy callbacks')
+        if not isinstance(self.__register_cache, Array):
+            raise TypeError('Register cache should be a Array in legacy mode')
 
         write_block_callback = self._callbacks.write_block_callback
         write_callback = self._callbacks.write_callback
+        addresses = self.__cache_addresses[entries.start:entries.stop]
+        data = self.__register_cache[entries.start:entries.stop]
 
         if write_block_callback is not None:
-            await write_block_callback(addr=self.address,
+            await write_block_callback(addr=addresses.start,
                                        width=self.width,
                                        accesswidth=self.width,
                                        data=data)
 
         elif write_callback is not None:
             # there is not write_block_callback defined so we must used individual write
-
-            if self.__register_address_array is None:
-                raise RuntimeError('This address array has not be initialised')
-
-            for entry_index, entry_data in enumerate(data):
-                entry_address = self.__register_address_array[entry_index]
+            for entry_address, entry_data in zip(addresses, data):
                 await write_callback(addr=entry_address,
                                      width=self.width,
                                      accesswidth=self.accesswidth,
@@ -602,28 +644,28 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
         else:
             raise RuntimeError('No suitable callback')
 
-        if verify:
-            read_back_verify_data = self.__block_read_legacy()
+        if verify and not self._defer_block_verify(addresses.start, data):
+            read_back_verify_data = await self.__block_read_legacy(entries)
             if read_back_verify_data != data:
                 raise RegisterWriteVerifyError('Read back block miss-match')
 
-    async def __block_read(self) -> list[int]:
+    async def __block_read(self, entries: range) -> list[int]:
         """
-        Read all the contents of the array in the most optimal way, ideally with a block operation
+        Read a range of the cache entries in the most optimal way, ideally with a block operation
         """
         if not isinstance(self._callbacks, AsyncCallbackSet):
             raise RuntimeError('This function should only be used with non-legacy callbacks')
 
         read_block_callback = self._callbacks.read_block_callback
         read_callback = self._callbacks.read_callback
+        addresses = self.__cache_addresses[entries.start:entries.stop]
 
         if read_block_callback is not None:
             data_read = \
-                await read_block_callback(addr=self.address,
+                await read_block_callback(addr=addresses.start,
                                           width=self.width,
                                           accesswidth=self.accesswidth,
-                                          length=self.__number_cache_entries)
-
+                                          length=len(addresses))
 
             if not isinstance(data_read, list):
                 raise TypeError('The read block callback is expected to return an array')
@@ -632,45 +674,35 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
-            data_list = self.__empty_list_cache
-
-            if self.__register_address_array is None:
-                raise RuntimeError('This address array has not be initialised')
-
-            for entry, address in enumerate(self.__register_address_array):
-                data = await read_callback(addr=address,
-                                           width=self.width,
-                                           accesswidth=self.accesswidth)
-
-                data_list[entry] = data
-
-            return data_list
+            return [await read_callback(addr=address,
+                                        width=self.width,
+                                        accesswidth=self.accesswidth) for address in addresses]
 
         raise RuntimeError('There is no usable callback')
 
-    async def __block_write(self, data: list[int], verify: bool) -> None:
+    async def __block_write(self, entries: range, verify: bool) -> None:
         """
-        Write all the contents of the array in the most optimal way, ideally with a block operation
+        Write a range of the cache entries in the most optimal way, ideally with a block operation
         """
         if not isinstance(self._callbacks, AsyncCallbackSet):
             raise RuntimeError('This function should only be used with non-legacy callbacks')
+        if not isinstance(self.__register_cache, list):
+            raise TypeError('Register cache should be a list in non-legacy mode')
 
         write_block_callback = self._callbacks.write_block_callback
         write_callback = self._callbacks.write_callback
+        addresses = self.__cache_addresses[entries.start:entries.stop]
+        data = self.__register_cache[entries.start:entries.stop]
 
         if write_block_callback is not None:
-            await write_block_callback(addr=self.address,
+            await write_block_callback(addr=addresses.start,
                                        width=self.width,
                                        accesswidth=self.width,
                                        data=data)
+
         elif write_callback is not None:
             # there is not write_block_callback defined so we must used individual write
-
-            if self.__register_address_array is None:
-                raise RuntimeError('This address array has not be initialised')
-
-            for entry_index, entry_data in enumerate(data):
-                entry_address = self.__register_address_array[entry_index]
+            for entry_address, entry_data in zip(addresses, data):
                 await write_callback(addr=entry_address,
                                      width=self.width,
                                      accesswidth=self.accesswidth,
@@ -679,8 +711,8 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
         else:
             raise RuntimeError('No suitable callback')
 
-        if verify:
-            read_back_verify_data = self.__block_read()
+        if verify and not self._defer_block_verify(addresses.start, data):
+            read_back_verify_data = await self.__block_read(entries)
             if read_back_verify_data != data:
                 raise RegisterWriteVerifyError('Read back block miss-match')
 
@@ -707,13 +739,12 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
             raise ValueError('Requested Read accesswidth does not match the expected value')
         if not isinstance(addr, int):
             raise TypeError(f'addr should be an int byt got {type(addr)}')
-        if not self.address <= addr < (self.address + self.size):
-            raise ValueError(f'Requested address 0x{addr:X} is out of range 0x{self.address:X} to '
-                             f'0x{self.address + self.size - (self.width >> 3):X}')
-        cache_entry = (addr - self.address) // (self.width >> 3)
-        if self.__register_address_array is None:
-            raise RuntimeError('The address table should always be populated here')
-        if self.__register_address_array[cache_entry] != addr:
+        addresses = self.__cache_addresses
+        if not addresses.start <= addr < addresses.stop:
+            raise ValueError(f'Requested address 0x{addr:X} is out of range 0x{addresses.start:X} '
+                             f'to 0x{addresses.stop - (self.width >> 3):X}')
+        cache_entry = (addr - addresses.start) // (self.width >> 3)
+        if addresses[cache_entry] != addr:
             raise RuntimeError(f'The calculated cache entry for address 0x{addr:X}')
         return cache_entry
 
@@ -750,84 +781,112 @@ class AsyncRegArray(BaseRegArray[AsyncRegArrayElementType], ABC):
         """
         if not isinstance(data, int):
             raise TypeError(f'Data should be an int byt got {type(data)}')
-        if self.__register_cache is None:
+        if self.__register_cache is None or self.__dirty_entries is None:
             raise RuntimeError('The cache array should be initialised')
-        self.__register_cache[self.__cache_entry(addr=addr,
-                                                 width=width,
-                                                 accesswidth=accesswidth)] = data
+        cache_entry = self.__cache_entry(addr=addr, width=width, accesswidth=accesswidth)
+        self.__register_cache[cache_entry] = data
+        self.__dirty_entries.add(cache_entry)
 
     @property
     def __cache_callbacks(self) -> AsyncCallbackSet:
         return AsyncCallbackSet(read_callback=self.__cache_read,
-                                write_callback=self.__cache_write)
+                                 write_callback=self.__cache_write)
 
     @property
     def __number_cache_entries(self) -> int:
-        return self.size // (self.width >> 3)
+        return len(self.__cache_addresses)
 
     async def __initialise_cache(self, skip_initial_read: bool) -> Union[Array, list[int]]:
+        all_entries = range(self.__number_cache_entries)
         if isinstance(self._callbacks, AsyncCallbackSet):
-            if skip_initial_read:
+            if skip_initial_read or len(all_entries) == 0:
                 return self.__empty_list_cache
-            return await self.__block_read()
+            return await self.__block_read(all_entries)
 
         if isinstance(self._callbacks, AsyncCallbackSetLegacy):
-            if skip_initial_read:
+            if skip_initial_read or len(all_entries) == 0:
                 return self.__empty_array_cache
-            return await self.__block_read_legacy()
+            return await self.__block_read_legacy(all_entries)
 
         raise TypeError('Unhandled callback type')
 
+    async def __write_back(self, verify: bool, allow_full_block: bool) -> None:
+        if self.__dirty_entries is None:
+            raise RuntimeError('The dirty entries should be initialised')
+        for entries in self._write_back_ranges(dirty_entries=self.__dirty_entries,
+                                               number_entries=self.__number_cache_entries,
+                                               allow_full_block=allow_full_block):
+            if isinstance(self._callbacks, AsyncCallbackSet):
+                await self.__block_write(entries, verify)
+            elif isinstance(self._callbacks, AsyncCallbackSetLegacy):
+                await self.__block_write_legacy(entries, verify)
+            else:
+                raise TypeError('Unhandled callback type')
+
     @asynccontextmanager
     async def _cached_access(self, verify: bool = False, skip_write: bool = False,
-                             skip_initial_read: bool = False) -> \
+                             skip_initial_read: bool = False,
+                             address_span: Optional[tuple[int, int]] = None) -> \
             AsyncGenerator[Self]:
         """
         Context manager to allow multiple field reads/write to be done with a single set of
         field operations
 
+        At the end of the context manager, only the registers that were written are written back,
+        see :meth:`_write_back_ranges`
+
         Args:
-            verify (bool): very the write with a read afterwards
+            verify (bool): verify the write with a read afterwards
             skip_write (bool): skip the write back at the end
-
+            skip_initial_read (bool): skip the read at the start, the cache starts as all zeros
+            address_span: range of addresses (start and end, exclusive) to hold in the cache,
+                          by default this covers the whole array
         """
-        self.__register_address_array = \
-            [self.address + (i * (self.width >> 3)) for i in range(self.__number_cache_entries)]
+        source_array = self._source_array
+        if source_array is not self:
+            # the elements of an array that has been sliced belong to the array it was sliced
+            # from, so the cache must be held there, limited to the addresses of the slice
+            # pylint: disable-next=protected-access
+            async with cast(AsyncRegArray, source_array)._cached_access(
+                    verify=verify, skip_write=skip_write, skip_initial_read=skip_initial_read,
+                    address_span=self._address_span):
+                yield self
+            return
+
+        self.__register_address_array = self._cache_address_range(address_span)
         self.__register_cache = await self.__initialise_cache(skip_initial_read=skip_initial_read)
+        self.__dirty_entries = set()
         self.__in_context_manager = True
+        # the registers in the array have bound the callbacks of the array, these need to be
+        # rebound to pick up the cache callbacks (and to release them again afterwards)
+        invalidate_bound_callbacks(self)
         # this try/finally is needed to make sure that in the event of an exception
         # the state flags are not left incorrectly set
         try:
             yield self
         finally:
             self.__in_context_manager = False
+            invalidate_bound_callbacks(self)
         if not skip_write:
-            if isinstance(self._callbacks, AsyncCallbackSet):
-                if not isinstance(self.__register_cache, list):
-                    raise TypeError('Register cache should be a list in non-legacy mode')
-                await self.__block_write(self.__register_cache, verify)
-            if isinstance(self._callbacks, AsyncCallbackSetLegacy):
-                if not isinstance(self.__register_cache, Array):
-                    raise TypeError('Register cache should be a Array in legacy mode')
-                await self.__block_write_legacy(self.__register_cache, verify)
+            # if the initial read was skipped, the entries that were not written hold zero
+            # rather than the register value, so these must not be written back
+            await self.__write_back(verify=verify, allow_full_block=not skip_initial_read)
 
         # clear the register states at the end of the context manager
         self.__register_address_array = None
         self.__register_cache = None
+        self.__dirty_entries = None
 
     @property
     def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
-        # pylint: disable=protected-access
         if self.__in_context_manager:
             return self.__cache_callbacks
 
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
-
-        if isinstance(self.parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
-            return self.parent._callbacks
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
+            return callbacks
 
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
 
 class RegAsyncReadOnlyArray(AsyncRegArray[RegAsyncReadOnly], ABC):
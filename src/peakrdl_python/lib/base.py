@@ -20,26 +20,70 @@ peakrdl-python tool. It provides a set of base classes used by the autogenerated
 """
 from __future__ import annotations
 import logging
-from typing import Optional, Union, TypeVar, Any
-from collections.abc import Iterator, Sequence
+from typing import Optional, Union, TypeVar, Any, TYPE_CHECKING
+from collections.abc import Iterator, Sequence, Mapping, Callable
+from collections import OrderedDict
+from types import MappingProxyType
 from abc import ABC, abstractmethod
 from itertools import product
+from threading import RLock
 from enum import IntEnum, Enum, auto
 import math
 import re
 
 from .callbacks import CallbackSet, CallbackSetLegacy
 
-UDPStruct = dict[str, 'UDPType']
-UDPType = Union[str, int, bool, IntEnum, UDPStruct, list['UDPType']]
+if TYPE_CHECKING:
+    from .write_verify import _WriteVerifyQueueBase
+
+UDPStruct = Mapping[str, 'UDPType']
+UDPType = Union[str, int, bool, IntEnum, UDPStruct, tuple['UDPType', ...]]
+
+# instance creation is logged against a single logger for the library (with the logger handle
+# of the instance attached), rather than against the logger of each instance, so that creating a
+# node or field does not need its logger
+_module_logger = logging.getLogger(__name__)
+
+_empty_udp: UDPStruct = MappingProxyType({})
 
 array_instance_re = re.compile(r'(?P<root_name>[A-Za-z_0-9]*)\[(?P<index>\d+)\]')
+array_element_re = re.compile(r'(?P<root_name>[A-Za-z_0-9]*)(?P<indices>(\[\d+\])+)')
+
+
+class _CallbackBinding:
+    """
+    Nodes resolve the callbacks of their parent once and then hold them (rather than walking the
+    parent chain on every access). Each register model (top level node) has one instance of this
+    class, shared by all its nodes, which holds the epoch that the bindings are made against. A
+    binding made against an old epoch is resolved again on its next use
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__: list[str] = ['epoch']
+
+    def __init__(self) -> None:
+        self.epoch = 0
+
+
+def invalidate_bound_callbacks(node: Union['Node', 'NodeArray']) -> None:
+    """
+    Invalidate the callbacks bound to every node of the register model that a node is part of,
+    this must be called whenever the callbacks that a node would resolve may have changed, for
+    example when a register array enters or leaves its cached access context manager or the
+    callbacks of the top level are replaced
+
+    Args:
+        node: any node of the register model
+    """
+    # pylint: disable-next=protected-access
+    node._callback_binding.epoch += 1
+
 
 class Base(ABC):
     """
     base class of for all types
     """
-    __slots__: list[str] = ['__logger', '__inst_name', '__parent']
+    __slots__: list[str] = ['__logger', '__logger_handle', '__inst_name', '__parent',
+                            '__full_inst_name']
 
     def __init__(self, *,
                  logger_handle: str, inst_name: str, parent: Optional[Union['Node', 'NodeArray']]):
@@ -47,8 +91,12 @@ class Base(ABC):
         if not isinstance(logger_handle, str):
             raise TypeError(f'logger_handle should be str but got {type(logger_handle)}')
 
-        self.__logger = logging.getLogger(logger_handle)
-        self._logger.debug(f'creating instance of {self.__class__}')
+        # the logger is only retrieved from the logging module when it is first used, this avoids
+        # registering a logger in the logging manager for every node and field of a large model
+        self.__logger_handle = logger_handle
+        self.__logger: Optional[logging.Logger] = None
+        if _module_logger.isEnabledFor(logging.DEBUG):
+            _module_logger.debug(f'creating instance of {self.__class__} for {logger_handle}')
 
         if not isinstance(inst_name, str):
             raise TypeError(f'inst_name should be str but got {type(inst_name)}')
@@ -58,11 +106,21 @@ class Base(ABC):
             if not isinstance(parent, (Node, NodeArray)):
                 raise TypeError(f'parent should be Node or Node Array but got {type(parent)}')
         self.__parent = parent
+        self.__full_inst_name: Optional[str] = None
 
     @property
     def _logger(self) -> logging.Logger:
+        if self.__logger is None:
+            self.__logger = logging.getLogger(self.__logger_handle)
         return self.__logger
 
+    @property
+    def _logger_handle(self) -> str:
+        """
+        name of the logger for the instance, this can be used without creating the logger
+        """
+        return self.__logger_handle
+
     @property
     def inst_name(self) -> str:
         """
@@ -77,11 +135,29 @@ class Base(ABC):
         """
         return self.__parent
 
+    @property
+    def _write_verify_queue(self) -> Optional['_WriteVerifyQueueBase']:
+        """
+        queue of the verify scope that the instance is within (if there is one), see the
+        ``verify_scope`` context manager of the AddressMap and RegFile
+        """
+        if self.__parent is None:
+            return None
+        # pylint: disable-next=protected-access
+        return self.__parent._write_verify_queue
+
     @property
     def full_inst_name(self) -> str:
         """
         The full hierarchical systemRDL name of the instance
         """
+        # the name is built on first use and then held, this is safe because the instance name
+        # and parent of an instance never change
+        if self.__full_inst_name is None:
+            self.__full_inst_name = self.__build_full_inst_name()
+        return self.__full_inst_name
+
+    def __build_full_inst_name(self) -> str:
         if self.parent is not None:
             if isinstance(self.parent, NodeArray):
                 if self.parent.parent is None:
@@ -98,7 +174,24 @@ class Base(ABC):
         """
         A dictionary of the user defined properties for the node
         """
-        return {}
+        return _empty_udp
+
+    def _udp_with_references(self, build: Callable[[], UDPStruct]) -> UDPStruct:
+        """
+        The user defined properties of an instance which reference other instances in the
+        register model can not be a class level constant (unlike those that don't), these are
+        built on first use and then held by the top level node
+
+        Args:
+            build: method that builds the user defined properties of the instance
+
+        Returns: dictionary of user defined properties
+        """
+        root_node = self._root
+        if not isinstance(root_node, Node):
+            raise RuntimeError(f'The top level should be a Node but got {type(root_node)}')
+        # pylint: disable-next=protected-access
+        return root_node._lookup_udp(node=self, build=build)
 
     def _traverse_from_fully_qualified_name(self, fully_qualified_name: list[str]) -> 'Base':
         """
@@ -110,24 +203,52 @@ class Base(ABC):
 
         # 1) location the root node by walking backwards up the tree until the parent is
         #    found
-        def locate_root(node: 'Base') -> 'Base':
-            if node.parent is None:
-                return node
-            return locate_root(node.parent)
-        root_node = locate_root(self)
+        root_node = self._root
         # 2) check the 1st entry in the list matches the name of the root
         if root_node.inst_name != fully_qualified_name[0]:
             raise RuntimeError('root node name mismatch')
-        # 3) start walking down the tree matching the nodes
-        walking_node = root_node
-        for node_name in fully_qualified_name[1:]:
-            if not isinstance(walking_node, Node):
-                # the current node being traversed must be a Node type i.e. not a field
-                raise RuntimeError('node traversal has failed as type:{type(walking_node)} was'
-                                   ' unexpectedly encountered')
-            walking_node = walking_node.get_child_by_system_rdl_name(node_name)
+        # 3) look up the node in the path index of the root (which walks down the tree matching
+        #    the nodes for any path that has not been looked up before)
+        if not isinstance(root_node, Node):
+            raise RuntimeError(f'node traversal has failed as the root is type:{type(root_node)}')
+        try:
+            # pylint: disable-next=protected-access
+            return root_node._lookup_full_inst_name('.'.join(fully_qualified_name))
+        except ValueError as err:
+            raise RuntimeError(f'node traversal has failed: {err}') from err
+
+    def get_by_full_inst_name(self, full_inst_name: str) -> 'Base':
+        """
+        returns a node or field from anywhere in the structure that this is part of, based
+        on its full hierarchical systemRDL name (see :attr:`full_inst_name`), array elements
+        include all their indices, for example ``top.block[3].reg.field``
 
-        return walking_node
+        Args:
+            full_inst_name: full hierarchical systemRDL name, starting from the top level
+
+        Returns: Node or Field
+
+        Raises:
+            ValueError: if the name can not be found
+        """
+        if not isinstance(full_inst_name, str):
+            raise TypeError(f'full_inst_name must be a string got {type(full_inst_name)}')
+        root_node = self._root
+        if not isinstance(root_node, Node):
+            raise RuntimeError(f'The top level should be a Node but got {type(root_node)}')
+        # pylint: disable-next=protected-access
+        return root_node._lookup_full_inst_name(full_inst_name)
+
+    @property
+    def _root(self) -> 'Base':
+        """
+        The top level of the structure that the instance is in, found by walking backwards up
+        the tree until an instance with no parent is found
+        """
+        node: Base = self
+        while node.parent is not None:
+            node = node.parent
+        return node
 
     @property
     def rdl_name(self) -> Optional[str]:
@@ -152,10 +273,53 @@ class IterationClassification(Enum):
     MEMORY = auto()
     SECTION = auto()
 
+class _CallbackBoundBase(Base, ABC):
+    """
+    base class of the nodes and node arrays, which resolve the callbacks of their parent once and
+    then hold them until the callback binding of their register model is invalidated, see
+    :func:`invalidate_bound_callbacks`
+    """
+    __slots__: list[str] = ['__callback_binding', '__bound_callbacks', '__bound_callbacks_epoch']
+
+    def __init__(self, *,
+                 logger_handle: str, inst_name: str, parent: Optional[Union['Node', 'NodeArray']]):
+        super().__init__(logger_handle=logger_handle, inst_name=inst_name, parent=parent)
+
+        # the top level node of a register model makes the binding shared by all the nodes below it
+        self.__callback_binding: _CallbackBinding = \
+            _CallbackBinding() if parent is None else parent._callback_binding
+        self.__bound_callbacks: Optional[Union[CallbackSet, CallbackSetLegacy]] = None
+        self.__bound_callbacks_epoch: int = -1
+
+    @property
+    def _callback_binding(self) -> _CallbackBinding:
+        """
+        callback binding of the register model that the node is part of
+        """
+        return self.__callback_binding
+
+    @property
+    def _parent_callbacks(self) -> Union[CallbackSet, CallbackSetLegacy]:
+        """
+        callbacks of the parent, these are resolved on first use and then bound to the node
+        until the binding is invalidated, see :func:`invalidate_bound_callbacks`
+        """
+        # the epoch must be read before the callbacks are resolved so that an invalidation
+        # during the resolution is not lost
+        epoch = self.__callback_binding.epoch
+        if self.__bound_callbacks is None or self.__bound_callbacks_epoch != epoch:
+            if self.parent is None:
+                raise RuntimeError('Parent must be set')
+            # pylint: disable-next=protected-access
+            self.__bound_callbacks = self.parent._callbacks
+            self.__bound_callbacks_epoch = epoch
+        return self.__bound_callbacks
+
+
 # FieldType = TypeVar('NodeElementType', bound=Node|NodeArray)
 # However, python 3.9 does not support the combination so the binding was removed
 # pylint: disable-next=invalid-name
-class Node(Base ,ABC):
+class Node(_CallbackBoundBase, ABC):
     """
     base class of for all types with an address i.e. not fields
 
@@ -168,7 +332,7 @@ class Node(Base ,ABC):
     # so that this can be used in the iteration filters
     _iteration_classification: IterationClassification
 
-    __slots__ = ['__address','_iteration_classification']
+    __slots__ = ['__address','_iteration_classification', '__path_index', '__udp_index']
 
     def __init_subclass__(cls, **kwargs:Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -196,6 +360,9 @@ class Node(Base ,ABC):
             raise TypeError(f'address should be int but got {type(address)}')
 
         self.__address = address
+        # only used on the top level node, see _lookup_full_inst_name and _lookup_udp
+        self.__path_index: Optional[dict[str, Base]] = None
+        self.__udp_index: Optional[dict[str, UDPStruct]] = None
 
     @property
     def address(self) -> int:
@@ -211,7 +378,7 @@ class Node(Base ,ABC):
 
     @property
     @abstractmethod
-    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+    def systemrdl_python_child_name_map(self) -> Mapping[str, str]:
         """
         In some cases systemRDL names need to be converted make them python safe, this dictionary
         is used to map the original systemRDL names to the names of the python attributes of this
@@ -246,6 +413,60 @@ class Node(Base ,ABC):
 
         return getattr(self, self.systemrdl_python_child_name_map[name])
 
+    def _lookup_full_inst_name(self, full_inst_name: str) -> Base:
+        """
+        Look up a node or field from its full hierarchical systemRDL name, this is intended to be
+        called on the top level node which holds an index of every name it has resolved. The
+        index is built lazily so that looking up a name (or a name sharing a path with one
+        already looked up) does not need to construct or walk the rest of the structure and
+        repeated look-ups are a single dictionary access.
+
+        Elements of arrays which build their elements on demand (and everything within them) are
+        not held in the index, these are resolved through the array each time so that the index
+        neither keeps evicted elements alive nor returns a different object to the array
+        """
+        if self.__path_index is None:
+            self.__path_index = {self.inst_name: self}
+
+        node = self.__path_index.get(full_inst_name)
+        if node is not None:
+            return node
+
+        parent_name, separator, child_name = full_inst_name.rpartition('.')
+        if not separator:
+            raise ValueError(f'{full_inst_name} is not in {self.inst_name}')
+        parent_node = self._lookup_full_inst_name(parent_name)
+        if not isinstance(parent_node, Node):
+            raise ValueError(f'{parent_name} is type:{type(parent_node)} which has no children')
+        try:
+            node = _get_child_by_element_name(parent_node, child_name)
+        except (KeyError, AttributeError, IndexError) as err:
+            raise ValueError(f'{child_name} is not in {parent_name}') from err
+
+        if parent_name in self.__path_index and not _within_lazy_array_element(node):
+            self.__path_index[full_inst_name] = node
+        return node
+
+    def _lookup_udp(self, node: Base, build: Callable[[], UDPStruct]) -> UDPStruct:
+        """
+        Look up the user defined properties of an instance (that reference other instances),
+        building them if this is the first use, see :meth:`Base._udp_with_references`. This is
+        intended to be called on the top level node.
+
+        As with :meth:`_lookup_full_inst_name`, properties of (or referencing) an element of an
+        array that builds its elements on demand are not held, as that element may be evicted
+        """
+        if self.__udp_index is None:
+            self.__udp_index = {}
+        full_inst_name = node.full_inst_name
+        udp = self.__udp_index.get(full_inst_name)
+        if udp is None:
+            udp = build()
+            if not any(_within_lazy_array_element(item)
+                       for item in (node, *_udp_references(udp))):
+                self.__udp_index[full_inst_name] = udp
+        return udp
+
     @property
     @abstractmethod
     def size(self) -> int:
@@ -254,24 +475,76 @@ class Node(Base ,ABC):
         """
 
 
+def _get_child_by_element_name(node: Node, name: str) -> Base:
+    """
+    returns a child by its name in the full hierarchical systemRDL name, unlike
+    :meth:`Node.get_child_by_system_rdl_name` this handles the indices of every dimension
+    of an array element e.g. ``reg[2][3]``
+    """
+    array_element_match = array_element_re.fullmatch(name)
+    if array_element_match is None:
+        return node.get_child_by_system_rdl_name(name)
+
+    child_array = node.get_child_by_system_rdl_name(array_element_match.group('root_name'))
+    if not isinstance(child_array, NodeArray):
+        raise IndexError('attempting to use array indexing into a non-array '
+                         f'node: {name} of type:{type(child_array)}')
+    indices = tuple(int(index) for index in
+                    array_element_match.group('indices')[1:-1].split(']['))
+    return child_array[indices]
+
+
+def _within_lazy_array_element(node: Base) -> bool:
+    """
+    Check if a node or field is an element (or within an element) of an array which builds its
+    elements on demand
+    """
+    parent = node.parent
+    while parent is not None:
+        # pylint: disable-next=protected-access
+        if isinstance(parent, NodeArray) and parent._lazy_elements:
+            return True
+        parent = parent.parent
+    return False
+
+
+def _udp_references(udp: Any) -> Iterator[Base]:
+    """
+    Walk the user defined properties of an instance and yield every instance they reference
+    """
+    if isinstance(udp, Base):
+        yield udp
+    elif isinstance(udp, (Mapping, tuple)):
+        for value in udp.values() if isinstance(udp, Mapping) else udp:
+            yield from _udp_references(value)
+
+
 # pylint: disable-next=invalid-name
 NodeArrayElementType = TypeVar('NodeArrayElementType', bound=Node)
 
 
-class NodeArray(Base, Sequence[NodeArrayElementType]):
+class NodeArray(_CallbackBoundBase, Sequence[NodeArrayElementType]):
     """
     base class of for all array types
     """
 
-    # pylint: disable=too-few-public-methods
-    __slots__: list[str] = ['__elements', '__element_indices', '__address',
-                            '__stride', '__dimensions',
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    __slots__: list[str] = ['__elements', '__element_indices', '__element_lookup',
+                            '__element_cache', '__element_cache_lock', '__element_strides',
+                            '__source', '__view',
+                            '__address', '__stride', '__dimensions',
                             '_iteration_classification']
 
     # in order to avoid circular import loops, the node class needs to keep track of its type
     # so that this can be used in the iteration filters
     _iteration_classification: IterationClassification
 
+    # when set the elements of the array are only built when they are first accessed (rather
+    # than all being built when the array is built), the most recently used elements are held
+    # in a cache, bounded to the size below
+    _lazy_elements: bool = False
+    _element_cache_size: int = 1024
+
     def __init_subclass__(cls, **kwargs:Any) -> None:
         super().__init_subclass__(**kwargs)
 
@@ -286,6 +559,14 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
             raise TypeError('_iteration_classification should be a IterationClassification '
                             f'but got {type(classification)}')
 
+        if not isinstance(cls._lazy_elements, bool):
+            raise TypeError(f'_lazy_elements should be a bool but got {type(cls._lazy_elements)}')
+        if not isinstance(cls._element_cache_size, int):
+            raise TypeError('_element_cache_size should be a int '
+                            f'but got {type(cls._element_cache_size)}')
+        if cls._element_cache_size < 1:
+            raise ValueError('_element_cache_size must be at least 1')
+
     # pylint: disable-next=too-many-arguments
     def __init__(self, *, logger_handle: str,
                  inst_name: str,
@@ -312,21 +593,121 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
                 raise TypeError(f'dimension should be a int but got {type(dimension)}')
         self.__dimensions = dimensions
 
-        # There are two use cases for this class:
+        # number of elements between consecutive indices in each dimension of the array, the
+        # elements are stored in row-major order so the last dimension is contiguous
+        self.__element_strides = tuple(math.prod(dimensions[axis + 1:])
+                                       for axis in range(len(dimensions)))
+
+        # There are four use cases for this class:
         # 1. Initial creation - elements is None in which case the data is populated
-        # 2. Creating a recursive version of itself, this happens when it is sliced by the parent
-        #    in which case a subset of the elements is presented and a new instance
+        # 2. Initial creation in lazy mode - elements is None and no elements are built until
+        #    they are accessed
+        # 3. Creating a view of itself, this happens when it is sliced by the parent, the view
+        #    shares the elements of the array it was sliced from and only holds the range of
+        #    indices it covers in each dimension (see __attach_view)
+        # 4. Creating an instance from an explicit set of elements
+
+        self.__source: NodeArray[NodeArrayElementType] = self
+        self.__view: Optional[tuple[range, ...]]
+        self.__element_indices: Optional[tuple[tuple[int, ...], ...]]
+        self.__elements: Optional[tuple[NodeArrayElementType, ...]]
+        self.__element_lookup: Optional[dict[tuple[int, ...], NodeArrayElementType]]
+        self.__element_cache: Optional[OrderedDict[tuple[int, ...], NodeArrayElementType]]
+        # the cache is shared by all the threads accessing the model, so is updated under a lock
+        # this also ensures only one instance of each element is built
+        self.__element_cache_lock: Optional[RLock] = None
 
         if elements is not None:
             self.__check_init_element(elements)
+            self.__view = None
             self.__element_indices = elements[0]
             self.__elements = elements[1]
+            self.__element_lookup = dict(zip(elements[0], elements[1]))
+            self.__element_cache = None
         else:
-            # build the full set of indices
-            self.__element_indices = \
-                tuple(indices for indices in product(*[range(dim) for dim in self.dimensions]))
-            self.__elements = tuple(self.__build_element(indices=index)
-                                    for index in self.__element_indices)
+            self.__view = tuple(range(dim) for dim in self.dimensions)
+            self.__element_indices = None
+            self.__element_lookup = None
+            if self._lazy_elements:
+                self.__elements = None
+                self.__element_cache = OrderedDict()
+                self.__element_cache_lock = RLock()
+            else:
+                self.__elements = tuple(self.__build_element(indices=index)
+                                        for index in product(*self.__view))
+                self.__element_cache = None
+
+    # pylint: disable-next=unused-private-member
+    def __attach_view(self, source: NodeArray[NodeArrayElementType],
+                      view: tuple[range, ...]) -> None:
+        """
+        Turn this instance into a view of another array, sharing its elements
+
+        Args:
+            source: array which holds the elements
+            view: range of indices covered by the view in each dimension
+        """
+        self.__source = source
+        self.__view = view
+        self.__element_indices = None
+        self.__elements = None
+        self.__element_lookup = None
+        self.__element_cache = None
+        self.__element_cache_lock = None
+
+    def __has_element(self, indices: tuple[int, ...]) -> bool:
+        """
+        Check whether an element is in the array
+
+        Args:
+            indices: element index, the length must match the array dimensions
+
+        Returns: True if the element is in the array
+        """
+        if self.__view is None:
+            if self.__element_lookup is None:
+                raise RuntimeError('Array elements should have been populated')
+            return indices in self.__element_lookup
+        return all(index in axis_range for index, axis_range in zip(indices, self.__view))
+
+    def __element(self, indices: tuple[int, ...]) -> NodeArrayElementType:
+        """
+        Retrieve an element of the array, in lazy mode this will build the element if it is not
+        in the cache
+
+        Args:
+            indices: element index, this must be checked with __has_element beforehand
+
+        Returns: array element
+        """
+        if self.__source is not self:
+            # pylint: disable-next=protected-access
+            return self.__source.__element(indices)
+
+        if self.__element_lookup is not None:
+            return self.__element_lookup[indices]
+
+        if self.__elements is not None:
+            return self.__elements[self.__element_offset(indices)]
+
+        if self.__element_cache is None or self.__element_cache_lock is None:
+            raise RuntimeError('Array elements should have been populated')
+        with self.__element_cache_lock:
+            element = self.__element_cache.pop(indices, None)
+            if element is None:
+                element = self.__build_element(indices=indices)
+            # (re)inserting the element makes it the most recently used
+            self.__element_cache[indices] = element
+            if len(self.__element_cache) > self._element_cache_size:
+                self.__element_cache.popitem(last=False)
+        return element
+
+    def __element_offset(self, indices: tuple[int, ...]) -> int:
+        """
+        Position of an element within the array when the elements are in row-major order
+        """
+        return sum(index * element_stride
+                   for index, element_stride in zip(indices, self.__element_strides))
 
     def __build_element(self, indices: tuple[int, ...]) -> NodeArrayElementType:
 
@@ -345,7 +726,7 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
         Returns:
         """
-        return self._logger.name + '[' + ','.join([str(item) for item in indices]) + ']'
+        return self._logger_handle + '[' + ','.join([str(item) for item in indices]) + ']'
 
     def __build_element_inst_name(self, indices: tuple[int, ...]) -> str:
         """
@@ -396,41 +777,71 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
                 raise ValueError('Expected Address of the item and actual address differ')
 
     def __address_calculator(self, indices: tuple[int, ...]) -> int:
-        def cal_addr(dimensions: tuple[int,...], indices: tuple[int, ...], base_address: int,
-                     stride: int) -> int:
-            """
-            Calculates the address of an register within an array
-
-            :param dimensions: list of the array dimensions
-            :param indices: list of the array indices (length must match the dimensions)
-            :param base_address: base address of the array
-            :param stride: address stride of of the array
-            :return: address of the register
-            """
-            if len(dimensions) == 1:
-                return (indices[0] * stride) + base_address
-
-            outer_offset = math.prod(dimensions[1::]) * stride * indices[0]
-            return outer_offset + cal_addr(dimensions=dimensions[1::],
-                                           indices=indices[1::],
-                                           stride=self.stride,
-                                           base_address=self.address)
-
-        return cal_addr(self.dimensions, base_address=self.address,
-                        stride=self.stride, indices=indices)
-
-    def __sub_instance(self, elements: tuple[tuple[tuple[int, ...],...],
-                                             tuple[NodeArrayElementType, ...]]) -> \
+        """
+        Calculates the address of an element within the array
+
+        Args:
+            indices: element index (length must match the dimensions)
+
+        Returns: address of the element
+        """
+        return self.address + (self.__element_offset(indices) * self.stride)
+
+    def __sub_instance(self, view: tuple[range, ...]) -> NodeArray[NodeArrayElementType]:
+        if not isinstance(self.parent, Node):
+            raise RuntimeError('Parent of a Node Array must be Node')
+        sub_instance = self.__class__(logger_handle=self._logger_handle,
+                                      inst_name=self.inst_name,
+                                      parent=self.parent,
+                                      address=self.address,
+                                      stride=self.stride,
+                                      dimensions=self.dimensions,
+                                      elements=((), ()))
+        # pylint: disable-next=protected-access
+        sub_instance.__attach_view(source=self.__source, view=view)
+        return sub_instance
+
+    def __sub_instance_explicit(self, indices: tuple[tuple[int, ...], ...]) -> \
             NodeArray[NodeArrayElementType]:
+        """
+        Make a sub-instance from an array that was built with an explicit set of elements
+        """
         if not isinstance(self.parent, Node):
             raise RuntimeError('Parent of a Node Array must be Node')
-        return self.__class__(logger_handle=self._logger.name,
-                              inst_name=self.inst_name,
-                              parent=self.parent,
-                              address=self.address,
-                              stride=self.stride,
-                              dimensions=self.dimensions,
-                              elements=elements)
+        sub_instance = self.__class__(logger_handle=self._logger_handle,
+                                      inst_name=self.inst_name,
+                                      parent=self.parent,
+                                      address=self.address,
+                                      stride=self.stride,
+                                      dimensions=self.dimensions,
+                                      elements=(indices, tuple(self[index] for index in indices)))
+        # pylint: disable-next=protected-access,unused-private-member
+        sub_instance.__source = self.__source
+        return sub_instance
+
+    @staticmethod
+    def __sub_range(view_range: range, requested_range: range) -> range:
+        """
+        Check that a range of indices requested in a dimension is covered by the indices of the
+        view in that dimension
+
+        Args:
+            view_range: indices covered by the view
+            requested_range: indices requested
+
+        Returns: requested range
+
+        Raises: IndexError if one or more of the indices is not in the view
+        """
+        if len(requested_range) == 0:
+            return requested_range
+        # the view and request are both evenly spaced, so all the requested indices are in the
+        # view if the first and last ones are and the spacing is compatible
+        if requested_range[0] not in view_range or requested_range[-1] not in view_range:
+            raise IndexError('slice covers indices outside of the array')
+        if len(requested_range) > 1 and requested_range.step % view_range.step != 0:
+            raise IndexError('slice covers indices outside of the array')
+        return requested_range
 
     def __getitem__(self, item):  # type: ignore[no-untyped-def]
         if len(self.dimensions) > 1:
@@ -443,18 +854,16 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
                              ' array')
 
         if isinstance(item, slice):
-
-            valid_items = tuple((i,) for i in range(*item.indices(self.dimensions[0])))
-
-            child_elements = ( valid_items,
-                               tuple(self.__getitem__(index) for index in valid_items) )
-            return self.__sub_instance(elements=child_elements)
+            requested_range = range(*item.indices(self.dimensions[0]))
+            if self.__view is None:
+                return self.__sub_instance_explicit(
+                    indices=tuple((index,) for index in requested_range))
+            return self.__sub_instance(view=(self.__sub_range(self.__view[0], requested_range),))
 
         if isinstance(item, int):
-            if (item, ) not in self.__element_indices:
+            if not self.__has_element((item, )):
                 raise IndexError(f'{item:d} in in the array')
-            index = self.__element_indices.index((item, ))
-            return self.__elements[index]
+            return self.__element((item, ))
 
         raise TypeError(f'Array index must either being an int or a slice, got {type(item)}')
 
@@ -469,46 +878,60 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
             if all(isinstance(i, int) for i in item):
                 # single item access
-                if item not in self.__element_indices:
+                if not self.__has_element(item):
                     msg = 'index[' + ','.join([str(i) for i in item]) + '] not in array'
                     raise IndexError(msg)
-                index = self.__element_indices.index(item)
-                return self.__elements[index]
+                return self.__element(item)
 
-            unpack_index_set = []
+            requested_ranges = []
             for axis, sub_index in enumerate(item):
                 if isinstance(sub_index, int):
                     if not 0 <= sub_index < self.dimensions[axis]:
                         raise IndexError(f'{sub_index:d} out of range for dimension {axis}')
-                    unpack_index_set.append((sub_index,))
+                    requested_ranges.append(range(sub_index, sub_index + 1))
                     continue
 
                 if isinstance(sub_index, slice):
-                    unpack_index_set.append(range(*sub_index.indices(self.dimensions[axis])))
+                    requested_ranges.append(range(*sub_index.indices(self.dimensions[axis])))
                     continue
 
                 raise TypeError(f'unhandle index of {type(sub_index)} in position {axis:d}')
 
-            valid_items = tuple(product(*unpack_index_set))
-
-            child_elements = ( valid_items,
-                               tuple(self[index] for index in valid_items) )
-            return self.__sub_instance(elements=child_elements)
+            if self.__view is None:
+                return self.__sub_instance_explicit(indices=tuple(product(*requested_ranges)))
+            return self.__sub_instance(view=tuple(
+                self.__sub_range(view_range, requested_range)
+                for view_range, requested_range in zip(self.__view, requested_ranges)))
 
         raise IndexError('attempting a single dimensional array access on a multidimension'
                          ' array')
 
     def __len__(self) -> int:
-        return len(self.__elements)
+        if self.__view is None:
+            if self.__element_indices is None:
+                raise RuntimeError('Array elements should have been populated')
+            return len(self.__element_indices)
+        return math.prod(len(axis_range) for axis_range in self.__view)
+
+    def __indices(self) -> Iterator[tuple[int, ...]]:
+        if self.__view is None:
+            if self.__element_indices is None:
+                raise RuntimeError('Array elements should have been populated')
+            yield from self.__element_indices
+        else:
+            yield from product(*self.__view)
 
     def __iter__(self) -> Iterator[NodeArrayElementType]:
-        yield from self.__elements
+        if self.__source is self and self.__elements is not None:
+            yield from self.__elements
+        else:
+            yield from (self.__element(indices) for indices in self.__indices())
 
     def items(self) -> Iterator[tuple[tuple[int, ...], NodeArrayElementType]]:
         """
         iterate through all the items in an array but also return the index of the array
         """
-        yield from zip(self.__element_indices, self.__elements)
+        yield from ((indices, self.__element(indices)) for indices in self.__indices())
 
     @property
     def dimensions(self) -> Union[tuple[int, ...], tuple[int]]:
@@ -517,6 +940,33 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
         """
         return self.__dimensions
 
+    @property
+    def _source_array(self) -> NodeArray[NodeArrayElementType]:
+        """
+        The array that holds the elements, for an array that was sliced from another array this
+        is the array it was sliced from (the elements of both are the same instances)
+        """
+        return self.__source
+
+    @property
+    def _address_span(self) -> tuple[int, int]:
+        """
+        The span of addresses covered by the elements in the array, this is the address of the
+        first element and the address after the last element (i.e. the address of the last
+        element plus the stride)
+        """
+        if len(self) == 0:
+            return self.address, self.address
+        if self.__view is None:
+            addresses = [self.__address_calculator(indices) for indices in self.__indices()]
+            return min(addresses), max(addresses) + self.stride
+        # the view is the product of evenly spaced indices in each dimension, so the lowest and
+        # highest addresses are the elements at the ends of each range
+        first_indices = tuple(min(axis[0], axis[-1]) for axis in self.__view)
+        last_indices = tuple(max(axis[0], axis[-1]) for axis in self.__view)
+        return (self.__address_calculator(first_indices),
+                self.__address_calculator(last_indices) + self.stride)
+
     @property
     @abstractmethod
     def _element_datatype(self) -> type[NodeArrayElementType]:
@@ -538,10 +988,7 @@ class NodeArray(Base, Sequence[NodeArrayElementType]):
 
     @property
     def _callbacks(self) -> Union[CallbackSet, CallbackSetLegacy]:
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
-        # pylint: disable-next=protected-access
-        return self.parent._callbacks
+        return self._parent_callbacks
 
     @property
     def size(self) -> int:
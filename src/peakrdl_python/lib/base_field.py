@@ -128,13 +128,14 @@ class FieldMiscProps:
     Class to hold additional attributes of a field
     """
 
-    __slots__ = ['__default', '__is_volatile']
+    __slots__ = ['__default', '__is_volatile', '__has_side_effect']
 
-    def __init__(self, default:Optional[int], is_volatile:bool):
+    def __init__(self, default:Optional[int], is_volatile:bool, has_side_effect:bool=False):
         if not isinstance(default, int) and default is not None:
             raise TypeError(f'default should be int or None, got {type(default)}')
         self.__default = default
         self.__is_volatile = is_volatile
+        self.__has_side_effect = has_side_effect
 
     @property
     def default(self) -> Optional[int]:
@@ -154,6 +155,14 @@ class FieldMiscProps:
         """
         return self.__is_volatile
 
+    @property
+    def has_side_effect(self) -> bool:
+        """
+        True if an access to the field has a side effect, i.e. it has an onread or onwrite
+        property (for example rclr or woclr) or is singlepulse
+        """
+        return self.__has_side_effect
+
 
 # The following line should be:
 # FieldType = TypeVar('FieldType', bound=int|IntEnum|SystemRDLEnum)
@@ -366,6 +375,14 @@ class Field(Generic[FieldType], Base, ABC):
         """
         return self.__misc_props.is_volatile
 
+    @property
+    def has_side_effect(self) -> bool:
+        """
+        True if reading or writing the field has a side effect (for example rclr, woclr or
+        singlepulse)
+        """
+        return self.__misc_props.has_side_effect
+
     @property
     def __parent_register(self) -> BaseReg:
         """
@@ -19,23 +19,19 @@ This module is intended to distributed as part of automatically generated code b
 peakrdl-python tool. It provides a set of classes used by the autogenerated code to represent
 registers
 """
-from typing import Union, Optional, TypeVar
+from typing import Union, Optional, TypeVar, Any
+from collections.abc import Mapping, Iterable
 from abc import ABC, abstractmethod
 
 
 from .base import Node, NodeArray, IterationClassification
 from .sections import AddressMap, RegFile
-from .utility_functions import legal_register_width
+from .utility_functions import legal_register_width, swap_msb_lsb_ordering
+from .utility_functions import contiguous_index_ranges
 from .sections import AsyncAddressMap, AsyncRegFile
 from .memory import BaseMemory
 
 
-class RegisterWriteVerifyError(Exception):
-    """
-    Exception that occurs when the read after a write does not match the expected value
-    """
-
-
 class BaseReg(Node, ABC):
     """
     base class of register wrappers
@@ -46,6 +42,12 @@ class BaseReg(Node, ABC):
     """
     _iteration_classification = IterationClassification.REGISTER
 
+    # The generated registers provide a table to encode their writable fields in a single pass,
+    # keyed on the python name of the field. Each entry is a tuple of: field type, whether the
+    # field type is an enumeration, maximum value, low bit, inverse bitmask and the width of the
+    # field if it is msb0 (otherwise 0)
+    _field_encoding: Optional[Mapping[str, tuple[type[Any], bool, int, int, int, int]]] = None
+
     __slots__: list[str] = []
 
     # pylint: disable=too-many-arguments,duplicate-code
@@ -99,6 +101,70 @@ class BaseReg(Node, ABC):
         if data < 0:
             raise ValueError('data out of range')
 
+    def _encode_fields(self, reg_value: int, values: Mapping[str, Any]) -> int:
+        """
+        Encode a set of field values into a register value, any field not included keeps its
+        value from the register value provided
+
+        Args:
+            reg_value: register value to update
+            values: field values keyed on the python name of the field
+
+        Returns: updated register value
+        """
+        if self._field_encoding is None:
+            return self.__encode_fields_individually(reg_value=reg_value, values=values)
+
+        for field_name, field_value in values.items():
+            encoding = self._field_encoding.get(field_name)
+            if encoding is None:
+                raise ValueError(f'{field_name} is not a writable member of the register')
+            field_type, is_enum, max_value, low, inverse_bitmask, msb0_width = encoding
+
+            if not isinstance(field_value, field_type):
+                raise TypeError(f'Field type is not as expected, got {type(field_value)},'
+                                f' expected {field_type}')
+            int_value: int = field_value.value if is_enum else field_value
+            if not 0 <= int_value <= max_value:
+                raise ValueError(f'value to be written to {field_name} must be greater than or '
+                                 f'equal to 0 and less than or equal to {max_value:d}')
+            if msb0_width:
+                int_value = swap_msb_lsb_ordering(width=msb0_width, value=int_value)
+
+            reg_value = (reg_value & inverse_bitmask) | (int_value << low)
+
+        return reg_value
+
+    def __encode_fields_individually(self, reg_value: int, values: Mapping[str, Any]) -> int:
+        """
+        Version of _encode_fields for registers without an encoding table, which uses each of
+        the fields in turn
+        """
+        field_names = self.systemrdl_python_child_name_map.values()
+        for field_name, field_value in values.items():
+            if field_name not in field_names:
+                raise ValueError(f'{field_name} is not a member of the register')
+            field = getattr(self, field_name)
+            # pylint: disable-next=protected-access
+            encoded_value = field._encode_write_value(field_value)
+            reg_value = (reg_value & field.inverse_bitmask) | encoded_value
+        return reg_value
+
+    def _field_update_bitmasks(self, values: Mapping[str, Any]) -> tuple[int, int]:
+        """
+        Encode a set of field values into a pair of bitmasks that apply the update to any
+        register value with ``(reg_value & keep_bitmask) | set_bitmask``, this allows the field
+        values to be checked and encoded before the register is read
+
+        Args:
+            values: field values keyed on the python name of the field
+
+        Returns: keep_bitmask, set_bitmask
+        """
+        set_bitmask = self._encode_fields(0, values)
+        keep_bitmask = self._encode_fields(self.max_value, values) ^ set_bitmask
+        return keep_bitmask, set_bitmask
+
     @property
     @abstractmethod
     def width(self) -> int:
@@ -148,6 +214,11 @@ class BaseRegArray(NodeArray[BaseRegArrayElementType], ABC):
     __slots__: list[str] = []
     _iteration_classification = IterationClassification.REGISTER
 
+    # overhead of a single callback, expressed as a number of register entries transferred, this
+    # is used to decide whether the modified entries of an array should be written back in
+    # separate runs or as a single block covering the whole array, see _write_back_ranges
+    _write_back_callback_cost: int = 8
+
     def __init__(self, *,
                  logger_handle: str, inst_name: str,
                  parent: Union[AddressMap, AsyncAddressMap, RegFile, AsyncRegFile, BaseMemory],
@@ -201,3 +272,65 @@ class BaseRegArray(NodeArray[BaseRegArrayElementType], ABC):
     @abstractmethod
     def _is_writeable(self) -> bool:
         ...
+
+    def _cache_address_range(self, address_span: Optional[tuple[int, int]]) -> range:
+        """
+        Addresses of the entries held in the cache of the array, one per register width
+
+        Args:
+            address_span: start and end (exclusive) address to cover, None for the whole array
+
+        Returns: range of addresses
+        """
+        entry_size = self.width >> 3
+        if address_span is None:
+            return range(self.address, self.address + self.size, entry_size)
+        start, stop = address_span
+        if not self.address <= start <= stop <= self.address + self.size:
+            raise ValueError(f'address span 0x{start:X} to 0x{stop:X} is outside the array')
+        if (start - self.address) % entry_size != 0 or (stop - start) % entry_size != 0:
+            raise ValueError(f'address span 0x{start:X} to 0x{stop:X} is not aligned to the '
+                             'register width')
+        return range(start, stop, entry_size)
+
+    def _write_back_ranges(self, dirty_entries: set[int], number_entries: int,
+                           allow_full_block: bool) -> list[range]:
+        """
+        Decide which entries of the cache to write back at the end of a cached access. The
+        modified entries are grouped into runs of consecutive entries, which are written as one
+        block each. When the cost of the separate blocks exceeds a single block covering all the
+        entries (see `_write_back_callback_cost`), a single block is used instead.
+
+        Args:
+            dirty_entries: entries of the cache that have been written
+            number_entries: number of entries in the cache
+            allow_full_block: permit entries that were not written to be written back, this
+                              is only valid if the cache was populated from a read
+
+        Returns: ranges of entries to write
+        """
+        dirty_runs = list(contiguous_index_ranges(dirty_entries))
+        if allow_full_block and len(dirty_runs) > 1:
+            full_block_cost = self._write_back_callback_cost + number_entries
+            dirty_runs_cost = (len(dirty_runs) * self._write_back_callback_cost) + \
+                len(dirty_entries)
+            if full_block_cost <= dirty_runs_cost:
+                return [range(number_entries)]
+        return dirty_runs
+
+    def _defer_block_verify(self, addr: int, data: Iterable[int]) -> bool:
+        """
+        Queue the verification of a block write to the array if it is within a verify scope
+
+        Args:
+            addr: address of the first register written
+            data: values written
+
+        Returns: True if the verification has been deferred
+        """
+        verify_queue = self._write_verify_queue
+        if verify_queue is None:
+            return False
+        verify_queue.defer_block(addr=addr, width=self.width, accesswidth=self.accesswidth,
+                                 data=data, inst_name=self.full_inst_name)
+        return True
@@ -19,10 +19,27 @@ This module is intended to distributed as part of automatically generated code b
 peakrdl-python tool.  It provides a set of types used by the autogenerated code to callbacks
 """
 from array import array as Array
+from concurrent.futures import Executor
+from collections.abc import Iterable, Iterator
+from itertools import islice
+import sys
 
-from typing import Optional, Union
+from typing import Optional, Union, TypeVar, cast
 from typing import Protocol
 
+if sys.version_info >= (3, 12):
+    # this is used by the modules which accept buffers
+    # pylint: disable-next=unused-import
+    from collections.abc import Buffer
+else:
+    # objects supporting the buffer protocol can not be described before python 3.12, these are
+    # the common ones
+    Buffer = Union[bytes, bytearray, memoryview, Array]
+
+# number of single accesses submitted to the executor at a time, this bounds the number of futures
+# held when a large block is accessed
+_EXECUTOR_WINDOW = 1024
+
 
 class ReadCallback(Protocol):
     """
@@ -77,6 +94,27 @@ class WriteBlockLegacyCallback(Protocol):
         pass
 
 
+class ReadBlockIntoCallback(Protocol):
+    """
+    Callback definition for a block read operation that fills a buffer, the buffer is a
+    writable memoryview of bytes with each entry occupying a power of two number of bytes in
+    the native byte order
+    """
+    # pylint: disable=too-few-public-methods
+    def __call__(self, addr: int, width: int, accesswidth: int, buffer: memoryview) -> None:
+        pass
+
+
+class WriteBlockBufferCallback(Protocol):
+    """
+    Callback definition for a block write operation from a buffer, the buffer is a memoryview of
+    bytes with each entry occupying a power of two number of bytes in the native byte order
+    """
+    # pylint: disable=too-few-public-methods
+    def __call__(self, addr: int, width: int, accesswidth: int, data: memoryview) -> None:
+        pass
+
+
 class AsyncReadCallback(Protocol):
     """
     Callback definition for a single register async read operation
@@ -129,20 +167,271 @@ class AsyncWriteBlockLegacyCallback(Protocol):
         pass
 
 
+class AsyncReadBlockIntoCallback(Protocol):
+    """
+    Callback definition for an async block read operation that fills a buffer, see
+    :class:`ReadBlockIntoCallback`
+    """
+    # pylint: disable=too-few-public-methods,unexpected-special-method-signature
+    async def __call__(self, addr: int, width: int, accesswidth: int, buffer: memoryview) -> None:
+        pass
+
+
+class AsyncWriteBlockBufferCallback(Protocol):
+    """
+    Callback definition for an async block write operation from a buffer, see
+    :class:`WriteBlockBufferCallback`
+    """
+    # pylint: disable=too-few-public-methods,unexpected-special-method-signature
+    async def __call__(self, addr: int, width: int, accesswidth: int, data: memoryview) -> None:
+        pass
+
+
+# pylint: disable=invalid-name
+ReadBlockCallbackType = TypeVar('ReadBlockCallbackType',
+                                ReadBlockCallback, ReadBlockLegacyCallback)
+WriteBlockCallbackType = TypeVar('WriteBlockCallbackType',
+                                 WriteBlockCallback, WriteBlockLegacyCallback)
+AsyncReadBlockCallbackType = TypeVar('AsyncReadBlockCallbackType',
+                                     AsyncReadBlockCallback, AsyncReadBlockLegacyCallback)
+AsyncWriteBlockCallbackType = TypeVar('AsyncWriteBlockCallbackType',
+                                      AsyncWriteBlockCallback, AsyncWriteBlockLegacyCallback)
+# pylint: enable=invalid-name
+
+
+def _check_max_block_bytes(max_block_bytes: Optional[int]) -> None:
+    if max_block_bytes is None:
+        return
+    if not isinstance(max_block_bytes, int):
+        raise TypeError(f'max_block_bytes should be an int or None, got {type(max_block_bytes)}')
+    if max_block_bytes < 1:
+        raise ValueError(f'max_block_bytes must be at least 1, got {max_block_bytes:d}')
+
+
+def _entry_bytes(width: int) -> int:
+    """
+    Number of bytes occupied by each entry of a block, this is the width rounded up to a power of
+    two bytes, in the same way as memory entries
+    """
+    return (1 << (width - 1).bit_length()) >> 3
+
+
+def _block_chunks(addr: int, width: int, length: int, max_block_bytes: int) -> \
+        Iterator[tuple[int, int, int]]:
+    """
+    Split a block access into chunks of no more than max_block_bytes (or a single entry if the
+    entries are larger than this)
+
+    Returns: address, index of the first entry and number of entries of each chunk
+    """
+    entry_bytes = _entry_bytes(width)
+    chunk_length = max(1, max_block_bytes // entry_bytes)
+    for start in range(0, length, chunk_length):
+        yield addr + (start * entry_bytes), start, min(chunk_length, length - start)
+
+
+def _chunked_read_block(callback: ReadBlockCallbackType,
+                        max_block_bytes: int) -> ReadBlockCallbackType:
+    """
+    Wrap a block read callback so that each call reads no more than max_block_bytes
+    """
+    def read_block(addr: int, width: int, accesswidth: int, length: int) -> \
+            Union[list[int], Array]:
+        if length * _entry_bytes(width) <= max_block_bytes:
+            return callback(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        data: Union[list[int], Array, None] = None
+        for chunk_addr, _, chunk_length in _block_chunks(addr=addr, width=width, length=length,
+                                                         max_block_bytes=max_block_bytes):
+            chunk = callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                             length=chunk_length)
+            if data is None:
+                # copy the first chunk as the data returned by the callback may be reused by it
+                data = chunk[:]
+            else:
+                data.extend(chunk)  # type: ignore[arg-type]
+        return cast(Union[list[int], Array], data)
+
+    return cast(ReadBlockCallbackType, read_block)
+
+
+def _chunked_write_block(callback: WriteBlockCallbackType,
+                         max_block_bytes: int) -> WriteBlockCallbackType:
+    """
+    Wrap a block write callback so that each call writes no more than max_block_bytes
+    """
+    def write_block(addr: int, width: int, accesswidth: int,
+                    data: Union[list[int], Array]) -> None:
+        if len(data) * _entry_bytes(width) <= max_block_bytes:
+            callback(addr=addr, width=width, accesswidth=accesswidth,
+                     data=data)  # type: ignore[arg-type]
+            return
+        for chunk_addr, start, chunk_length in _block_chunks(addr=addr, width=width,
+                                                             length=len(data),
+                                                             max_block_bytes=max_block_bytes):
+            callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                     data=data[start:start + chunk_length])  # type: ignore[arg-type]
+
+    return cast(WriteBlockCallbackType, write_block)
+
+
+def _chunked_read_block_into(callback: ReadBlockIntoCallback,
+                             max_block_bytes: int) -> ReadBlockIntoCallback:
+    """
+    Wrap a block read into a buffer callback so that each call reads no more than
+    max_block_bytes, each call is given a view of part of the buffer
+    """
+    def read_block_into(addr: int, width: int, accesswidth: int, buffer: memoryview) -> None:
+        entry_bytes = _entry_bytes(width)
+        for chunk_addr, start, chunk_length in _block_chunks(
+                addr=addr, width=width, length=buffer.nbytes // entry_bytes,
+                max_block_bytes=max_block_bytes):
+            callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                     buffer=buffer[start * entry_bytes:(start + chunk_length) * entry_bytes])
+
+    return read_block_into
+
+
+def _chunked_write_block_buffer(callback: WriteBlockBufferCallback,
+                                max_block_bytes: int) -> WriteBlockBufferCallback:
+    """
+    Wrap a block write from a buffer callback so that each call writes no more than
+    max_block_bytes, each call is given a view of part of the buffer
+    """
+    def write_block_buffer(addr: int, width: int, accesswidth: int, data: memoryview) -> None:
+        entry_bytes = _entry_bytes(width)
+        for chunk_addr, start, chunk_length in _block_chunks(
+                addr=addr, width=width, length=data.nbytes // entry_bytes,
+                max_block_bytes=max_block_bytes):
+            callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                     data=data[start * entry_bytes:(start + chunk_length) * entry_bytes])
+
+    return write_block_buffer
+
+
+def _async_chunked_read_block(callback: AsyncReadBlockCallbackType,
+                              max_block_bytes: int) -> AsyncReadBlockCallbackType:
+    """
+    Wrap an async block read callback so that each call reads no more than max_block_bytes
+    """
+    # pylint: disable=duplicate-code
+    async def read_block(addr: int, width: int, accesswidth: int, length: int) -> \
+            Union[list[int], Array]:
+        if length * _entry_bytes(width) <= max_block_bytes:
+            return await callback(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        data: Union[list[int], Array, None] = None
+        for chunk_addr, _, chunk_length in _block_chunks(addr=addr, width=width, length=length,
+                                                         max_block_bytes=max_block_bytes):
+            chunk = await callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                                   length=chunk_length)
+            if data is None:
+                # copy the first chunk as the data returned by the callback may be reused by it
+                data = chunk[:]
+            else:
+                data.extend(chunk)  # type: ignore[arg-type]
+        return cast(Union[list[int], Array], data)
+
+    return cast(AsyncReadBlockCallbackType, read_block)
+
+
+def _async_chunked_write_block(callback: AsyncWriteBlockCallbackType,
+                               max_block_bytes: int) -> AsyncWriteBlockCallbackType:
+    """
+    Wrap an async block write callback so that each call writes no more than max_block_bytes
+    """
+    # pylint: disable=duplicate-code
+    async def write_block(addr: int, width: int, accesswidth: int,
+                          data: Union[list[int], Array]) -> None:
+        if len(data) * _entry_bytes(width) <= max_block_bytes:
+            await callback(addr=addr, width=width, accesswidth=accesswidth,
+                           data=data)  # type: ignore[arg-type]
+            return
+        for chunk_addr, start, chunk_length in _block_chunks(addr=addr, width=width,
+                                                             length=len(data),
+                                                             max_block_bytes=max_block_bytes):
+            await callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                           data=data[start:start + chunk_length])  # type: ignore[arg-type]
+
+    return cast(AsyncWriteBlockCallbackType, write_block)
+
+
+def _async_chunked_read_block_into(callback: AsyncReadBlockIntoCallback,
+                                   max_block_bytes: int) -> AsyncReadBlockIntoCallback:
+    """
+    Wrap an async block read into a buffer callback so that each call reads no more than
+    max_block_bytes, each call is given a view of part of the buffer
+    """
+    # pylint: disable=duplicate-code
+    async def read_block_into(addr: int, width: int, accesswidth: int,
+                              buffer: memoryview) -> None:
+        entry_bytes = _entry_bytes(width)
+        for chunk_addr, start, chunk_length in _block_chunks(
+                addr=addr, width=width, length=buffer.nbytes // entry_bytes,
+                max_block_bytes=max_block_bytes):
+            await callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                           buffer=buffer[start * entry_bytes:(start + chunk_length) * entry_bytes])
+
+    return read_block_into
+
+
+def _async_chunked_write_block_buffer(callback: AsyncWriteBlockBufferCallback,
+                                      max_block_bytes: int) -> AsyncWriteBlockBufferCallback:
+    """
+    Wrap an async block write from a buffer callback so that each call writes no more than
+    max_block_bytes, each call is given a view of part of the buffer
+    """
+    # pylint: disable=duplicate-code
+    async def write_block_buffer(addr: int, width: int, accesswidth: int,
+                                 data: memoryview) -> None:
+        entry_bytes = _entry_bytes(width)
+        for chunk_addr, start, chunk_length in _block_chunks(
+                addr=addr, width=width, length=data.nbytes // entry_bytes,
+                max_block_bytes=max_block_bytes):
+            await callback(addr=chunk_addr, width=width, accesswidth=accesswidth,
+                           data=data[start * entry_bytes:(start + chunk_length) * entry_bytes])
+
+    return write_block_buffer
+
+
 class _NormalCallbackSetBase:
     """
     Class to hold a set of callbacks, this reduces the number of callback that need to be passed
     around
     """
 
-    __slots__ = ['__write_callback', '__read_callback']
+    __slots__ = ['__write_callback', '__read_callback', '__single_access_executor',
+                 '__ordered_writes', '__read_block_into_callback',
+                 '__write_block_buffer_callback', '__max_block_bytes']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[WriteCallback] = None,
-                 read_callback: Optional[ReadCallback] = None):
-
+                 read_callback: Optional[ReadCallback] = None,
+                 *,
+                 single_access_executor: Optional[Executor] = None,
+                 ordered_writes: bool = True,
+                 read_block_into_callback: Optional[ReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[WriteBlockBufferCallback] = None,
+                 max_block_bytes: Optional[int] = None):
+
+        _check_max_block_bytes(max_block_bytes)
+        if max_block_bytes is not None:
+            if read_block_into_callback is not None:
+                read_block_into_callback = _chunked_read_block_into(read_block_into_callback,
+                                                                    max_block_bytes)
+            if write_block_buffer_callback is not None:
+                write_block_buffer_callback = _chunked_write_block_buffer(
+                    write_block_buffer_callback, max_block_bytes)
+        if single_access_executor is not None and \
+                not isinstance(single_access_executor, Executor):
+            raise TypeError('single_access_executor should be a concurrent.futures.Executor, '
+                            f'got {type(single_access_executor)}')
         self.__read_callback = read_callback
         self.__write_callback = write_callback
+        self.__single_access_executor = single_access_executor
+        self.__ordered_writes = ordered_writes
+        self.__read_block_into_callback = read_block_into_callback
+        self.__write_block_buffer_callback = write_block_buffer_callback
+        self.__max_block_bytes = max_block_bytes
 
     @property
     def read_callback(self) -> Optional[ReadCallback]:
@@ -164,6 +453,118 @@ class _NormalCallbackSetBase:
         """
         return self.__write_callback
 
+    @property
+    def single_access_executor(self) -> Optional[Executor]:
+        """
+        executor used to make the single accesses concurrently when a block of registers or
+        memory entries is accessed without a block callback, None if they are made one after
+        another
+        """
+        return self.__single_access_executor
+
+    @property
+    def ordered_writes(self) -> bool:
+        """
+        If True the single writes are always made one after another in address order, even
+        when there is a ``single_access_executor``
+        """
+        return self.__ordered_writes
+
+    @property
+    def max_block_bytes(self) -> Optional[int]:
+        """
+        largest block access (in bytes) made with a single call to one of the block callbacks,
+        larger blocks are split into several calls. None if there is no limit
+        """
+        return self.__max_block_bytes
+
+    @property
+    def read_block_into_callback(self) -> Optional[ReadBlockIntoCallback]:
+        """
+        block read callback function that fills a buffer, used by the buffer based memory
+        accesses
+
+        Returns: call back function
+
+        """
+        return self.__read_block_into_callback
+
+    @property
+    def write_block_buffer_callback(self) -> Optional[WriteBlockBufferCallback]:
+        """
+        block write callback function that takes a buffer, used by the buffer based memory
+        accesses
+
+        Returns: call back function
+
+        """
+        return self.__write_block_buffer_callback
+
+    def read_each(self, addresses: Iterable[int], width: int, accesswidth: int) -> list[int]:
+        """
+        Read a set of addresses with the single read callback, this is used to access a block
+        when there is no read_block_callback. If there is a ``single_access_executor`` the reads
+        are made concurrently.
+
+        Args:
+            addresses: addresses to read
+            width: width of the register in bits
+            accesswidth: minimum access width of the register in bits
+
+        Returns: value read from each address, in the order of the addresses
+        """
+        read_callback = self.read_callback
+        if read_callback is None:
+            raise RuntimeError('There is no read callback')
+
+        def read(address: int) -> int:
+            return read_callback(addr=address, width=width, accesswidth=accesswidth)
+
+        executor = self.single_access_executor
+        addresses = list(addresses)
+        if executor is None or len(addresses) < 2:
+            return [read(address) for address in addresses]
+
+        data: list[int] = []
+        address_iter = iter(addresses)
+        while window := list(islice(address_iter, _EXECUTOR_WINDOW)):
+            # map returns the results in the order of the addresses
+            data.extend(executor.map(read, window))
+        return data
+
+    def write_each(self, addresses: Iterable[int], width: int, accesswidth: int,
+                   data: Iterable[int]) -> None:
+        """
+        Write a set of addresses with the single write callback, this is used to access a block
+        when there is no write_block_callback. If there is a ``single_access_executor`` and
+        ``ordered_writes`` is False the writes are made concurrently.
+
+        Args:
+            addresses: addresses to write
+            width: width of the register in bits
+            accesswidth: minimum access width of the register in bits
+            data: value to write to each address
+        """
+        write_callback = self.write_callback
+        if write_callback is None:
+            raise RuntimeError('There is no write callback')
+
+        def write(address: int, entry_data: int) -> None:
+            write_callback(addr=address, width=width, accesswidth=accesswidth, data=entry_data)
+
+        executor = self.single_access_executor
+        entries = list(zip(addresses, data))
+        if executor is None or self.ordered_writes or len(entries) < 2:
+            for address, entry_data in entries:
+                write(address, entry_data)
+            return
+
+        entry_iter = iter(entries)
+        while window := list(islice(entry_iter, _EXECUTOR_WINDOW)):
+            # consuming the results waits for the writes and raises any exception from them
+            for _ in executor.map(write, *zip(*window)):
+                pass
+
 
 class NormalCallbackSet(_NormalCallbackSetBase):
     """
@@ -173,14 +574,32 @@ class NormalCallbackSet(_NormalCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[WriteCallback] = None,
                  read_callback: Optional[ReadCallback] = None,
                  write_block_callback: Optional[WriteBlockCallback] = None,
-                 read_block_callback: Optional[ReadBlockCallback] = None):
-
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
-
+                 read_block_callback: Optional[ReadBlockCallback] = None,
+                 *,
+                 single_access_executor: Optional[Executor] = None,
+                 ordered_writes: bool = True,
+                 read_block_into_callback: Optional[ReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[WriteBlockBufferCallback] = None,
+                 max_block_bytes: Optional[int] = None):
+
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         single_access_executor=single_access_executor,
+                         ordered_writes=ordered_writes,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_block_bytes=max_block_bytes)
+
+        if max_block_bytes is not None:
+            if read_block_callback is not None:
+                read_block_callback = _chunked_read_block(read_block_callback, max_block_bytes)
+            if write_block_callback is not None:
+                write_block_callback = _chunked_write_block(write_block_callback,
+                                                            max_block_bytes)
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
 
@@ -213,14 +632,32 @@ class NormalCallbackSetLegacy(_NormalCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[WriteCallback] = None,
                  read_callback: Optional[ReadCallback] = None,
                  write_block_callback: Optional[WriteBlockLegacyCallback] = None,
-                 read_block_callback: Optional[ReadBlockLegacyCallback] = None):
-
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
-
+                 read_block_callback: Optional[ReadBlockLegacyCallback] = None,
+                 *,
+                 single_access_executor: Optional[Executor] = None,
+                 ordered_writes: bool = True,
+                 read_block_into_callback: Optional[ReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[WriteBlockBufferCallback] = None,
+                 max_block_bytes: Optional[int] = None):
+
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         single_access_executor=single_access_executor,
+                         ordered_writes=ordered_writes,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_block_bytes=max_block_bytes)
+
+        if max_block_bytes is not None:
+            if read_block_callback is not None:
+                read_block_callback = _chunked_read_block(read_block_callback, max_block_bytes)
+            if write_block_callback is not None:
+                write_block_callback = _chunked_write_block(write_block_callback,
+                                                            max_block_bytes)
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
 
@@ -250,14 +687,30 @@ class _AsyncCallbackSetBase:
     around
     """
 
-    __slots__ = ['__write_callback', '__read_callback']
+    __slots__ = ['__write_callback', '__read_callback', '__read_block_into_callback',
+                 '__write_block_buffer_callback', '__max_block_bytes']
 
     def __init__(self,
                  write_callback: Optional[AsyncWriteCallback] = None,
-                 read_callback: Optional[AsyncReadCallback] = None):
-
+                 read_callback: Optional[AsyncReadCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[AsyncReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[AsyncWriteBlockBufferCallback] = None,
+                 max_block_bytes: Optional[int] = None):
+
+        _check_max_block_bytes(max_block_bytes)
+        if max_block_bytes is not None:
+            if read_block_into_callback is not None:
+                read_block_into_callback = _async_chunked_read_block_into(
+                    read_block_into_callback, max_block_bytes)
+            if write_block_buffer_callback is not None:
+                write_block_buffer_callback = _async_chunked_write_block_buffer(
+                    write_block_buffer_callback, max_block_bytes)
         self.__read_callback = read_callback
         self.__write_callback = write_callback
+        self.__read_block_into_callback = read_block_into_callback
+        self.__write_block_buffer_callback = write_block_buffer_callback
+        self.__max_block_bytes = max_block_bytes
 
     @property
     def read_callback(self) -> Optional[AsyncReadCallback]:
@@ -279,6 +732,36 @@ class _AsyncCallbackSetBase:
         """
         return self.__write_callback
 
+    @property
+    def read_block_into_callback(self) -> Optional[AsyncReadBlockIntoCallback]:
+        """
+        block read callback function that fills a buffer, used by the buffer based memory
+        accesses
+
+        Returns: call back function
+
+        """
+        return self.__read_block_into_callback
+
+    @property
+    def write_block_buffer_callback(self) -> Optional[AsyncWriteBlockBufferCallback]:
+        """
+        block write callback function that takes a buffer, used by the buffer based memory
+        accesses
+
+        Returns: call back function
+
+        """
+        return self.__write_block_buffer_callback
+
+    @property
+    def max_block_bytes(self) -> Optional[int]:
+        """
+        largest block access (in bytes) made with a single call to one of the block callbacks,
+        larger blocks are split into several calls. None if there is no limit
+        """
+        return self.__max_block_bytes
+
 
 class AsyncCallbackSet(_AsyncCallbackSetBase):
     """
@@ -288,14 +771,29 @@ class AsyncCallbackSet(_AsyncCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[AsyncWriteCallback] = None,
                  read_callback: Optional[AsyncReadCallback] = None,
                  write_block_callback: Optional[AsyncWriteBlockCallback] = None,
-                 read_block_callback: Optional[AsyncReadBlockCallback] = None):
-
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
-
+                 read_block_callback: Optional[AsyncReadBlockCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[AsyncReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[AsyncWriteBlockBufferCallback] = None,
+                 max_block_bytes: Optional[int] = None):
+
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_block_bytes=max_block_bytes)
+
+        if max_block_bytes is not None:
+            if read_block_callback is not None:
+                read_block_callback = _async_chunked_read_block(read_block_callback,
+                                                                max_block_bytes)
+            if write_block_callback is not None:
+                write_block_callback = _async_chunked_write_block(write_block_callback,
+                                                                  max_block_bytes)
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
 
@@ -328,13 +826,28 @@ class AsyncCallbackSetLegacy(_AsyncCallbackSetBase):
 
     __slots__ = ['__write_block_callback', '__read_block_callback']
 
+    # pylint: disable-next=too-many-arguments
     def __init__(self,
                  write_callback: Optional[AsyncWriteCallback] = None,
                  read_callback: Optional[AsyncReadCallback] = None,
                  write_block_callback: Optional[AsyncWriteBlockLegacyCallback] = None,
-                 read_block_callback: Optional[AsyncReadBlockLegacyCallback] = None):
-        super().__init__(read_callback=read_callback, write_callback=write_callback)
-
+                 read_block_callback: Optional[AsyncReadBlockLegacyCallback] = None,
+                 *,
+                 read_block_into_callback: Optional[AsyncReadBlockIntoCallback] = None,
+                 write_block_buffer_callback: Optional[AsyncWriteBlockBufferCallback] = None,
+                 max_block_bytes: Optional[int] = None):
+        super().__init__(read_callback=read_callback, write_callback=write_callback,
+                         read_block_into_callback=read_block_into_callback,
+                         write_block_buffer_callback=write_block_buffer_callback,
+                         max_block_bytes=max_block_bytes)
+
+        if max_block_bytes is not None:
+            if read_block_callback is not None:
+                read_block_callback = _async_chunked_read_block(read_block_callback,
+                                                                max_block_bytes)
+            if write_block_callback is not None:
+                write_block_callback = _async_chunked_write_block(write_block_callback,
+                                                                  max_block_bytes)
         self.__read_block_callback = read_block_callback
         self.__write_block_callback = write_block_callback
 
@@ -361,3 +874,33 @@ class AsyncCallbackSetLegacy(_AsyncCallbackSetBase):
 
 CallbackSet = Union[AsyncCallbackSet, NormalCallbackSet]
 CallbackSetLegacy = Union[AsyncCallbackSetLegacy, NormalCallbackSetLegacy]
+
+# pylint: disable-next=invalid-name
+DerivedCallbackSetType = TypeVar('DerivedCallbackSetType',
+                                 bound=Union[NormalCallbackSet, NormalCallbackSetLegacy,
+                                             AsyncCallbackSet, AsyncCallbackSetLegacy])
+
+
+def derived_callback_set(callbacks: DerivedCallbackSetType,
+                         **overrides: object) -> DerivedCallbackSetType:
+    """
+    Build a callback set that wraps another one (for example the callbacks of the shadow cache
+    or a fleet), it is the same type and takes the options (``single_access_executor``,
+    ``ordered_writes`` and ``max_block_bytes``) of the wrapped set
+
+    Args:
+        callbacks: callback set being wrapped
+        overrides: callbacks of the new set, along with any options to be changed, a callback
+                   which is not given is None
+
+    Returns: new callback set
+    """
+    options: dict[str, object] = {'max_block_bytes': callbacks.max_block_bytes}
+    if isinstance(callbacks, _NormalCallbackSetBase):
+        options['single_access_executor'] = callbacks.single_access_executor
+        options['ordered_writes'] = callbacks.ordered_writes
+    options.update(overrides)
+    # the class is used rather than the type so that a mock with the spec of a callback set
+    # produces a real callback set
+    return cast(DerivedCallbackSetType,
+                callbacks.__class__(**options))  # type: ignore[arg-type]
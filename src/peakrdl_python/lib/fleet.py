@@ -0,0 +1,441 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides a fleet, which uses a single instance of the register model to
+access many identical devices (each with its own callback set) concurrently
+"""
+from typing import Union, Optional, TypeVar, Generic, Any
+from collections.abc import Callable, Sequence, Iterable, Awaitable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+import asyncio
+
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
+from .callbacks import derived_callback_set
+from .sections import AddressMap, AsyncAddressMap
+
+# pylint: disable=invalid-name
+FleetModelType = TypeVar('FleetModelType', bound=AddressMap)
+AsyncFleetModelType = TypeVar('AsyncFleetModelType', bound=AsyncAddressMap)
+FleetCallbackSetType = TypeVar('FleetCallbackSetType',
+                               bound=Union[NormalCallbackSet, NormalCallbackSetLegacy,
+                                           AsyncCallbackSet, AsyncCallbackSetLegacy])
+ResultType = TypeVar('ResultType')
+# pylint: enable=invalid-name
+
+# The fleet and the callback set of the device that the current thread (or async task) is
+# accessing. Each thread of the pool and each task of the gather has its own context, so the
+# devices can be accessed concurrently through the same register model
+_active_device: ContextVar[Optional[tuple[Any, Any]]] = \
+    ContextVar('peakrdl_python_fleet_device', default=None)
+
+
+class DeviceResult(Generic[ResultType]):
+    """
+    Outcome of an operation run on one device of a fleet
+    """
+    __slots__: list[str] = ['__device', '__value', '__error']
+
+    def __init__(self, device: int, value: Optional[ResultType] = None,
+                 error: Optional[Exception] = None):
+        self.__device = device
+        self.__value = value
+        self.__error = error
+
+    @property
+    def device(self) -> int:
+        """
+        index of the device in the fleet
+        """
+        return self.__device
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """
+        exception raised by the operation on the device, None if it succeeded
+        """
+        return self.__error
+
+    @property
+    def succeeded(self) -> bool:
+        """
+        True if the operation completed without raising an exception
+        """
+        return self.__error is None
+
+    def result(self) -> Optional[ResultType]:
+        """
+        Value returned by the operation on the device
+
+        Raises:
+            Exception: the exception raised by the operation, if it failed
+        """
+        if self.__error is not None:
+            raise self.__error
+        return self.__value
+
+    def __repr__(self) -> str:
+        if self.__error is not None:
+            return f'DeviceResult(device={self.__device}, error={self.__error!r})'
+        return f'DeviceResult(device={self.__device}, value={self.__value!r})'
+
+
+class _FleetBase(Generic[FleetCallbackSetType]):
+    """
+    Holds the callback sets of the devices in a fleet and selects the one for the device being
+    accessed
+    """
+    __slots__: list[str] = ['__device_callbacks']
+
+    def __init__(self, callbacks: Sequence[FleetCallbackSetType]):
+        if len(callbacks) == 0:
+            raise ValueError('A fleet must have at least one device')
+        callback_set_type = type(callbacks[0])
+        for device_callbacks in callbacks:
+            if not isinstance(device_callbacks, callback_set_type):
+                raise TypeError('The callback sets of all the devices in a fleet must be the same '
+                                f'type, got {type(device_callbacks)} and {callback_set_type}')
+        self.__device_callbacks = tuple(callbacks)
+
+    def __len__(self) -> int:
+        return len(self.__device_callbacks)
+
+    @property
+    def callbacks(self) -> tuple[FleetCallbackSetType, ...]:
+        """
+        callback sets of the devices, in device order
+        """
+        return self.__device_callbacks
+
+    def _has_callback(self, name: str) -> bool:
+        """
+        Check all the devices have a callback, the register model can only be given the callbacks
+        that every device has
+        """
+        return all(getattr(device_callbacks, name) is not None
+                   for device_callbacks in self.__device_callbacks)
+
+    def _dispatch_callback(self, name: str, dispatch: Callable[..., Any]) -> \
+            Optional[Callable[..., Any]]:
+        """
+        callback of the register model that dispatches to the device being accessed, None if
+        any of the devices does not have the callback
+        """
+        return dispatch if self._has_callback(name) else None
+
+    @property
+    def _max_block_bytes(self) -> Optional[int]:
+        """
+        block size limit of the register model, the smallest limit of the devices
+        """
+        limits = [device_callbacks.max_block_bytes for device_callbacks in self.__device_callbacks
+                  if device_callbacks.max_block_bytes is not None]
+        return min(limits) if limits else None
+
+    def _active_callbacks(self) -> FleetCallbackSetType:
+        """
+        callback set of the device being accessed by the current thread or task
+        """
+        active_device = _active_device.get()
+        if active_device is None or active_device[0] is not self:
+            raise RuntimeError('The register model of a fleet can only be accessed from an '
+                               'operation passed to run')
+        return active_device[1]
+
+    def _devices(self, devices: Optional[Iterable[int]]) -> list[int]:
+        if devices is None:
+            return list(range(len(self.__device_callbacks)))
+        devices = list(devices)
+        for device in devices:
+            if not isinstance(device, int):
+                raise TypeError(f'device should be an int, got {type(device)}')
+            if not 0 <= device < len(self.__device_callbacks):
+                raise IndexError(f'device {device} is not in the fleet of '
+                                 f'{len(self.__device_callbacks)} devices')
+        return devices
+
+    def _select(self, device: int) -> Any:
+        """
+        Make a device the one accessed by the current thread or task
+
+        Returns: token to restore the previous device with
+        """
+        return _active_device.set((self, self.__device_callbacks[device]))
+
+
+class _DeviceExecutor(Executor):
+    """
+    Executor of the register model of a fleet, this submits the single accesses to the executor
+    of the device being accessed. The threads of an executor do not inherit the context of the
+    caller, so each access is run in a copy of it to keep the device selected.
+    """
+    __slots__: list[str] = ['__fleet']
+
+    def __init__(self, fleet: _FleetBase[Union[NormalCallbackSet, NormalCallbackSetLegacy]]):
+        self.__fleet = fleet
+
+    def submit(self, fn: Callable[..., ResultType], /, *args: Any,
+               **kwargs: Any) -> Future[ResultType]:
+        # pylint: disable-next=protected-access
+        executor = self.__fleet._active_callbacks().single_access_executor
+        if executor is None:
+            raise RuntimeError('The device being accessed does not have an executor')
+        return executor.submit(copy_context().run, fn, *args, **kwargs)
+
+
+class Fleet(_FleetBase[Union[NormalCallbackSet, NormalCallbackSetLegacy]],
+            Generic[FleetModelType]):
+    """
+    A set of identical devices accessed through a single instance of the register model. An
+    operation (a function which is passed the register model) is run on each device in turn
+    on a pool of threads, so that waiting on the hardware of one device overlaps with the
+    others.
+
+    Note:
+        The operations should only use the register, field and memory accesses (read, write,
+        read_fields, write_fields and so on), these keep no state in the register model.
+        Anything that holds state in the register model between accesses (for example the
+        ``single_read`` and ``single_read_modify_write`` context managers, section write
+        transactions or the shadow cache) is shared by all the devices and must not be used
+        concurrently.
+
+    Args:
+        model_class: class of the top level address map of the register model (for example the
+                     ``RegModel`` of the generated package), this is instantiated once
+        callbacks: callback set of each device, all of the same type
+        max_workers: maximum number of threads to use, defaults to one per device
+    """
+    __slots__: list[str] = ['__model', '__max_workers']
+
+    def __init__(self, model_class: Callable[..., FleetModelType],
+                 callbacks: Sequence[Union[NormalCallbackSet, NormalCallbackSetLegacy]],
+                 max_workers: Optional[int] = None):
+        super().__init__(callbacks=callbacks)
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f'max_workers must be at least 1, got {max_workers}')
+        self.__max_workers = max_workers
+        # the single accesses of the register model are only made concurrently if every device
+        # has an executor, they are then made on the executor of the device being accessed
+        dispatch_callbacks = derived_callback_set(
+            callbacks[0],
+            read_callback=self._dispatch_callback('read_callback', self.__read),
+            write_callback=self._dispatch_callback('write_callback', self.__write),
+            read_block_callback=self._dispatch_callback('read_block_callback',
+                                                        self.__read_block),
+            write_block_callback=self._dispatch_callback('write_block_callback',
+                                                         self.__write_block),
+            read_block_into_callback=self._dispatch_callback('read_block_into_callback',
+                                                             self.__read_block_into),
+            write_block_buffer_callback=self._dispatch_callback('write_block_buffer_callback',
+                                                                self.__write_block_buffer),
+            single_access_executor=_DeviceExecutor(self)
+            if self._has_callback('single_access_executor') else None,
+            ordered_writes=any(device_callbacks.ordered_writes for device_callbacks in callbacks),
+            max_block_bytes=self._max_block_bytes)
+        self.__model = model_class(callbacks=dispatch_callbacks)
+
+    @property
+    def model(self) -> FleetModelType:
+        """
+        The register model shared by the devices, this can only be accessed from within an
+        operation passed to :meth:`run`
+        """
+        return self.__model
+
+    # the callbacks are only offered to the register model if every device has them
+    def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        # pylint: disable-next=not-callable
+        return self._active_callbacks().read_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth)
+
+    def __write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        # pylint: disable-next=not-callable
+        self._active_callbacks().write_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    def __read_block(self, addr: int, width: int, accesswidth: int, length: int) -> Any:
+        # pylint: disable-next=not-callable
+        return self._active_callbacks().read_block_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, length=length)
+
+    def __write_block(self, addr: int, width: int, accesswidth: int, data: Any) -> None:
+        # pylint: disable-next=not-callable
+        self._active_callbacks().write_block_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    def __read_block_into(self, addr: int, width: int, accesswidth: int,
+                          buffer: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        self._active_callbacks().read_block_into_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, buffer=buffer)
+
+    def __write_block_buffer(self, addr: int, width: int, accesswidth: int,
+                             data: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        self._active_callbacks().write_block_buffer_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    def __run_on_device(self, device: int,
+                        operation: Callable[[FleetModelType], ResultType]) -> \
+            DeviceResult[ResultType]:
+        token = self._select(device)
+        try:
+            return DeviceResult(device=device, value=operation(self.__model))
+        # the exception is reported against the device rather than stopping the others
+        # pylint: disable-next=broad-exception-caught
+        except Exception as error:
+            return DeviceResult(device=device, error=error)
+        finally:
+            _active_device.reset(token)
+
+    def run(self, operation: Callable[[FleetModelType], ResultType],
+            devices: Optional[Iterable[int]] = None) -> list[DeviceResult[ResultType]]:
+        """
+        Run an operation on each device concurrently
+
+        Args:
+            operation: function called with the register model, for example
+                       ``lambda dut: dut.block_a.reg_a.read()``
+            devices: indices of the devices to run the operation on, defaults to all of them
+
+        Returns:
+            the result of each device in the order of the devices, an exception raised by the
+            operation on a device is held in its result rather than raised
+        """
+        devices = self._devices(devices)
+        max_workers = len(devices) if self.__max_workers is None else \
+            min(self.__max_workers, len(devices))
+        if max_workers == 0:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix='peakrdl_python_fleet') as executor:
+            return list(executor.map(lambda device: self.__run_on_device(device, operation),
+                                     devices))
+
+
+class AsyncFleet(_FleetBase[Union[AsyncCallbackSet, AsyncCallbackSetLegacy]],
+                 Generic[AsyncFleetModelType]):
+    """
+    A set of identical devices accessed through a single instance of an async register model.
+    An operation (an async function which is passed the register model) is run on all the
+    devices concurrently as gathered tasks.
+
+    Note:
+        The operations should only use the register, field and memory accesses (read, write,
+        read_fields, write_fields and so on), these keep no state in the register model.
+        Anything that holds state in the register model between accesses (for example the
+        ``single_read`` and ``single_read_modify_write`` context managers, section write
+        transactions or the shadow cache) is shared by all the devices and must not be used
+        concurrently.
+
+    Args:
+        model_class: class of the top level address map of the register model (for example the
+                     ``RegModel`` of the generated package), this is instantiated once
+        callbacks: callback set of each device, all of the same type
+    """
+    __slots__: list[str] = ['__model']
+
+    def __init__(self, model_class: Callable[..., AsyncFleetModelType],
+                 callbacks: Sequence[Union[AsyncCallbackSet, AsyncCallbackSetLegacy]]):
+        super().__init__(callbacks=callbacks)
+        dispatch_callbacks = derived_callback_set(
+            callbacks[0],
+            read_callback=self._dispatch_callback('read_callback', self.__read),
+            write_callback=self._dispatch_callback('write_callback', self.__write),
+            read_block_callback=self._dispatch_callback('read_block_callback',
+                                                        self.__read_block),
+            write_block_callback=self._dispatch_callback('write_block_callback',
+                                                         self.__write_block),
+            read_block_into_callback=self._dispatch_callback('read_block_into_callback',
+                                                             self.__read_block_into),
+            write_block_buffer_callback=self._dispatch_callback('write_block_buffer_callback',
+                                                                self.__write_block_buffer),
+            max_block_bytes=self._max_block_bytes)
+        self.__model = model_class(callbacks=dispatch_callbacks)
+
+    @property
+    def model(self) -> AsyncFleetModelType:
+        """
+        The register model shared by the devices, this can only be accessed from within an
+        operation passed to :meth:`run`
+        """
+        return self.__model
+
+    # the callbacks are only offered to the register model if every device has them
+    async def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        # pylint: disable-next=not-callable
+        return await self._active_callbacks().read_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth)
+
+    async def __write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        # pylint: disable-next=not-callable
+        await self._active_callbacks().write_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    async def __read_block(self, addr: int, width: int, accesswidth: int, length: int) -> Any:
+        # pylint: disable-next=not-callable
+        return await self._active_callbacks().read_block_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, length=length)
+
+    async def __write_block(self, addr: int, width: int, accesswidth: int, data: Any) -> None:
+        # pylint: disable-next=not-callable
+        await self._active_callbacks().write_block_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    async def __read_block_into(self, addr: int, width: int, accesswidth: int,
+                                buffer: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        await self._active_callbacks().read_block_into_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, buffer=buffer)
+
+    async def __write_block_buffer(self, addr: int, width: int, accesswidth: int,
+                                   data: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        await self._active_callbacks().write_block_buffer_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    async def __run_on_device(self, device: int,
+                              operation: Callable[[AsyncFleetModelType], Awaitable[ResultType]]
+                              ) -> DeviceResult[ResultType]:
+        # each coroutine passed to gather is run as a task with its own copy of the context, so
+        # selecting the device here does not affect the other tasks
+        self._select(device)
+        try:
+            return DeviceResult(device=device, value=await operation(self.__model))
+        # the exception is reported against the device rather than stopping the others
+        # pylint: disable-next=broad-exception-caught
+        except Exception as error:
+            return DeviceResult(device=device, error=error)
+
+    async def run(self, operation: Callable[[AsyncFleetModelType], Awaitable[ResultType]],
+                  devices: Optional[Iterable[int]] = None) -> list[DeviceResult[ResultType]]:
+        """
+        Run an operation on each device concurrently
+
+        Args:
+            operation: async function called with the register model, for example
+                       ``lambda dut: dut.block_a.reg_a.read()``
+            devices: indices of the devices to run the operation on, defaults to all of them
+
+        Returns:
+            the result of each device in the order of the devices, an exception raised by the
+            operation on a device is held in its result rather than raised
+        """
+        return list(await asyncio.gather(*(self.__run_on_device(device, operation)
+                                           for device in self._devices(devices))))
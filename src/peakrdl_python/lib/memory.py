@@ -20,16 +20,20 @@ peakrdl-python tool. It provides a set of classes used by the autogenerated code
 memories
 """
 from array import array as Array
-from typing import Union, TYPE_CHECKING, Optional
-from collections.abc import Iterator, Iterable
+from typing import Union, TYPE_CHECKING, Optional, Literal, TextIO
+from collections.abc import Iterator, Iterable, Sequence, Mapping
 from abc import ABC
+from struct import calcsize
+from itertools import islice
+import mmap
+import os
 import sys
 
 from .base import Node, NodeArray, IterationClassification
 from .sections import AddressMap, AsyncAddressMap
-from .utility_functions import get_array_typecode
+from .utility_functions import get_array_typecode, contiguous_index_ranges
 
-from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy, Buffer
 
 # same bit of code exists in base so flags as duplicate
 # pylint: disable=duplicate-code
@@ -41,13 +45,23 @@ else:
 # pylint: enable=duplicate-code
 
 
+BufferFormat = Literal['B', 'H', 'I', 'L', 'Q']
+# memoryview formats of the unsigned integer types keyed on their size in bytes, where two types
+# are the same size the later one is used
+_BUFFER_FORMAT_CHARACTERS: tuple[BufferFormat, ...] = ('L', 'I', 'H', 'B', 'Q')
+_BUFFER_FORMATS = {calcsize(buffer_format): buffer_format
+                   for buffer_format in _BUFFER_FORMAT_CHARACTERS}
+
+MemoryFileFormat = Literal['raw', 'hex']
+MemoryFileByteOrder = Literal['little', 'big']
+
 if TYPE_CHECKING:
     from .register_and_field import Reg, RegArray
     from .register_and_field import ReadableRegister, WritableRegister
     from .register_and_field import ReadableRegisterArray, WriteableRegisterArray
     from .async_memory import AsyncMemoryArray
 
-# pylint: disable=duplicate-code
+# pylint: disable=duplicate-code,too-many-lines
 
 
 class BaseMemory(Node, ABC):
@@ -62,6 +76,10 @@ class BaseMemory(Node, ABC):
     __slots__: list[str] = ['__memwidth', '__entries', '__accesswidth']
     _iteration_classification = IterationClassification.MEMORY
 
+    # number of entries transferred by each block access when a memory is streamed (see
+    # iter_read and write_from_iterable) and neither the call nor the callback set gives a size
+    _stream_chunk_entries: int = 4096
+
     # pylint: disable=too-many-arguments
     def __init__(self, *,
                  address: int,
@@ -174,6 +192,322 @@ class BaseMemory(Node, ABC):
 
         return self.address + (entry * self.width_in_bytes)
 
+    def _entry_addresses(self, start_entry: int, number_entries: int) -> range:
+        """
+        addresses of a consecutive set of entries in the memory, used when a block access has to
+        be made with the single entry callbacks
+
+        Args:
+            start_entry: index of the first entry
+            number_entries: number of entries
+
+        Returns: Address of each entry
+
+        """
+        start_address = self.address_lookup(entry=start_entry)
+        return range(start_address, start_address + (number_entries * self.width_in_bytes),
+                     self.width_in_bytes)
+
+    @property
+    def buffer_format(self) -> Optional[BufferFormat]:
+        """
+        The memoryview format of the entries in a buffer used for the buffer based accesses
+        (for example ``read_into``), each entry occupies ``width_in_bytes`` bytes in the native
+        byte order. This is None for memories wider than 64 bit, which are only accessed as bytes
+
+        Returns: format character for the memoryview.cast method
+        """
+        return _BUFFER_FORMATS.get(self.width_in_bytes)
+
+    def _check_block(self, start_entry: int, number_entries: int) -> None:
+        """
+        Check a block of entries fits in the memory
+
+        Args:
+            start_entry: index of the first entry
+            number_entries: number of entries
+        """
+        if not isinstance(start_entry, int):
+            raise TypeError(f'start_entry should be an int got {type(start_entry)}')
+
+        if not isinstance(number_entries, int):
+            raise TypeError(f'number_entries should be an int got {type(number_entries)}')
+
+        if start_entry not in range(0, self.entries):
+            raise ValueError(f'entry must be in range 0 to {self.entries - 1:d} '
+                             f'but got {start_entry:d}')
+
+        if number_entries not in range(0, self.entries - start_entry + 1):
+            raise ValueError(f'number_entries must be in range 0 to'
+                             f' {self.entries - start_entry:d} but got {number_entries:d}')
+
+    def _buffer_view(self, buffer: Buffer, writable: bool) -> memoryview:
+        """
+        View of a buffer as bytes, checking it is suitable to hold a whole number of entries
+
+        Args:
+            buffer: object supporting the buffer protocol, for example a bytearray, array.array
+                    or numpy array
+            writable: check the buffer can be written to
+
+        Returns: view of the buffer as bytes
+        """
+        try:
+            view = memoryview(buffer)
+        except TypeError as exc:
+            raise TypeError(f'buffer must support the buffer protocol, got {type(buffer)}') \
+                from exc
+        if not view.c_contiguous:
+            raise ValueError('buffer must be contiguous')
+        if writable and view.readonly:
+            raise TypeError('buffer must be writable')
+        if view.nbytes % self.width_in_bytes != 0:
+            raise ValueError(f'buffer size ({view.nbytes:d} bytes) must be a multiple of the '
+                             f'entry size ({self.width_in_bytes:d} bytes)')
+        return view.cast('B')
+
+    def _buffer_to_entries(self, buffer: memoryview) -> Union[list[int], Array]:
+        """
+        Decode the entries held in a buffer, this is used when there is no callback that
+        accepts a buffer
+
+        Args:
+            buffer: view of the buffer as bytes
+
+        Returns: entry values
+        """
+        buffer_format = self.buffer_format
+        if buffer_format is not None:
+            return buffer.cast(buffer_format).tolist()
+        return [int.from_bytes(buffer[offset:offset + self.width_in_bytes], sys.byteorder)
+                for offset in range(0, buffer.nbytes, self.width_in_bytes)]
+
+    def _entries_to_buffer(self, data: Sequence[int], buffer: memoryview) -> None:
+        """
+        Encode entry values into a buffer, this is used when there is no callback that fills a
+        buffer
+
+        Args:
+            data: entry values
+            buffer: view of the buffer as bytes
+        """
+        buffer_format = self.buffer_format
+        if buffer_format is not None:
+            buffer.cast(buffer_format)[:] = Array(buffer_format, data)
+            return
+        for entry, value in enumerate(data):
+            offset = entry * self.width_in_bytes
+            buffer[offset:offset + self.width_in_bytes] = \
+                value.to_bytes(self.width_in_bytes, sys.byteorder)
+
+    def _check_buffer_data(self, buffer: memoryview) -> None:
+        """
+        Check the entries in a buffer are in range for the memory, this is only needed if the
+        memory width does not fill the space for each entry
+
+        Args:
+            buffer: view of the buffer as bytes
+        """
+        if self.width == self.width_in_bytes * 8 or buffer.nbytes == 0:
+            return
+        if max(self._buffer_to_entries(buffer)) > self.max_entry_value:
+            raise ValueError('Data out of range for memory must be in the '
+                             f'range 0 to {self.max_entry_value}')
+
+    def _stream_chunk_size(self, chunk_entries: Optional[int]) -> int:
+        """
+        Number of entries to transfer with each block access when the memory is streamed. If
+        this is not given, the ``max_block_bytes`` of the callback set is used so that each chunk
+        is a single burst, otherwise the ``_stream_chunk_entries`` default
+
+        Args:
+            chunk_entries: requested number of entries or None
+
+        Returns: number of entries
+        """
+        if chunk_entries is None:
+            max_block_bytes = self._callbacks.max_block_bytes
+            if max_block_bytes is None:
+                return self._stream_chunk_entries
+            return max(1, max_block_bytes // self.width_in_bytes)
+        if not isinstance(chunk_entries, int):
+            raise TypeError(f'chunk_entries should be an int got {type(chunk_entries)}')
+        if chunk_entries < 1:
+            raise ValueError(f'chunk_entries must be greater than 0 but got {chunk_entries:d}')
+        return chunk_entries
+
+    def _entry_runs(self, indices: Iterable[int], max_gap: int) -> list[range]:
+        """
+        Check a set of entries are in the memory and group them into runs of consecutive
+        entries, each of which can be accessed with a single block access
+
+        Args:
+            indices: entries to access, in any order
+            max_gap: largest number of entries not requested that are included in a run to join
+                     the entries either side of them
+
+        Returns: runs of entries in ascending order
+        """
+        if not isinstance(max_gap, int):
+            raise TypeError(f'max_gap should be an int got {type(max_gap)}')
+        if max_gap < 0:
+            raise ValueError(f'max_gap must be greater than or equal to 0 but got {max_gap:d}')
+        for index in indices:
+            if not isinstance(index, int):
+                raise TypeError(f'entry should be an int got {type(index)}')
+            if index not in range(0, self.entries):
+                raise ValueError(f'entry must be in range 0 to {self.entries - 1:d} '
+                                 f'but got {index:d}')
+        return list(contiguous_index_ranges(indices, max_gap=max_gap))
+
+    def _check_entry_values(self, values: Mapping[int, int]) -> None:
+        """
+        Check the values to be written to a set of entries, so that none of them are written
+        if any are invalid
+
+        Args:
+            values: values keyed on the entry index
+        """
+        for value in values.values():
+            if not isinstance(value, int):
+                raise TypeError(f'data should be an int got {type(value)}')
+            if not 0 <= value <= self.max_entry_value:
+                raise ValueError('Data out of range for memory must be in the '
+                                 f'range 0 to {self.max_entry_value}')
+
+    @staticmethod
+    def _check_file_arguments(file_format: MemoryFileFormat,
+                              byteorder: MemoryFileByteOrder) -> None:
+        """
+        Check the format and byte order of a memory file
+
+        Args:
+            file_format: raw or hex
+            byteorder: little or big, the byte order of each entry in a raw file
+        """
+        if file_format not in ('raw', 'hex'):
+            raise ValueError(f'file_format must be raw or hex but got {file_format}')
+        if byteorder not in ('little', 'big'):
+            raise ValueError(f'byteorder must be little or big but got {byteorder}')
+
+    def _file_number_entries(self, start_entry: int, number_entries: Optional[int]) -> int:
+        """
+        Number of entries to transfer to or from a file, checking they fit in the memory
+
+        Args:
+            start_entry: index of the first entry
+            number_entries: number of entries or None for all the entries from start_entry to the
+                            end of the memory
+
+        Returns: number of entries
+        """
+        if number_entries is None:
+            self._check_block(start_entry=start_entry, number_entries=0)
+            number_entries = self.entries - start_entry
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        return number_entries
+
+    def _raw_file_number_entries(self, file_size: int, start_entry: int,
+                                 number_entries: Optional[int]) -> int:
+        """
+        Number of entries to load from a raw file, checking the file holds them
+
+        Args:
+            file_size: size of the file in bytes
+            start_entry: index of the first entry
+            number_entries: number of entries or None for the whole file
+
+        Returns: number of entries
+        """
+        if number_entries is None:
+            if file_size % self.width_in_bytes != 0:
+                raise ValueError(f'file size ({file_size:d} bytes) is not a whole number of '
+                                 f'{self.width_in_bytes:d} byte entries')
+            number_entries = file_size // self.width_in_bytes
+        elif not isinstance(number_entries, int):
+            raise TypeError(f'number_entries should be an int got {type(number_entries)}')
+        elif number_entries * self.width_in_bytes > file_size:
+            raise ValueError(f'file size ({file_size:d} bytes) is too small for '
+                             f'{number_entries:d} entries')
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        return number_entries
+
+    def _chunk_byte_slices(self, number_entries: int,
+                           chunk_size: int) -> Iterator[tuple[int, slice]]:
+        """
+        Split a block of entries held in a buffer into chunks
+
+        Args:
+            number_entries: number of entries in the block
+            chunk_size: maximum number of entries in each chunk
+
+        Returns: iterator of the offset (in entries) of each chunk and the bytes of the buffer
+                 holding it
+        """
+        for chunk_start in range(0, number_entries, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, number_entries)
+            yield chunk_start, slice(chunk_start * self.width_in_bytes,
+                                     chunk_end * self.width_in_bytes)
+
+    def _swap_entry_bytes(self, buffer: memoryview) -> None:
+        """
+        Reverse the byte order of each entry in a buffer, in place
+
+        Args:
+            buffer: writable view of the buffer as bytes
+        """
+        if self.width_in_bytes == 1:
+            return
+        buffer_format = self.buffer_format
+        if buffer_format is not None:
+            entries = Array(buffer_format)
+            entries.frombytes(buffer)
+            entries.byteswap()
+            buffer[:] = memoryview(entries).cast('B')
+            return
+        for offset in range(0, buffer.nbytes, self.width_in_bytes):
+            buffer[offset:offset + self.width_in_bytes] = \
+                bytes(buffer[offset:offset + self.width_in_bytes])[::-1]
+
+    def _buffer_to_hex(self, buffer: memoryview) -> str:
+        """
+        Convert a buffer of entries to the text of a hex file, one entry per line
+
+        Args:
+            buffer: view of the buffer as bytes, in the native byte order
+
+        Returns: lines of text
+        """
+        big_endian = bytearray(buffer)
+        if sys.byteorder == 'little':
+            self._swap_entry_bytes(memoryview(big_endian))
+        hex_text = big_endian.hex()
+        digits = self.width_in_bytes * 2
+        return ''.join(hex_text[offset:offset + digits] + '\n'
+                       for offset in range(0, len(hex_text), digits))
+
+    @staticmethod
+    def _hex_file_entries(file: TextIO) -> Iterator[int]:
+        """
+        Values in a hex file, these are whitespace separated hexadecimal numbers (as used by the
+        verilog ``$readmemh``), ``//`` starts a comment. Addresses (``@``) are not supported.
+
+        Args:
+            file: file open for reading as text
+
+        Returns: iterator of the values
+        """
+        for line_number, line in enumerate(file, start=1):
+            for word in line.split('//', 1)[0].split():
+                if word.startswith('@'):
+                    raise ValueError(f'line {line_number:d}: addresses are not supported in a '
+                                     'memory file')
+                try:
+                    yield int(word, 16)
+                except ValueError:
+                    raise ValueError(f'line {line_number:d}: {word} is not a hexadecimal '
+                                     'value') from None
+
     @property
     def accesswidth(self) -> int:
         """
@@ -232,14 +566,11 @@ class Memory(BaseMemory, Iterable[Union['Reg', 'RegArray']], ABC):
 
     @property
     def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
-        # pylint: disable=protected-access
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
+            return callbacks
 
-        if isinstance(self.parent._callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
-            return self.parent._callbacks
-
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
     def get_children(self, unroll: bool = False) -> Iterator[Union['Reg', 'RegArray']]:
         """
@@ -334,17 +665,8 @@ class _MemoryReadOnly(Memory, ABC):
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
-            data_read = [0 for _ in range(number_entries)]
-
-            for entry in range(number_entries):
-                entry_address = self.address_lookup(entry=start_entry+entry)
-                data_entry = read_callback(addr=entry_address,
-                                           width=self.width,
-                                           accesswidth=self.width)
-
-                data_read[entry] = data_entry
-
-            return data_read
+            return self._callbacks.read_each(self._entry_addresses(start_entry, number_entries),
+                                             width=self.width, accesswidth=self.width)
 
         raise RuntimeError(f'There is no usable callback, '
                            f'block callback:{read_block_callback}, '
@@ -406,22 +728,185 @@ class _MemoryReadOnly(Memory, ABC):
 
         if read_callback is not None:
             # there is not read_block_callback defined so we must used individual read
-            data_read = Array(self.array_typecode, [0 for _ in range(number_entries)])
-
-            for entry in range(number_entries):
-                entry_address = self.address_lookup(entry=start_entry+entry)
-                data_entry = read_callback(addr=entry_address,
-                                           width=self.width,
-                                           accesswidth=self.width)
-
-                data_read[entry] = data_entry
-
-            return data_read
+            return Array(self.array_typecode,
+                         self._callbacks.read_each(
+                             self._entry_addresses(start_entry, number_entries),
+                             width=self.width, accesswidth=self.width))
 
         raise RuntimeError(f'There is no usable callback, '
                            f'block callback:{read_block_callback}, '
                            f'normal callback:{read_callback}')
 
+    def read_into(self, start_entry: int, buffer: Buffer) -> int:
+        """
+        Read from the memory into a buffer, the number of entries read is set by the size of the
+        buffer. Each entry occupies ``width_in_bytes`` bytes of the buffer in the native byte
+        order, so an array.array or numpy array of the matching unsigned type can be used (see
+        :attr:`buffer_format`).
+
+        If the callback set has a ``read_block_into_callback`` the buffer is passed to it
+        directly, otherwise the entries are read with the other callbacks and copied into the
+        buffer.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            buffer: writable object supporting the buffer protocol
+
+        Returns: number of entries read
+
+        """
+        byte_view = self._buffer_view(buffer, writable=True)
+        number_entries = byte_view.nbytes // self.width_in_bytes
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        if number_entries == 0:
+            return 0
+
+        read_block_into_callback = self._callbacks.read_block_into_callback
+        if read_block_into_callback is not None:
+            read_block_into_callback(addr=self.address_lookup(entry=start_entry),
+                                     width=self.width,
+                                     accesswidth=self.width,
+                                     buffer=byte_view)
+        else:
+            self._entries_to_buffer(self._read(start_entry=start_entry,
+                                               number_entries=number_entries), byte_view)
+        return number_entries
+
+    def read_buffer(self, start_entry: int, number_entries: int) -> memoryview:
+        """
+        Read from the memory into a new buffer, see :meth:`read_into`
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read
+
+        Returns: data read from memory, as a memoryview with the :attr:`buffer_format` (or bytes
+                 for memories wider than 64 bit)
+
+        """
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        buffer = bytearray(number_entries * self.width_in_bytes)
+        self.read_into(start_entry=start_entry, buffer=buffer)
+        buffer_format = self.buffer_format
+        if buffer_format is None:
+            return memoryview(buffer)
+        return memoryview(buffer).cast(buffer_format)
+
+    def iter_read(self, start_entry: int, number_entries: int,
+                  chunk_entries: Optional[int] = None) -> Iterator[list[int]]:
+        """
+        Read a section of the memory as a series of smaller block reads, so that a large memory
+        can be processed without holding all of it. The block reads are only made as the
+        iterator is consumed.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read
+            chunk_entries: maximum number of entries in each block read, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: iterator of the data read from each block
+
+        """
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+
+        def chunks() -> Iterator[list[int]]:
+            for chunk_start in range(start_entry, start_entry + number_entries, chunk_size):
+                yield self._read(start_entry=chunk_start,
+                                 number_entries=min(chunk_size,
+                                                    start_entry + number_entries - chunk_start))
+
+        return chunks()
+
+    def read_entries(self, indices: Iterable[int], max_gap: int = 0) -> list[int]:
+        """
+        Read a set of entries that need not be consecutive. The entries are sorted and grouped
+        into runs of consecutive entries, with one block read for each run.
+
+        Args:
+            indices: index of each entry to read, in any order and with repeats allowed
+            max_gap: largest gap between requested entries that is read as part of a single
+                     run, rather than starting a new run. Use this when a block read costs more
+                     than reading a few extra entries
+
+        Returns: data read from each entry, in the order of indices
+
+        """
+        indices = list(indices)
+        entry_values: dict[int, int] = {}
+        for run in self._entry_runs(indices, max_gap=max_gap):
+            entry_values.update(zip(run, self._read(start_entry=run.start,
+                                                    number_entries=len(run))))
+        return [entry_values[index] for index in indices]
+
+    def __dump_to_hex_file(self, path: Union[str, 'os.PathLike[str]'], start_entry: int,
+                           number_entries: int, chunk_entries: int) -> None:
+        """
+        Read from the memory into a hex file, see :meth:`dump_to_file`
+        """
+        chunk_buffer = memoryview(bytearray(min(chunk_entries, number_entries) *
+                                            self.width_in_bytes))
+        with open(path, 'w', encoding='ascii') as file:
+            for chunk_start, byte_slice in self._chunk_byte_slices(number_entries=number_entries,
+                                                                   chunk_size=chunk_entries):
+                with chunk_buffer[:byte_slice.stop - byte_slice.start] as chunk_view:
+                    self.read_into(start_entry=start_entry + chunk_start, buffer=chunk_view)
+                    file.write(self._buffer_to_hex(chunk_view))
+
+    # pylint: disable-next=too-many-arguments
+    def dump_to_file(self, path: Union[str, 'os.PathLike[str]'], start_entry: int = 0,
+                     number_entries: Optional[int] = None, *,
+                     file_format: MemoryFileFormat = 'raw',
+                     byteorder: MemoryFileByteOrder = 'little',
+                     chunk_entries: Optional[int] = None) -> int:
+        """
+        Read from the memory into a file, a chunk at a time (see :meth:`iter_read`). The file
+        is overwritten.
+
+        A raw file holds each entry in ``width_in_bytes`` bytes with the given byte order. It is
+        memory mapped and each chunk is read into it with :meth:`read_into`, so the data is not
+        converted to python integers if the callback set has a ``read_block_into_callback``.
+
+        A hex file holds one entry per line as hexadecimal text, this can be loaded with the
+        verilog ``$readmemh``.
+
+        Args:
+            path: file to write
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to read, None to read to the end of the memory
+            file_format: raw or hex
+            byteorder: byte order of each entry in a raw file, this is ignored for a hex file
+            chunk_entries: maximum number of entries in each block read, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: number of entries read
+
+        """
+        self._check_file_arguments(file_format=file_format, byteorder=byteorder)
+        number_entries = self._file_number_entries(start_entry=start_entry,
+                                                   number_entries=number_entries)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+
+        if file_format == 'hex':
+            self.__dump_to_hex_file(path=path, start_entry=start_entry,
+                                    number_entries=number_entries, chunk_entries=chunk_size)
+            return number_entries
+
+        with open(path, 'w+b') as file:
+            file.truncate(number_entries * self.width_in_bytes)
+            if number_entries == 0:
+                return 0
+            with mmap.mmap(file.fileno(), number_entries * self.width_in_bytes) as file_map, \
+                    memoryview(file_map) as file_view:
+                for chunk_start, byte_slice in self._chunk_byte_slices(
+                        number_entries=number_entries, chunk_size=chunk_size):
+                    with file_view[byte_slice] as chunk_view:
+                        self.read_into(start_entry=start_entry + chunk_start, buffer=chunk_view)
+                        if byteorder != sys.byteorder:
+                            self._swap_entry_bytes(chunk_view)
+        return number_entries
+
     def get_readable_registers(self, unroll: bool = False) -> \
             Iterator[Union['ReadableRegister', 'ReadableRegisterArray']]:
         """
@@ -555,16 +1040,170 @@ class _MemoryWriteOnly(Memory, ABC):
 
         elif self._callbacks.write_callback is not None:
             # there is not write_block_callback defined so we must used individual write
-            for entry_index, entry_data in enumerate(data):
-                entry_address = self.address_lookup(entry=start_entry+entry_index)
-                self._callbacks.write_callback(addr=entry_address,
-                                               width=self.width,
-                                               accesswidth=self.width,
-                                               data=entry_data)
+            self._callbacks.write_each(self._entry_addresses(start_entry, len(data)),
+                                       width=self.width, accesswidth=self.width, data=data)
 
         else:
             raise RuntimeError('No suitable callback')
 
+    def write_from_buffer(self, start_entry: int, data: Buffer) -> None:
+        """
+        Write data to memory from a buffer, the number of entries written is set by the size of
+        the buffer. Each entry occupies ``width_in_bytes`` bytes of the buffer in the native byte
+        order, so an array.array or numpy array of the matching unsigned type can be used (see
+        :attr:`buffer_format`).
+
+        If the callback set has a ``write_block_buffer_callback`` the buffer is passed to it
+        directly, otherwise the entries are decoded and written with the other callbacks.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            data: object supporting the buffer protocol
+
+        Returns: None
+
+        """
+        byte_view = self._buffer_view(data, writable=False)
+        number_entries = byte_view.nbytes // self.width_in_bytes
+        self._check_block(start_entry=start_entry, number_entries=number_entries)
+        if number_entries == 0:
+            return
+
+        write_block_buffer_callback = self._callbacks.write_block_buffer_callback
+        if write_block_buffer_callback is not None:
+            self._check_buffer_data(byte_view)
+            write_block_buffer_callback(addr=self.address_lookup(entry=start_entry),
+                                        width=self.width,
+                                        accesswidth=self.width,
+                                        data=byte_view)
+        else:
+            self._write(start_entry=start_entry, data=self._buffer_to_entries(byte_view))
+
+    def write_from_iterable(self, start_entry: int, data: Iterable[int],
+                            chunk_entries: Optional[int] = None) -> int:
+        """
+        Write data to memory from an iterable (for example a generator) as a series of smaller
+        block writes, so that a large memory can be written without holding all the data.
+
+        Args:
+            start_entry: index in the memory to start from, this is not the address
+            data: entries to write, these are only consumed as each block is written
+            chunk_entries: maximum number of entries in each block write, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: number of entries written
+
+        Raises:
+            ValueError: if the data does not fit in the memory, the entries that fit will
+                        already have been written
+
+        """
+        self._check_block(start_entry=start_entry, number_entries=0)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+        data_iter = iter(data)
+        entry = start_entry
+        while entry < self.entries:
+            chunk = list(islice(data_iter, min(chunk_size, self.entries - entry)))
+            if not chunk:
+                break
+            self._write(start_entry=entry, data=chunk)
+            entry += len(chunk)
+        if entry == self.entries and list(islice(data_iter, 1)):
+            raise ValueError(f'data does not fit in the memory, {self.entries - start_entry:d} '
+                             'entries were written')
+        return entry - start_entry
+
+    def write_entries(self, values: Mapping[int, int]) -> None:
+        """
+        Write a set of entries that need not be consecutive. The entries are sorted and grouped
+        into runs of consecutive entries, with one block write for each run, in address order.
+
+        Args:
+            values: value to write keyed on the index of the entry
+
+        Returns: None
+
+        """
+        self._check_entry_values(values)
+        for run in self._entry_runs(values, max_gap=0):
+            self._write(start_entry=run.start, data=[values[index] for index in run])
+
+    def __load_from_hex_file(self, path: Union[str, 'os.PathLike[str]'], start_entry: int,
+                             number_entries: Optional[int], chunk_entries: int) -> int:
+        """
+        Write data from a hex file to the memory, see :meth:`load_from_file`
+        """
+        with open(path, encoding='ascii') as file:
+            values = self._hex_file_entries(file)
+            if number_entries is None:
+                return self.write_from_iterable(start_entry=start_entry, data=values,
+                                                chunk_entries=chunk_entries)
+            number_entries = self._file_number_entries(start_entry=start_entry,
+                                                       number_entries=number_entries)
+            written = self.write_from_iterable(start_entry=start_entry,
+                                               data=islice(values, number_entries),
+                                               chunk_entries=chunk_entries)
+        if written != number_entries:
+            raise ValueError(f'file only holds {written:d} of the {number_entries:d} entries')
+        return written
+
+    # pylint: disable-next=too-many-arguments
+    def load_from_file(self, path: Union[str, 'os.PathLike[str]'], start_entry: int = 0,
+                       number_entries: Optional[int] = None, *,
+                       file_format: MemoryFileFormat = 'raw',
+                       byteorder: MemoryFileByteOrder = 'little',
+                       chunk_entries: Optional[int] = None) -> int:
+        """
+        Write data from a file to the memory, a chunk at a time. The file formats are described
+        in :meth:`MemoryReadOnly.dump_to_file`.
+
+        A raw file is memory mapped and each chunk is written from it with
+        :meth:`write_from_buffer`, so the data is not converted to python integers if the
+        callback set has a ``write_block_buffer_callback`` and the file uses the native byte
+        order.
+
+        Args:
+            path: file to read
+            start_entry: index in the memory to start from, this is not the address
+            number_entries: number of entries to write, None to write the whole file
+            file_format: raw or hex
+            byteorder: byte order of each entry in a raw file, this is ignored for a hex file
+            chunk_entries: maximum number of entries in each block write, if this is not set
+                           the ``max_block_bytes`` of the callback set is used
+
+        Returns: number of entries written
+
+        """
+        self._check_file_arguments(file_format=file_format, byteorder=byteorder)
+        chunk_size = self._stream_chunk_size(chunk_entries)
+
+        if file_format == 'hex':
+            return self.__load_from_hex_file(path=path, start_entry=start_entry,
+                                             number_entries=number_entries,
+                                             chunk_entries=chunk_size)
+
+        with open(path, 'rb') as file:
+            number_entries = self._raw_file_number_entries(
+                file_size=os.fstat(file.fileno()).st_size, start_entry=start_entry,
+                number_entries=number_entries)
+            if number_entries == 0:
+                return 0
+            with mmap.mmap(file.fileno(), number_entries * self.width_in_bytes,
+                           access=mmap.ACCESS_READ) as file_map, \
+                    memoryview(file_map) as file_view:
+                for chunk_start, byte_slice in self._chunk_byte_slices(
+                        number_entries=number_entries, chunk_size=chunk_size):
+                    with file_view[byte_slice] as chunk_view:
+                        if byteorder == sys.byteorder:
+                            self.write_from_buffer(start_entry=start_entry + chunk_start,
+                                                   data=chunk_view)
+                        else:
+                            swapped = memoryview(bytearray(chunk_view))
+                            self._swap_entry_bytes(swapped)
+                            self.write_from_buffer(start_entry=start_entry + chunk_start,
+                                                   data=swapped)
+        return number_entries
+
     def get_writable_registers(self, unroll: bool = False) -> \
             Iterator[Union['WritableRegister', 'WriteableRegisterArray']]:
         """
@@ -633,7 +1272,47 @@ class MemoryWriteOnlyLegacy(_MemoryWriteOnly, ABC):
         return self._write(start_entry=start_entry, data=data)
 
 
-class MemoryReadWrite(MemoryReadOnly, MemoryWriteOnly, ABC):
+class _MemoryReadWrite(_MemoryReadOnly, _MemoryWriteOnly, ABC):
+    """
+    base class of memory wrappers which can be read and written
+
+    Note:
+        It is not expected that this class will be instantiated under normal
+        circumstances however, it is useful for type checking
+    """
+
+    __slots__: list[str] = []
+
+    def write_entries(self, values: Mapping[int, int], max_gap: int = 0) -> None:
+        """
+        Write a set of entries that need not be consecutive. The entries are sorted and grouped
+        into runs of consecutive entries, with one block write for each run, in address order.
+
+        Args:
+            values: value to write keyed on the index of the entry
+            max_gap: largest gap between entries that is bridged to make a single run, the
+                     entries in the gap are read first and written back with their current
+                     value, so it must only be used if nothing else changes them
+
+        Returns: None
+
+        """
+        runs = self._entry_runs(values, max_gap=max_gap)
+        self._check_entry_values(values)
+        for run in runs:
+            if any(index not in values for index in run):
+                # the run bridges a gap, so the current value of the gap is needed
+                data = self._read(start_entry=run.start, number_entries=len(run))
+                for offset, index in enumerate(run):
+                    if index in values:
+                        data[offset] = values[index]
+            else:
+                data = [values[index] for index in run]
+            self._write(start_entry=run.start, data=data)
+
+
+# pylint: disable-next=too-many-ancestors
+class MemoryReadWrite(MemoryReadOnly, MemoryWriteOnly, _MemoryReadWrite, ABC):
     """
     base class of memory wrappers
 
@@ -645,7 +1324,9 @@ class MemoryReadWrite(MemoryReadOnly, MemoryWriteOnly, ABC):
     __slots__: list[str] = []
 
 
-class MemoryReadWriteLegacy(MemoryReadOnlyLegacy, MemoryWriteOnlyLegacy, ABC):
+# pylint: disable-next=too-many-ancestors
+class MemoryReadWriteLegacy(MemoryReadOnlyLegacy, MemoryWriteOnlyLegacy, _MemoryReadWrite,
+                            ABC):
     """
     base class of memory wrappers
 
@@ -0,0 +1,1159 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides a set of classes and functions used by the sections (AddressMap
+and RegFile) to access many registers with the minimum number of callback operations
+"""
+from __future__ import annotations
+from typing import Union, TypeVar, Generic, Protocol, Optional, TYPE_CHECKING, Any, cast
+from collections.abc import Iterable, Iterator, Mapping, Awaitable, Callable
+from contextlib import contextmanager
+import asyncio
+from enum import Enum, auto
+from array import array as Array
+from operator import attrgetter
+
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
+from .callbacks import derived_callback_set
+from .utility_functions import get_array_typecode
+from .base import Node, invalidate_bound_callbacks
+
+if TYPE_CHECKING:
+    from .write_verify import _WriteVerifyQueueBase
+    from .register_and_field import ReadableRegister
+    from .async_register_and_field import ReadableAsyncRegister, RegAsyncReadWrite
+
+# pylint: disable=too-many-lines
+
+
+class AddressedEntry(Protocol):
+    """
+    Anything that occupies a register sized piece of the address space, for example a register
+    """
+
+    @property
+    def address(self) -> int:
+        """
+        address of the entry
+        """
+
+    @property
+    def width(self) -> int:
+        """
+        width of the entry in bits
+        """
+
+    @property
+    def accesswidth(self) -> int:
+        """
+        accesswidth of the entry in bits
+        """
+
+
+class SectionEntry(AddressedEntry, Protocol):
+    """
+    A register within a section, which may be readable, writable or both
+    """
+
+    @property
+    def _is_readable(self) -> bool:
+        """
+        whether the register can be read
+        """
+
+    @property
+    def _is_writeable(self) -> bool:
+        """
+        whether the register can be written
+        """
+
+
+# pylint: disable-next=invalid-name
+RunRegisterType = TypeVar('RunRegisterType', bound=AddressedEntry)
+# pylint: disable-next=invalid-name
+SnapshotRegisterType = TypeVar('SnapshotRegisterType',
+                               bound=Union['ReadableRegister', 'ReadableAsyncRegister'])
+# pylint: disable-next=invalid-name
+SectionEntryType = TypeVar('SectionEntryType', bound=SectionEntry)
+# pylint: disable-next=invalid-name
+GatherItemType = TypeVar('GatherItemType')
+# pylint: disable-next=invalid-name
+GatherResultType = TypeVar('GatherResultType')
+
+
+class RegisterRun(Generic[RunRegisterType]):
+    """
+    A set of registers at contiguous addresses with the same width and accesswidth, these can be
+    accessed with a single block operation
+
+    Note:
+        It is not expected that this class will be instantiated by users, the runs are produced
+        by :func:`contiguous_register_runs`
+    """
+    __slots__: list[str] = ['__registers']
+
+    def __init__(self, registers: tuple[RunRegisterType, ...]):
+        if len(registers) == 0:
+            raise ValueError('A register run must contain at least one register')
+        self.__registers = registers
+
+    @property
+    def registers(self) -> tuple[RunRegisterType, ...]:
+        """
+        registers in the run, in address order
+        """
+        return self.__registers
+
+    @property
+    def address(self) -> int:
+        """
+        address of the first register in the run
+        """
+        return self.__registers[0].address
+
+    @property
+    def width(self) -> int:
+        """
+        width of the registers in the run in bits
+        """
+        return self.__registers[0].width
+
+    @property
+    def accesswidth(self) -> int:
+        """
+        accesswidth of the registers in the run in bits
+        """
+        return self.__registers[0].accesswidth
+
+    @property
+    def length(self) -> int:
+        """
+        Number of registers in the run
+        """
+        return len(self.__registers)
+
+    @property
+    def size(self) -> int:
+        """
+        Total Number of bytes of address the run occupies
+        """
+        return self.length * (self.width >> 3)
+
+
+def contiguous_register_runs(registers: Iterable[RunRegisterType],
+                             sort_by_address: bool = True) -> \
+        Iterator[RegisterRun[RunRegisterType]]:
+    """
+    generator that sorts a set of registers by address and groups them into runs of registers
+    which can be accessed with a single block operation
+
+    Args:
+        registers: registers to group
+        sort_by_address: sort the registers by address before grouping them, if this is False
+                         the order of the registers is kept and only consecutive registers at
+                         ascending contiguous addresses are grouped
+
+    Returns:
+        runs of registers
+    """
+    if sort_by_address:
+        registers = sorted(registers, key=attrgetter('address'))
+
+    run: list[RunRegisterType] = []
+    for register in registers:
+        if len(run) > 0:
+            last_register = run[-1]
+            if register.address == last_register.address + (last_register.width >> 3) and \
+                    register.width == last_register.width and \
+                    register.accesswidth == last_register.accesswidth:
+                run.append(register)
+                continue
+            yield RegisterRun(tuple(run))
+        run = [register]
+
+    if len(run) > 0:
+        yield RegisterRun(tuple(run))
+
+
+def readable_register_runs(registers: Iterable[SectionEntryType],
+                           sort_by_address: bool = True) -> list[RegisterRun[SectionEntryType]]:
+    """
+    Group the readable registers of a set into runs, see :func:`contiguous_register_runs`
+
+    Args:
+        registers: registers to group, the registers that can not be read are skipped
+        sort_by_address: sort the registers by address before grouping them
+
+    Returns:
+        runs of readable registers
+    """
+    def is_readable(register: SectionEntryType) -> bool:
+        # pylint: disable-next=protected-access
+        return register._is_readable
+
+    return list(contiguous_register_runs(filter(is_readable, registers),
+                                         sort_by_address=sort_by_address))
+
+
+def _check_block_read_data(data_read: Union[list[int], Array],
+                           run: RegisterRun,
+                           legacy: bool) -> list[int]:
+    """
+    Check the data returned by a read_block_callback and convert it to a list
+    """
+    if legacy:
+        if not isinstance(data_read, Array):
+            raise TypeError('The read block callback is expected to return an array')
+        data_list = data_read.tolist()
+    else:
+        if not isinstance(data_read, list):
+            if isinstance(data_read, Array):
+                raise TypeError('The read block callback is expected to return an list, this '
+                                'is likely to happen if you are using legacy callbacks without '
+                                'NormalCallbackSetLegacy')
+            raise TypeError('The read block callback is expected to return an list')
+        data_list = data_read
+
+    if len(data_list) != run.length:
+        raise ValueError(f'The read block callback returned {len(data_list):d} entries, '
+                         f'expected {run.length:d}')
+
+    return data_list
+
+
+def read_register_run(callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+                      run: RegisterRun) -> list[int]:
+    """
+    Read all the registers in a run, using the read_block_callback if it is available, runs of
+    a single register use the read_callback (if available)
+
+    Args:
+        callbacks: callback set to use for the reads
+        run: registers to read
+
+    Returns:
+        register values in the same order as the run
+    """
+    read_block_callback = callbacks.read_block_callback
+    read_callback = callbacks.read_callback
+
+    if read_callback is not None and (read_block_callback is None or run.length == 1):
+        return callbacks.read_each((register.address for register in run.registers),
+                                   width=run.width, accesswidth=run.accesswidth)
+
+    if read_block_callback is not None:
+        data_read = read_block_callback(addr=run.address,
+                                        width=run.width,
+                                        accesswidth=run.accesswidth,
+                                        length=run.length)
+        return _check_block_read_data(data_read, run,
+                                      legacy=isinstance(callbacks, NormalCallbackSetLegacy))
+
+    raise RuntimeError('There is no usable callback')
+
+
+async def async_read_register_run(callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                                  run: RegisterRun) -> list[int]:
+    """
+    Read all the registers in a run, using the read_block_callback if it is available, runs of
+    a single register use the read_callback (if available)
+
+    Args:
+        callbacks: callback set to use for the reads
+        run: registers to read
+
+    Returns:
+        register values in the same order as the run
+    """
+    read_block_callback = callbacks.read_block_callback
+    read_callback = callbacks.read_callback
+
+    if read_callback is not None and (read_block_callback is None or run.length == 1):
+        return [await read_callback(addr=register.address,
+                                    width=run.width,
+                                    accesswidth=run.accesswidth) for register in run.registers]
+
+    if read_block_callback is not None:
+        data_read = await read_block_callback(addr=run.address,
+                                              width=run.width,
+                                              accesswidth=run.accesswidth,
+                                              length=run.length)
+        return _check_block_read_data(data_read, run,
+                                      legacy=isinstance(callbacks, AsyncCallbackSetLegacy))
+
+    raise RuntimeError('There is no usable callback')
+
+
+def write_register_run(callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+                       run: RegisterRun, data: list[int]) -> None:
+    """
+    Write all the registers in a run, using the write_block_callback if it is available, runs of
+    a single register use the write_callback (if available)
+
+    Args:
+        callbacks: callback set to use for the writes
+        run: registers to write
+        data: register values in the same order as the run
+    """
+    if len(data) != run.length:
+        raise ValueError(f'{len(data):d} values provided for a run of {run.length:d} registers')
+
+    write_callback = callbacks.write_callback
+
+    if write_callback is not None and \
+            (callbacks.write_block_callback is None or run.length == 1):
+        callbacks.write_each((register.address for register in run.registers),
+                             width=run.width, accesswidth=run.accesswidth, data=data)
+    elif isinstance(callbacks, NormalCallbackSetLegacy) and \
+            callbacks.write_block_callback is not None:
+        callbacks.write_block_callback(addr=run.address,
+                                       width=run.width,
+                                       accesswidth=run.accesswidth,
+                                       data=Array(get_array_typecode(run.width), data))
+    elif isinstance(callbacks, NormalCallbackSet) and callbacks.write_block_callback is not None:
+        callbacks.write_block_callback(addr=run.address,
+                                       width=run.width,
+                                       accesswidth=run.accesswidth,
+                                       data=data)
+    else:
+        raise RuntimeError('No suitable callback')
+
+
+async def async_write_register_run(callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                                   run: RegisterRun, data: list[int]) -> None:
+    """
+    Write all the registers in a run, using the write_block_callback if it is available, runs of
+    a single register use the write_callback (if available)
+
+    Args:
+        callbacks: callback set to use for the writes
+        run: registers to write
+        data: register values in the same order as the run
+    """
+    if len(data) != run.length:
+        raise ValueError(f'{len(data):d} values provided for a run of {run.length:d} registers')
+
+    write_callback = callbacks.write_callback
+
+    if write_callback is not None and \
+            (callbacks.write_block_callback is None or run.length == 1):
+        for register, value in zip(run.registers, data):
+            await write_callback(addr=register.address,
+                                 width=run.width,
+                                 accesswidth=run.accesswidth,
+                                 data=value)
+    elif isinstance(callbacks, AsyncCallbackSetLegacy) and \
+            callbacks.write_block_callback is not None:
+        await callbacks.write_block_callback(addr=run.address,
+                                             width=run.width,
+                                             accesswidth=run.accesswidth,
+                                             data=Array(get_array_typecode(run.width), data))
+    elif isinstance(callbacks, AsyncCallbackSet) and callbacks.write_block_callback is not None:
+        await callbacks.write_block_callback(addr=run.address,
+                                             width=run.width,
+                                             accesswidth=run.accesswidth,
+                                             data=data)
+    else:
+        raise RuntimeError('No suitable callback')
+
+
+def _check_max_in_flight(max_in_flight: Optional[int]) -> None:
+    if max_in_flight is None:
+        return
+    if not isinstance(max_in_flight, int):
+        raise TypeError(f'max_in_flight must be an int or None, got {type(max_in_flight)}')
+    if max_in_flight < 1:
+        raise ValueError(f'max_in_flight must be at least 1, got {max_in_flight:d}')
+
+
+async def bounded_gather(function: Callable[[GatherItemType], Awaitable[GatherResultType]],
+                         items: Iterable[GatherItemType],
+                         max_in_flight: Optional[int] = None) -> list[GatherResultType]:
+    """
+    Await ``function`` for each of the items concurrently, with no more than ``max_in_flight``
+    of them outstanding at any time. If one of them raises an exception the others are
+    cancelled and the exception is raised.
+
+    Args:
+        function: async function to call with each item
+        items: items to call the function with
+        max_in_flight: maximum number of calls outstanding at once, ``None`` for no limit and
+                       ``1`` to make the calls one after another in the order of the items
+
+    Returns:
+        results in the same order as the items
+    """
+    _check_max_in_flight(max_in_flight)
+
+    if max_in_flight == 1:
+        return [await function(item) for item in items]
+
+    semaphore = None if max_in_flight is None else asyncio.Semaphore(max_in_flight)
+
+    async def bounded(item: GatherItemType) -> GatherResultType:
+        if semaphore is None:
+            return await function(item)
+        async with semaphore:
+            return await function(item)
+
+    tasks = [asyncio.ensure_future(bounded(item)) for item in items]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def async_read_registers(registers: Iterable[ReadableAsyncRegister],
+                               max_in_flight: Optional[int] = None) -> list[int]:
+    """
+    Read a set of registers, the reads are made concurrently which is useful for a driver that
+    can pipeline its requests
+
+    Args:
+        registers: registers to read, these do not need to be in the same section
+        max_in_flight: maximum number of reads outstanding at once, ``None`` for no limit
+
+    Returns:
+        register values in the same order as the registers
+    """
+    async def read(register: ReadableAsyncRegister) -> int:
+        return await register.read()
+
+    return await bounded_gather(read, registers, max_in_flight)
+
+
+async def async_read_registers_fields(registers: Iterable[ReadableAsyncRegister],
+                                      max_in_flight: Optional[int] = None) -> \
+        list[dict[str, Union[bool, Enum, int]]]:
+    """
+    Read the fields of a set of registers, the reads are made concurrently which is useful for a
+    driver that can pipeline its requests
+
+    Args:
+        registers: registers to read, these do not need to be in the same section
+        max_in_flight: maximum number of reads outstanding at once, ``None`` for no limit
+
+    Returns:
+        field values of each register (see :meth:`read_fields`) in the same order as the
+        registers
+    """
+    async def read_fields(register: ReadableAsyncRegister) -> \
+            dict[str, Union[bool, Enum, int]]:
+        return await register.read_fields()
+
+    return await bounded_gather(read_fields, registers, max_in_flight)
+
+
+def _merge_field_updates(updates: Iterable[tuple[RegAsyncReadWrite, Mapping[str, Any]]]) -> \
+        dict[tuple[Union[AsyncCallbackSet, AsyncCallbackSetLegacy], int],
+             tuple[RegAsyncReadWrite, int, int]]:
+    """
+    Check and encode the field updates for :func:`async_write_registers_fields`, merging the
+    updates to each register into a single pair of keep and set bitmasks. Each register is keyed
+    on its callbacks and address, the first object seen for a register is the one used to access
+    it
+    """
+    merged: dict[tuple[Union[AsyncCallbackSet, AsyncCallbackSetLegacy], int],
+                 tuple[RegAsyncReadWrite, int, int]] = {}
+    for register, values in updates:
+        # pylint: disable-next=protected-access
+        if not (register._is_readable and register._is_writeable):
+            raise TypeError(f'{register.full_inst_name} must be readable and writable')
+        if len(values) == 0:
+            raise ValueError(f'no field values for {register.full_inst_name}')
+        # pylint: disable-next=protected-access
+        keep_bitmask, set_bitmask = register._field_update_bitmasks(values)
+        # pylint: disable-next=protected-access
+        key = (register._callbacks, register.address)
+        if key in merged:
+            register, previous_keep_bitmask, previous_set_bitmask = merged[key]
+            keep_bitmask, set_bitmask = (previous_keep_bitmask & keep_bitmask,
+                                         (previous_set_bitmask & keep_bitmask) | set_bitmask)
+        merged[key] = (register, keep_bitmask, set_bitmask)
+    return merged
+
+
+async def async_write_registers_fields(
+        updates: Iterable[tuple[RegAsyncReadWrite, Mapping[str, Any]]],
+        max_in_flight: Optional[int] = None) -> None:
+    """
+    Read-modify-write the fields of a set of registers. The field values are checked and
+    encoded before any register is accessed, then all the registers are read concurrently and
+    once the reads have completed all the registers are written concurrently. Registers at
+    contiguous addresses are merged into runs that are each read and written with a single
+    block callback (if the callback set has them).
+
+    Each register is read and written once, if a register appears more than once in the updates
+    the field values are applied in the order given. Registers are identified by their callbacks
+    and address, so two objects for the same register (for example the same element of an array
+    that builds its elements on demand, taken before and after it was evicted) are merged.
+
+    Args:
+        updates: pairs of register and the field values to write to it (keyed on the python name
+                 of the field, as for :meth:`write_fields`)
+        max_in_flight: maximum number of reads (or writes) outstanding at once, ``None`` for no
+                       limit
+    """
+    _check_max_in_flight(max_in_flight)
+
+    merged = _merge_field_updates(updates)
+
+    # registers can only be merged into a run if they are accessed through the same callbacks
+    registers_by_callbacks: dict[Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                                 list[RegAsyncReadWrite]] = {}
+    for (callbacks, _), (register, _, _) in merged.items():
+        registers_by_callbacks.setdefault(callbacks, []).append(register)
+    runs = [(callbacks, run) for callbacks, registers in registers_by_callbacks.items()
+            for run in contiguous_register_runs(registers)]
+
+    async def read_run(item: tuple[Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                                   RegisterRun[RegAsyncReadWrite]]) -> list[int]:
+        return await async_read_register_run(*item)
+
+    run_values = await bounded_gather(read_run, runs, max_in_flight)
+
+    async def write_run(item: tuple[Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                                    RegisterRun[RegAsyncReadWrite], list[int]]) -> None:
+        callbacks, run, values = item
+        data = []
+        for register, value in zip(run.registers, values):
+            _, keep_bitmask, set_bitmask = merged[(callbacks, register.address)]
+            data.append((value & keep_bitmask) | set_bitmask)
+        await async_write_register_run(callbacks, run, data)
+
+    await bounded_gather(write_run,
+                         [(callbacks, run, values)
+                          for (callbacks, run), values in zip(runs, run_values)],
+                         max_in_flight)
+
+
+class WriteTransactionOrdering(Enum):
+    """
+    Order in which the registers written during a section write transaction are written to the
+    hardware at the end of the transaction
+    """
+    #: registers are sorted by address and each run of registers at contiguous addresses is
+    #: written with a single block write, in ascending address order
+    ADDRESS = auto()
+    #: registers are written in the order they were first written in the transaction, only
+    #: consecutive writes to ascending contiguous addresses are merged into a block write
+    PROGRAM = auto()
+
+
+# pylint: disable-next=too-few-public-methods
+class _ShadowEntry:
+    """
+    A register value held in the write shadow of a section write transaction, this is also used
+    to describe the registers covered by a block operation (see :func:`block_register_run`)
+    """
+    __slots__: list[str] = ['address', 'width', 'accesswidth', 'data']
+
+    def __init__(self, address: int, width: int, accesswidth: int, data: int = 0):
+        self.address = address
+        self.width = width
+        self.accesswidth = accesswidth
+        self.data = data
+
+
+def block_register_run(addr: int, width: int, accesswidth: int,
+                       length: int) -> RegisterRun[_ShadowEntry]:
+    """
+    Run of registers covering the addresses of a block operation, this allows a block operation
+    made on a callback set to be passed onto another callback set
+
+    Args:
+        addr: address of the first register
+        width: width of the registers in bits
+        accesswidth: accesswidth of the registers in bits
+        length: number of registers
+
+    Returns: run of registers
+    """
+    return RegisterRun(tuple(_ShadowEntry(address=addr + (entry_index * (width >> 3)),
+                                          width=width, accesswidth=accesswidth)
+                             for entry_index in range(length)))
+
+
+# pylint: disable-next=too-few-public-methods
+class _WriteShadowBase:
+    """
+    Holds the register values written during a section write transaction so that they can be
+    written to the hardware at the end of the transaction with the minimum number of callbacks
+    """
+    __slots__: list[str] = ['__entries', '__sort_by_address']
+
+    def __init__(self, ordering: WriteTransactionOrdering):
+        if not isinstance(ordering, WriteTransactionOrdering):
+            raise TypeError(f'ordering should be a WriteTransactionOrdering, got {type(ordering)}')
+        # the entries are keyed on address, the insertion order of the dictionary records the
+        # order of the first write to each address
+        self.__entries: dict[int, _ShadowEntry] = {}
+        self.__sort_by_address = ordering is WriteTransactionOrdering.ADDRESS
+
+    def _shadow_write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        if not isinstance(data, int):
+            raise TypeError(f'Data should be an int byt got {type(data)}')
+        entry = self.__entries.get(addr)
+        if entry is None:
+            self.__entries[addr] = _ShadowEntry(address=addr, width=width,
+                                                accesswidth=accesswidth, data=data)
+        else:
+            entry.width = width
+            entry.accesswidth = accesswidth
+            entry.data = data
+
+    def _shadow_write_block(self, addr: int, width: int, accesswidth: int,
+                            data: Iterable[int]) -> None:
+        for entry_index, entry_data in enumerate(data):
+            self._shadow_write(addr=addr + (entry_index * (width >> 3)), width=width,
+                               accesswidth=accesswidth, data=entry_data)
+
+    def _shadow_value(self, addr: int, width: int) -> Optional[int]:
+        entry = self.__entries.get(addr)
+        if entry is None or entry.width != width:
+            return None
+        return entry.data
+
+    def _shadow_values(self, run: RegisterRun[_ShadowEntry]) -> list[Optional[int]]:
+        return [self._shadow_value(addr=entry.address, width=entry.width)
+                for entry in run.registers]
+
+    @staticmethod
+    def _overlay(shadow_values: list[Optional[int]], data: list[int]) -> list[int]:
+        return [data_value if shadow_value is None else shadow_value
+                for shadow_value, data_value in zip(shadow_values, data)]
+
+    @property
+    def _dirty_runs(self) -> Iterator[tuple[RegisterRun[_ShadowEntry], list[int]]]:
+        """
+        generator that produces the runs of registers to be written to the hardware along with
+        their values
+        """
+        for run in contiguous_register_runs(self.__entries.values(),
+                                            sort_by_address=self.__sort_by_address):
+            yield run, [entry.data for entry in run.registers]
+
+
+class WriteShadow(_WriteShadowBase):
+    """
+    Write shadow used by a section write transaction in the non-async sections
+
+    Note:
+        It is not expected that this class will be instantiated by users, it is used by the
+        ``write_transaction`` context manager of the AddressMap and RegFile
+    """
+    __slots__: list[str] = ['__callbacks', '__shadow_callbacks']
+
+    def __init__(self, callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+                 ordering: WriteTransactionOrdering):
+        super().__init__(ordering=ordering)
+        self.__callbacks = callbacks
+        # the callback set mirrors the type and options of the underlying one, the writes are
+        # always ordered as they are only stored in the shadow (in the order they are made). The
+        # memory buffer accesses fall back to the block callbacks so they go through the shadow
+        legacy = isinstance(callbacks, NormalCallbackSetLegacy)
+        self.__shadow_callbacks = derived_callback_set(
+            callbacks,
+            read_callback=self.__read,
+            write_callback=self._shadow_write,
+            read_block_callback=self.__read_block_legacy if legacy else self.__read_block,
+            write_block_callback=self._shadow_write_block,
+            ordered_writes=True)
+
+    @property
+    def callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        """
+        callbacks that the section uses during the write transaction
+        """
+        return self.__shadow_callbacks
+
+    def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        return self.__read_block(addr=addr, width=width, accesswidth=accesswidth, length=1)[0]
+
+    def __read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        run = block_register_run(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        shadow_values = self._shadow_values(run)
+        if None not in shadow_values:
+            return cast(list[int], shadow_values)
+        return self._overlay(shadow_values, read_register_run(self.__callbacks, run))
+
+    def __read_block_legacy(self, addr: int, width: int, accesswidth: int, length: int) -> Array:
+        return Array(get_array_typecode(width),
+                     self.__read_block(addr=addr, width=width, accesswidth=accesswidth,
+                                       length=length))
+
+    def flush(self) -> None:
+        """
+        Write all the registers written during the write transaction to the hardware
+        """
+        for run, data in self._dirty_runs:
+            write_register_run(self.__callbacks, run, data)
+
+
+class AsyncWriteShadow(_WriteShadowBase):
+    """
+    Write shadow used by a section write transaction in the async sections
+
+    Note:
+        It is not expected that this class will be instantiated by users, it is used by the
+        ``write_transaction`` context manager of the AsyncAddressMap and AsyncRegFile
+    """
+    __slots__: list[str] = ['__callbacks', '__shadow_callbacks']
+
+    def __init__(self, callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                 ordering: WriteTransactionOrdering):
+        super().__init__(ordering=ordering)
+        self.__callbacks = callbacks
+        # the callback set mirrors the type and options of the underlying one, the memory
+        # buffer accesses fall back to the block callbacks so they go through the shadow
+        legacy = isinstance(callbacks, AsyncCallbackSetLegacy)
+        self.__shadow_callbacks = derived_callback_set(
+            callbacks,
+            read_callback=self.__read,
+            write_callback=self.__write,
+            read_block_callback=self.__read_block_legacy if legacy else self.__read_block,
+            write_block_callback=self.__write_block)
+
+    @property
+    def callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        """
+        callbacks that the section uses during the write transaction
+        """
+        return self.__shadow_callbacks
+
+    async def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        return (await self.__read_block(addr=addr, width=width, accesswidth=accesswidth,
+                                        length=1))[0]
+
+    async def __read_block(self, addr: int, width: int, accesswidth: int,
+                           length: int) -> list[int]:
+        run = block_register_run(addr=addr, width=width, accesswidth=accesswidth, length=length)
+        shadow_values = self._shadow_values(run)
+        if None not in shadow_values:
+            return cast(list[int], shadow_values)
+        return self._overlay(shadow_values, await async_read_register_run(self.__callbacks, run))
+
+    async def __read_block_legacy(self, addr: int, width: int, accesswidth: int,
+                                  length: int) -> Array:
+        return Array(get_array_typecode(width),
+                     await self.__read_block(addr=addr, width=width, accesswidth=accesswidth,
+                                             length=length))
+
+    async def __write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        self._shadow_write(addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    async def __write_block(self, addr: int, width: int, accesswidth: int,
+                            data: Iterable[int]) -> None:
+        self._shadow_write_block(addr=addr, width=width, accesswidth=accesswidth, data=data)
+
+    async def flush(self) -> None:
+        """
+        Write all the registers written during the write transaction to the hardware
+        """
+        for run, data in self._dirty_runs:
+            await async_write_register_run(self.__callbacks, run, data)
+
+
+class SectionSnapshot(Mapping[int, int], Generic[SnapshotRegisterType]):
+    """
+    An image of the readable registers in a section, indexed by register address. Only the
+    register values are stored, the field values are decoded when they are requested.
+
+    Note:
+        It is not expected that this class will be instantiated by users, it is returned by the
+        ``snapshot`` method of the AddressMap and RegFile
+    """
+    __slots__: list[str] = ['__values', '__registers']
+
+    def __init__(self, registers: Iterable[SnapshotRegisterType], values: Iterable[int]):
+        registers = tuple(registers)
+        values = tuple(values)
+        if len(registers) != len(values):
+            raise ValueError(f'number of registers ({len(registers):d}) and values '
+                             f'({len(values):d}) do not match')
+        self.__values: dict[int, int] = {}
+        self.__registers: dict[int, SnapshotRegisterType] = {}
+        for register, value in zip(registers, values):
+            # only one readable register can be at each address, otherwise the snapshot would
+            # not be able to tell their values apart
+            if register.address in self.__registers:
+                raise ValueError(f'There is more than one register at address '
+                                 f'0x{register.address:X} in the snapshot')
+            self.__values[register.address] = value
+            self.__registers[register.address] = register
+
+    @classmethod
+    def from_runs(cls, runs: Iterable[RegisterRun[SnapshotRegisterType]],
+                  run_values: Iterable[list[int]]) -> SectionSnapshot[SnapshotRegisterType]:
+        """
+        Build a snapshot from the values read from runs of registers
+
+        Args:
+            runs: runs of registers, see :func:`readable_register_runs`
+            run_values: values read from each of the runs
+
+        Returns: snapshot of the register values
+        """
+        registers: list[SnapshotRegisterType] = []
+        values: list[int] = []
+        for run, run_value in zip(runs, run_values):
+            registers.extend(run.registers)
+            values.extend(run_value)
+        return cls(registers=registers, values=values)
+
+    def __getitem__(self, address: int) -> int:
+        return self.__values[address]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.__values)
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    @property
+    def registers(self) -> Iterator[SnapshotRegisterType]:
+        """
+        generator that produces all the registers in the snapshot, in address order
+        """
+        yield from self.__registers.values()
+
+    def register_at(self, address: int) -> SnapshotRegisterType:
+        """
+        register at an address in the snapshot
+
+        Args:
+            address: address of the register
+
+        Returns: register
+        """
+        if address not in self.__registers:
+            raise KeyError(f'There is no register at address 0x{address:X} in the snapshot')
+        return self.__registers[address]
+
+    def register_value(self, register: SnapshotRegisterType) -> int:
+        """
+        value of a register in the snapshot
+
+        Args:
+            register: register to look up
+
+        Returns: register value
+        """
+        if self.__registers.get(register.address) is not register:
+            raise KeyError(f'{register.full_inst_name} is not in the snapshot')
+        return self.__values[register.address]
+
+    def read_fields(self, register: SnapshotRegisterType) -> dict[str, Union[bool, Enum, int]]:
+        """
+        decode the field values of a register in the snapshot
+
+        Args:
+            register: register to decode
+
+        Returns: dictionary of the field values keyed on the systemRDL name of the field
+        """
+        # pylint: disable-next=protected-access
+        return register._decode_fields(self.register_value(register))
+
+
+class RestorableEntry(SectionEntry, Protocol):
+    """
+    A register that can be restored from a saved value, i.e. a writable register
+    """
+
+    @property
+    def max_value(self) -> int:
+        """
+        maximum value the register can hold
+        """
+
+    @property
+    def _restore_bitmasks(self) -> tuple[int, int]:
+        """
+        bitmask of the fields to be restored and the subset of these that can be read back
+        """
+
+
+# pylint: disable-next=invalid-name
+RestoreRegisterType = TypeVar('RestoreRegisterType', bound=RestorableEntry)
+
+
+def section_image(image: Mapping[int, int], registers: Iterable[AddressedEntry],
+                  address_span: range) -> dict[int, int]:
+    """
+    Extract the entries of a saved image that are within a section, checking that each of these
+    is the address of one of the registers in the section and that the value is in range for
+    the register. This allows an image of a whole address map to be used to restore one of its
+    register files.
+
+    Args:
+        image: register values keyed on address
+        registers: registers in the section
+        address_span: addresses occupied by the section
+
+    Returns: the entries of the image within the section
+    """
+    register_widths = {register.address: register.width for register in registers}
+    entries: dict[int, int] = {}
+    for address, value in image.items():
+        if not isinstance(address, int):
+            raise TypeError(f'image addresses should be int but got {type(address)}')
+        if not isinstance(value, int):
+            raise TypeError(f'image values should be int but got {type(value)}')
+        if address not in address_span:
+            continue
+        width = register_widths.get(address)
+        if width is None:
+            raise ValueError(f'There is no register at address 0x{address:X}')
+        if not 0 <= value < (1 << width):
+            raise ValueError(f'image value 0x{value:X} is out of range for the register at '
+                             f'address 0x{address:X}')
+        entries[address] = value
+    return entries
+
+
+def restorable_registers(registers: Iterable[RestoreRegisterType],
+                         image: Mapping[int, int]) -> list[RestoreRegisterType]:
+    """
+    Registers which are in a saved image and have fields that can be restored, i.e. at least one
+    writable field that is not volatile
+
+    Args:
+        registers: writable registers
+        image: register values keyed on address
+
+    Returns: registers to consider for a restore
+    """
+    def has_restorable_fields(register: RestoreRegisterType) -> bool:
+        # pylint: disable-next=protected-access
+        return register._restore_bitmasks[0] != 0
+
+    return [register for register in registers
+            if register.address in image and has_restorable_fields(register)]
+
+
+def restore_register_values(registers: Iterable[RestoreRegisterType],
+                            image: Mapping[int, int],
+                            current: Mapping[int, int]) -> \
+        tuple[list[RestoreRegisterType], list[int]]:
+    """
+    Determine which registers need to be written to restore a saved image, and the value to
+    write to each of them.
+
+    Only the writable fields that are not volatile are restored. A register is skipped if all of
+    these fields can be read back and match the saved image. When a register is written, the
+    other fields (read only and volatile fields) keep their current value if it is known
+    otherwise the value from the saved image is used.
+
+    Args:
+        registers: registers to restore, see :func:`restorable_registers`
+        image: saved register values keyed on address
+        current: current register values keyed on address, registers that are not included
+                 are always written
+
+    Returns: registers to write and the value for each of them
+    """
+    write_registers: list[RestoreRegisterType] = []
+    write_values: list[int] = []
+    for register in registers:
+        # pylint: disable-next=protected-access
+        restore_bitmask, comparable_bitmask = register._restore_bitmasks
+        saved_value = image[register.address]
+        current_value = current.get(register.address)
+        if current_value is None:
+            write_value = saved_value
+        else:
+            if restore_bitmask == comparable_bitmask and \
+                    ((saved_value ^ current_value) & comparable_bitmask) == 0:
+                continue
+            write_value = (current_value & (register.max_value ^ restore_bitmask)) | \
+                (saved_value & restore_bitmask)
+        write_registers.append(register)
+        write_values.append(write_value)
+
+    return write_registers, write_values
+
+
+class SectionRestore(Generic[RestoreRegisterType]):
+    """
+    The registers to be restored in a section from a saved image, this works out the accesses
+    needed for the ``restore`` method of the AddressMap and RegFile (which makes them):
+
+    1. the runs in :attr:`read_runs` are read to find the current register values, unless
+       these are already known
+    2. the runs produced by :meth:`write_runs` are written
+
+    Note:
+        It is not expected that this class will be instantiated by users
+    """
+    __slots__: list[str] = ['__image', '__registers']
+
+    def __init__(self, registers: Iterable[SectionEntry], image: Mapping[int, int],
+                 address_span: range):
+        """
+        Args:
+            registers: registers in the section
+            image: saved register values keyed on address, entries outside the section are
+                   ignored
+            address_span: addresses occupied by the section
+        """
+        registers = list(registers)
+        self.__image = section_image(image, registers, address_span)
+        # pylint: disable-next=protected-access
+        writable_registers = (register for register in registers if register._is_writeable)
+        self.__registers = restorable_registers(
+            cast(Iterator[RestoreRegisterType], writable_registers), self.__image)
+
+    @property
+    def read_runs(self) -> list[RegisterRun[RestoreRegisterType]]:
+        """
+        runs of the registers to be restored that can be read back, to find their current values
+        """
+        return readable_register_runs(self.__registers)
+
+    @staticmethod
+    def current_values(runs: Iterable[RegisterRun[RestoreRegisterType]],
+                       run_values: Iterable[list[int]]) -> dict[int, int]:
+        """
+        Current register values from the values read from the :attr:`read_runs`
+
+        Args:
+            runs: runs of registers
+            run_values: values read from each of the runs
+
+        Returns: register values keyed on address
+        """
+        current: dict[int, int] = {}
+        for run, run_value in zip(runs, run_values):
+            current.update(zip((register.address for register in run.registers), run_value))
+        return current
+
+    def write_runs(self, current: Mapping[int, int]) -> \
+            tuple[dict[int, int], list[tuple[RegisterRun[RestoreRegisterType], list[int]]]]:
+        """
+        Determine the runs of registers to write, see :func:`restore_register_values`
+
+        Args:
+            current: current register values keyed on address
+
+        Returns: values to be written keyed on address and the runs to write with the data for
+                 each of them
+        """
+        write_registers, write_values = restore_register_values(self.__registers, self.__image,
+                                                                current)
+        written = dict(zip((register.address for register in write_registers), write_values))
+        return written, [(run, [written[register.address] for register in run.registers])
+                         for run in contiguous_register_runs(write_registers)]
+
+
+# pylint: disable-next=invalid-name
+WriteShadowType = TypeVar('WriteShadowType', bound=_WriteShadowBase)
+# pylint: disable-next=invalid-name
+WriteVerifyQueueType = TypeVar('WriteVerifyQueueType', bound='_WriteVerifyQueueBase')
+
+
+class SectionScopes(Generic[WriteShadowType, WriteVerifyQueueType]):
+    """
+    The write transaction and verify scope in progress on a section (AddressMap or RegFile).
+    The context managers of this class only hold the shadow and verify queue in place, the
+    section makes the accesses (flushing the shadow and verifying the queue) after they exit.
+
+    Note:
+        It is not expected that this class will be instantiated by users
+    """
+    __slots__: list[str] = ['__new_verify_queue', '__write_shadow', '__write_verify_queue']
+
+    def __init__(self, new_verify_queue: Callable[[], WriteVerifyQueueType]):
+        """
+        Args:
+            new_verify_queue: makes an empty write verify queue
+        """
+        self.__new_verify_queue = new_verify_queue
+        self.__write_shadow: Optional[WriteShadowType] = None
+        self.__write_verify_queue: Optional[WriteVerifyQueueType] = None
+
+    @property
+    def write_shadow(self) -> Optional[WriteShadowType]:
+        """
+        Write shadow of the write transaction in progress (if there is one)
+        """
+        return self.__write_shadow
+
+    @property
+    def write_verify_queue(self) -> Optional[WriteVerifyQueueType]:
+        """
+        Queue of the verify scope started on the section (if there is one)
+        """
+        return self.__write_verify_queue
+
+    @contextmanager
+    def verify_scope(self, node: Node) -> Iterator[Optional[WriteVerifyQueueType]]:
+        """
+        Context manager that holds a write verify queue in place on a section, unless it is
+        already within a verify scope
+
+        Args:
+            node: section
+
+        Returns: verify queue to be verified afterwards, None if the writes are verified at
+                 the end of the enclosing verify scope
+        """
+        # pylint: disable-next=protected-access
+        if node._write_verify_queue is not None:
+            yield None
+            return
+        verify_queue = self.__new_verify_queue()
+        self.__write_verify_queue = verify_queue
+        # this try/finally is needed to make sure that in the event of an exception
+        # the queue is not left in place
+        try:
+            yield verify_queue
+        finally:
+            self.__write_verify_queue = None
+
+    @contextmanager
+    def write_transaction(self, node: Node, write_shadow: WriteShadowType) -> \
+            Iterator[Optional[WriteVerifyQueueType]]:
+        """
+        Context manager that holds a write shadow (and write verify queue) in place on a section
+
+        Args:
+            node: section
+            write_shadow: shadow for the writes made within the context manager
+
+        Returns: verify queue to be verified after the shadow is flushed, see
+                 :meth:`verify_scope`
+        """
+        if self.__write_shadow is not None:
+            raise RuntimeError('There is already a write transaction in progress on this node')
+
+        with self.verify_scope(node) as verify_queue:
+            self.__write_shadow = write_shadow
+            # the children of the node have bound the callbacks of the node, these need to be
+            # rebound to pick up the shadow callbacks (and to release them again afterwards)
+            invalidate_bound_callbacks(node)
+            # this try/finally is needed to make sure that in the event of an exception
+            # the shadow is not left in place
+            try:
+                yield verify_queue
+            finally:
+                self.__write_shadow = None
+                invalidate_bound_callbacks(node)
@@ -21,12 +21,23 @@ sections e.g. AddressMap and RegFile
 """
 from __future__ import annotations
 import warnings
-from typing import Optional, Union, TYPE_CHECKING,overload, Literal
-from collections.abc import Iterator, Iterable
+from typing import Optional, Union, TYPE_CHECKING,overload, Literal, cast
+from collections.abc import Iterator, Iterable, Generator, AsyncGenerator, Mapping
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, asynccontextmanager
+from heapq import merge
+from operator import attrgetter
 import sys
 
-from .base import Node, NodeArray, IterationClassification
+from .base import Node, NodeArray, IterationClassification, invalidate_bound_callbacks
+from .section_access import AddressedEntry, SectionSnapshot, RegisterRun
+from .section_access import contiguous_register_runs, readable_register_runs
+from .section_access import read_register_run, async_read_register_run, bounded_gather
+from .section_access import write_register_run, async_write_register_run
+from .section_access import SectionRestore, SectionScopes
+from .section_access import WriteTransactionOrdering, WriteShadow, AsyncWriteShadow
+from .shadow_cache import ShadowCache, AsyncShadowCache
+from .write_verify import WriteVerifyQueue, AsyncWriteVerifyQueue
 
 from .callbacks import NormalCallbackSet, AsyncCallbackSet
 from .callbacks import NormalCallbackSetLegacy, AsyncCallbackSetLegacy
@@ -37,7 +48,13 @@ if sys.version_info >= (3, 10):
 else:
     from typing_extensions import TypeGuard
 
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
 if TYPE_CHECKING:
+    from .base_register import BaseReg
     from .memory import Memory, MemoryArray
     from .async_memory import AsyncMemory, AsyncMemoryArray
     from .register_and_field import Reg, RegArray
@@ -47,6 +64,25 @@ if TYPE_CHECKING:
     from .register_and_field import ReadableRegisterArray, WriteableRegisterArray
     from .async_register_and_field import ReadableAsyncRegisterArray, WriteableAsyncRegisterArray
 
+# pylint: disable=too-many-lines
+
+def _array_element_at(array: NodeArray, address: int) -> Optional[Node]:
+    """
+    Element of an array whose stride contains an address (only this element is built), None if
+    the address is outside the array
+    """
+    offset = address - array.address
+    if not 0 <= offset < array.size:
+        return None
+    # the elements are in row-major order
+    position = offset // array.stride
+    indices: list[int] = []
+    for dimension in reversed(array.dimensions):
+        position, index = divmod(position, dimension)
+        indices.insert(0, index)
+    return array[tuple(indices)]
+
+
 class BaseSection(Node, Iterable[Union[Node, NodeArray]], ABC):
     """
     base class of non-async and sync sections (AddressMaps and RegFile)
@@ -74,6 +110,103 @@ class BaseSection(Node, Iterable[Union[Node, NodeArray]], ABC):
         else:
             yield from iter(self)
 
+    def _get_registers_in_section(self) -> Iterator[BaseReg]:
+        """
+        generator that produces all the registers of this node and its child sections, with
+        the arrays unrolled. The registers within memories are not included
+        """
+        for child in self.get_children(unroll=True):
+            # pylint: disable-next=protected-access
+            classification = child._iteration_classification
+            if classification is IterationClassification.REGISTER:
+                yield cast('BaseReg', child)
+            elif classification is IterationClassification.SECTION:
+                # pylint: disable-next=protected-access
+                yield from cast(BaseSection, child)._get_registers_in_section()
+
+    def _uncache_registers(self, registers: Iterable[AddressedEntry]) -> None:
+        """
+        Discard the values of registers held in the shadow cache of the top level address map
+        (if it has one), so that they are read back from the hardware, for example to verify
+        writes
+        """
+        root = self._root
+        if isinstance(root, (AddressMap, AsyncAddressMap)) and root.shadow_cache is not None:
+            root.shadow_cache.invalidate(registers)
+
+    def _shadow_cache_lookup(self, address: int) -> \
+            Union[ReadableRegister, ReadableAsyncRegister, range, None]:
+        """
+        Find what is at an address for the shadow cache, only the nodes that contain the address
+        are built, so that a lazily built register model is not built in full
+
+        Args:
+            address: address to look up
+
+        Returns: the readable register at the address, the span of addresses of the memory that
+                 contains the address (the memory entries are not cached) or None if there is
+                 neither
+        """
+        for child in self.get_children(unroll=False):
+            node: Optional[Node]
+            if isinstance(child, NodeArray):
+                node = _array_element_at(child, address)
+            else:
+                node = child
+            if node is None or not node.address <= address < node.address + node.size:
+                continue
+            # pylint: disable-next=protected-access
+            classification = node._iteration_classification
+            if classification is IterationClassification.MEMORY:
+                return range(node.address, node.address + node.size)
+            if classification is IterationClassification.SECTION:
+                # pylint: disable-next=protected-access
+                found = cast(BaseSection, node)._shadow_cache_lookup(address)
+                if found is not None:
+                    return found
+            # pylint: disable-next=protected-access
+            elif node.address == address and cast('BaseReg', node)._is_readable:
+                return cast(Union['ReadableRegister', 'ReadableAsyncRegister'], node)
+        return None
+
+    def _get_registers_in_address_order(self, include_memories: bool = False) -> \
+            Iterator[BaseReg]:
+        """
+        generator that produces all the registers of this node and its child sections in
+        ascending address order, with the arrays unrolled. The registers of the children are
+        merged as they are produced, so the registers of the whole section are never held at
+        once.
+
+        Args:
+            include_memories: include the registers within memories
+        """
+        return merge(*(self.__registers_of_child(child, include_memories)
+                       for child in self.get_children(unroll=False)),
+                     key=attrgetter('address'))
+
+    @staticmethod
+    def __registers_of_child(child: Union[Node, NodeArray], include_memories: bool) -> \
+            Iterator[BaseReg]:
+        """
+        generator that produces the registers of a child in ascending address order
+        """
+        # the elements of an array are at ascending addresses, the elements of a section or
+        # memory array do not overlap each other so can be visited one after another
+        elements: Iterable[Node] = child if isinstance(child, NodeArray) else (child,)
+        # pylint: disable-next=protected-access
+        classification = child._iteration_classification
+        if classification is IterationClassification.REGISTER:
+            yield from cast(Iterable['BaseReg'], elements)
+        elif classification is IterationClassification.SECTION:
+            for section in cast(Iterable[BaseSection], elements):
+                # pylint: disable-next=protected-access
+                yield from section._get_registers_in_address_order(include_memories)
+        elif classification is IterationClassification.MEMORY and include_memories:
+            for memory in cast(Iterable[Union['Memory', 'AsyncMemory']], elements):
+                yield from merge(*(BaseSection.__registers_of_child(memory_child, False)
+                                   for memory_child in memory.get_children(unroll=False)),
+                                 key=attrgetter('address'))
+
 class Section(BaseSection, ABC):
     """
     base class of non-async sections (AddressMaps and RegFile)
@@ -82,7 +215,21 @@ class Section(BaseSection, ABC):
         It is not expected that this class will be instantiated under normal
         circumstances however, it is useful for type checking
     """
-    __slots__: list[str] = []
+    __slots__: list[str] = ['__scopes']
+
+    def __init__(self, *,
+                 address: int,
+                 logger_handle: str,
+                 inst_name: str,
+                 parent: Optional[Union['AddressMap', 'RegFile']]):
+
+        self.__scopes: SectionScopes[WriteShadow, WriteVerifyQueue] = \
+            SectionScopes(new_verify_queue=WriteVerifyQueue)
+
+        super().__init__(address=address,
+                         logger_handle=logger_handle,
+                         inst_name=inst_name,
+                         parent=parent)
 
     def get_writable_registers(self, unroll:bool=False) -> \
             Iterator[Union[WritableRegister, WriteableRegisterArray]]:
@@ -141,6 +288,177 @@ class Section(BaseSection, ABC):
 
         yield from filter(is_reg, self.get_children(unroll=unroll))
 
+    def get_register_runs(self, include_memories: bool = False) -> Iterator[RegisterRun[Reg]]:
+        """
+        generator that produces the registers in this node and its child sections in ascending
+        address order, grouped into runs of registers at contiguous addresses with the same
+        width and accesswidth. Each run can be accessed with a single block operation.
+
+        The registers are found as the runs are produced, rather than building a list of all the
+        registers and sorting it.
+
+        Args:
+            include_memories: include the registers within memories
+        """
+        return contiguous_register_runs(
+            cast(Iterator['Reg'], self._get_registers_in_address_order(include_memories)),
+            sort_by_address=False)
+
+    def snapshot(self) -> SectionSnapshot[ReadableRegister]:
+        """
+        Read all the readable registers in this node and its child sections (registers within
+        memories are not included) and return an image of the values indexed by address.
+
+        Registers at contiguous addresses are merged into runs that are each read with a single
+        read_block_callback, if the callback set does not have one the registers are read
+        individually.
+
+        Returns: snapshot of the register values, the field values are decoded from this when
+                 requested
+        """
+        callbacks = self._callbacks
+        runs = cast(list[RegisterRun['ReadableRegister']],
+                    readable_register_runs(self._get_registers_in_address_order(),
+                                           sort_by_address=False))
+        return SectionSnapshot.from_runs(runs, (read_register_run(callbacks, run)
+                                                for run in runs))
+
+    def invalidate(self) -> None:
+        """
+        Discard the values held in the shadow cache for the registers in this node and its child
+        sections, so that the next read of each register is made from the hardware. See
+        :meth:`AddressMap.enable_shadow_cache`
+        """
+        self._shadow_cache.invalidate(self._get_registers_in_section())
+
+    def refresh(self) -> None:
+        """
+        Read the registers in this node and its child sections that can be held in the shadow
+        cache and update the cache with their values, registers at contiguous addresses are read
+        with a single block read. See :meth:`AddressMap.enable_shadow_cache`
+        """
+        self._shadow_cache.refresh(self._get_registers_in_section())
+
+    @property
+    def _shadow_cache(self) -> ShadowCache:
+        """
+        Shadow cache of the top level address map
+        """
+        root = self._root
+        if not isinstance(root, AddressMap):
+            raise TypeError(f'The top level node should be an AddressMap, got {type(root)}')
+        shadow_cache = root.shadow_cache
+        if shadow_cache is None:
+            raise RuntimeError('The shadow cache is not enabled, see enable_shadow_cache')
+        return shadow_cache
+
+    def restore(self, image: Mapping[int, int],
+                current: Optional[Mapping[int, int]] = None) -> dict[int, int]:
+        """
+        Restore the registers in this node and its child sections to the values in a saved
+        image (for example a :meth:`snapshot` taken earlier), writing only the registers that
+        differ from their current values.
+
+        Only the writable fields that are not volatile are restored, see
+        :ref:`restoring_sections` for the details of how the registers to write are chosen.
+        The registers to be written are merged into runs at contiguous addresses that are each
+        written with a single write_block_callback (if available).
+
+        Args:
+            image: saved register values keyed on address, entries outside this node are
+                   ignored
+            current: current register values keyed on address (for example from a
+                     :meth:`snapshot`), if this is not provided the registers to be restored
+                     are read first
+
+        Returns: values written keyed on address
+        """
+        section_restore: SectionRestore[WritableRegister] = SectionRestore(
+            self._get_registers_in_section(), image,
+            address_span=range(self.address, self.address + self.size))
+        callbacks = self._callbacks
+
+        if current is None:
+            read_runs = section_restore.read_runs
+            current = section_restore.current_values(
+                read_runs, (read_register_run(callbacks, run) for run in read_runs))
+
+        written, write_runs = section_restore.write_runs(current)
+        for run, data in write_runs:
+            write_register_run(callbacks, run, data)
+
+        return written
+
+    @contextmanager
+    def write_transaction(self,
+                          ordering: WriteTransactionOrdering = WriteTransactionOrdering.ADDRESS) \
+            -> Generator[Self]:
+        """
+        Context manager in which the writes to registers (and memories) within this node and its
+        child sections are held in a shadow rather than written to the hardware. At the end of
+        the context manager the registers that were written are sorted into runs at contiguous
+        addresses and each run is written with a single write_block_callback (if available).
+
+        Within the context manager, reading a register that has been written returns the value
+        held in the shadow, so a sequence of field writes to the same register only reads the
+        hardware once, all other reads go to the hardware. If an exception occurs within the
+        context manager, the writes are discarded.
+
+        The verification of register writes made with ``verify=True`` within the context manager
+        is deferred until after the registers have been written, in the same way as
+        :meth:`verify_scope`.
+
+        Args:
+            ordering: order in which the registers are written at the end of the context manager
+        """
+        write_shadow = WriteShadow(callbacks=self._callbacks, ordering=ordering)
+        with self.__scopes.write_transaction(self, write_shadow) as verify_queue:
+            yield self
+        write_shadow.flush()
+        if verify_queue is not None:
+            self.__verify_writes(verify_queue)
+
+    @contextmanager
+    def verify_scope(self) -> Generator[Self]:
+        """
+        Context manager in which the verification of register writes made with ``verify=True``
+        within this node and its child sections is deferred rather than made straight after each
+        write. At the end of the context manager, the registers written are read back in runs at
+        contiguous addresses (in the same way as a :meth:`snapshot`) and all the registers that
+        do not match are reported in a single :class:`WriteVerifyError`.
+
+        If a register is written more than once, only the last value written is verified. If
+        this node is already within a verify scope (or write transaction), the writes are
+        verified at the end of that instead. If an exception occurs within the context manager,
+        the verification is abandoned.
+        """
+        with self.__scopes.verify_scope(self) as verify_queue:
+            yield self
+        if verify_queue is not None:
+            self.__verify_writes(verify_queue)
+
+    def __verify_writes(self, verify_queue: WriteVerifyQueue) -> None:
+        self._uncache_registers(verify_queue.registers)
+        verify_queue.verify(self._callbacks)
+
+    @property
+    def _write_verify_queue(self) -> Optional[WriteVerifyQueue]:
+        if self.__scopes.write_verify_queue is not None:
+            return self.__scopes.write_verify_queue
+        return cast(Optional[WriteVerifyQueue], super()._write_verify_queue)
+
+    @property
+    def _write_shadow(self) -> Optional[WriteShadow]:
+        """
+        Write shadow of the write transaction in progress on this node (if there is one)
+        """
+        return self.__scopes.write_shadow
+
+    @property
+    @abstractmethod
+    def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        ...
+
 
 class AddressMap(Section, ABC):
     """
@@ -150,7 +468,7 @@ class AddressMap(Section, ABC):
         It is not expected that this class will be instantiated under normal
         circumstances however, it is useful for type checking
     """
-    __slots__: list[str] = ['__callbacks']
+    __slots__: list[str] = ['__callbacks', '__shadow_cache']
 
     def __init__(self, *,
                  callbacks: Optional[Union[NormalCallbackSet, NormalCallbackSetLegacy]],
@@ -174,6 +492,7 @@ class AddressMap(Section, ABC):
                 raise RuntimeError('Callbacks must be None when a parent is set')
             if not isinstance(parent._callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
                 raise TypeError(f'callback type wrong, got {type(callbacks)}')
+        self.__shadow_cache: Optional[ShadowCache] = None
 
         super().__init__(address=address,
                          logger_handle=logger_handle,
@@ -218,16 +537,67 @@ class AddressMap(Section, ABC):
         yield from filter(is_mem, self.get_children(unroll=unroll))
 
 
+    def enable_shadow_cache(self) -> ShadowCache:
+        """
+        Attach a shadow cache to the register model, this can only be done on the top level
+        address map. The cache holds the values of the registers whose readable fields are all
+        non-volatile (so can not be changed by the hardware), after the first read of one of
+        these registers (or a refresh) further reads are served from the cache. Writes made
+        through the register model are passed to the hardware and update the cache. The
+        register at an address is found when the address is first accessed, so enabling the
+        cache does not build the nodes of a lazily built register model.
+
+        Returns: the shadow cache, this provides the statistics of the cache
+        """
+        if self.parent is not None:
+            raise RuntimeError('The shadow cache can only be enabled on the top level address map')
+        if self.__shadow_cache is not None:
+            raise RuntimeError('The shadow cache is already enabled')
+        if self._write_shadow is not None:
+            raise RuntimeError('The shadow cache can not be enabled during a write transaction')
+
+        self.__shadow_cache = ShadowCache(callbacks=self.__callbacks,
+                                          lookup=self._shadow_cache_lookup)
+        # the children of this node have bound the callbacks of this node, these need to be
+        # rebound to pick up the cache callbacks
+        invalidate_bound_callbacks(self)
+        return self.__shadow_cache
+
+    def disable_shadow_cache(self) -> None:
+        """
+        Remove the shadow cache from the register model, all reads are made from the hardware
+        """
+        if self.__shadow_cache is None:
+            raise RuntimeError('The shadow cache is not enabled')
+        if self._write_shadow is not None:
+            raise RuntimeError('The shadow cache can not be disabled during a write transaction')
+        self.__shadow_cache = None
+        invalidate_bound_callbacks(self)
+
+    @property
+    def shadow_cache(self) -> Optional[ShadowCache]:
+        """
+        Shadow cache attached to the register model (if enabled), see
+        :meth:`enable_shadow_cache`
+        """
+        return self.__shadow_cache
+
     @property
     def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
-        # pylint: disable=protected-access
+        write_shadow = self._write_shadow
+        if write_shadow is not None:
+            return write_shadow.callbacks
+
         if self.parent is None:
+            if self.__shadow_cache is not None:
+                return self.__shadow_cache.callbacks
             return self.__callbacks
 
-        if isinstance(self.parent._callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
-            return self.parent._callbacks
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
+            return callbacks
 
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
 
 class AsyncSection(BaseSection, ABC):
@@ -238,7 +608,21 @@ class AsyncSection(BaseSection, ABC):
         It is not expected that this class will be instantiated under normal
         circumstances however, it is useful for type checking
     """
-    __slots__: list[str] = []
+    __slots__: list[str] = ['__scopes']
+
+    def __init__(self, *,
+                 address: int,
+                 logger_handle: str,
+                 inst_name: str,
+                 parent: Optional[Union['AsyncAddressMap', 'AsyncRegFile']]):
+
+        self.__scopes: SectionScopes[AsyncWriteShadow, AsyncWriteVerifyQueue] = \
+            SectionScopes(new_verify_queue=AsyncWriteVerifyQueue)
+
+        super().__init__(address=address,
+                         logger_handle=logger_handle,
+                         inst_name=inst_name,
+                         parent=parent)
 
     def get_writable_registers(self, unroll: bool = False) -> \
             Iterator[Union[WritableAsyncRegister, WriteableAsyncRegisterArray]]:
@@ -297,6 +681,182 @@ class AsyncSection(BaseSection, ABC):
 
         yield from filter(is_reg, self.get_children(unroll=unroll))
 
+    def get_register_runs(self, include_memories: bool = False) -> \
+            Iterator[RegisterRun[AsyncReg]]:
+        """
+        generator that produces the registers in this node and its child sections in ascending
+        address order, grouped into runs of registers at contiguous addresses with the same
+        width and accesswidth. Each run can be accessed with a single block operation.
+
+        The registers are found as the runs are produced, rather than building a list of all the
+        registers and sorting it.
+
+        Args:
+            include_memories: include the registers within memories
+        """
+        return contiguous_register_runs(
+            cast(Iterator['AsyncReg'], self._get_registers_in_address_order(include_memories)),
+            sort_by_address=False)
+
+    async def snapshot(self, max_in_flight: Optional[int] = 1) -> \
+            SectionSnapshot[ReadableAsyncRegister]:
+        """
+        Read all the readable registers in this node and its child sections (registers within
+        memories are not included) and return an image of the values indexed by address.
+
+        Registers at contiguous addresses are merged into runs that are each read with a single
+        read_block_callback, if the callback set does not have one the registers are read
+        individually.
+
+        Args:
+            max_in_flight: maximum number of runs read at once, the default reads the runs one
+                           after another, ``None`` reads all the runs concurrently
+
+        Returns: snapshot of the register values, the field values are decoded from this when
+                 requested
+        """
+        callbacks = self._callbacks
+
+        async def read_run(run: RegisterRun[ReadableAsyncRegister]) -> list[int]:
+            return await async_read_register_run(callbacks, run)
+
+        runs = cast(list[RegisterRun['ReadableAsyncRegister']],
+                    readable_register_runs(self._get_registers_in_address_order(),
+                                           sort_by_address=False))
+        return SectionSnapshot.from_runs(runs, await bounded_gather(read_run, runs,
+                                                                    max_in_flight))
+
+    def invalidate(self) -> None:
+        """
+        Discard the values held in the shadow cache for the registers in this node and its child
+        sections, so that the next read of each register is made from the hardware. See
+        :meth:`AsyncAddressMap.enable_shadow_cache`
+        """
+        self._shadow_cache.invalidate(self._get_registers_in_section())
+
+    async def refresh(self) -> None:
+        """
+        Read the registers in this node and its child sections that can be held in the shadow
+        cache and update the cache with their values, registers at contiguous addresses are read
+        with a single block read. See :meth:`AsyncAddressMap.enable_shadow_cache`
+        """
+        await self._shadow_cache.refresh(self._get_registers_in_section())
+
+    @property
+    def _shadow_cache(self) -> AsyncShadowCache:
+        """
+        Shadow cache of the top level address map
+        """
+        root = self._root
+        if not isinstance(root, AsyncAddressMap):
+            raise TypeError(f'The top level node should be an AsyncAddressMap, got {type(root)}')
+        shadow_cache = root.shadow_cache
+        if shadow_cache is None:
+            raise RuntimeError('The shadow cache is not enabled, see enable_shadow_cache')
+        return shadow_cache
+
+    async def restore(self, image: Mapping[int, int],
+                      current: Optional[Mapping[int, int]] = None) -> dict[int, int]:
+        """
+        Restore the registers in this node and its child sections to the values in a saved
+        image (for example a :meth:`snapshot` taken earlier), writing only the registers that
+        differ from their current values.
+
+        Only the writable fields that are not volatile are restored, see
+        :ref:`restoring_sections` for the details of how the registers to write are chosen.
+        The registers to be written are merged into runs at contiguous addresses that are each
+        written with a single write_block_callback (if available).
+
+        Args:
+            image: saved register values keyed on address, entries outside this node are
+                   ignored
+            current: current register values keyed on address (for example from a
+                     :meth:`snapshot`), if this is not provided the registers to be restored
+                     are read first
+
+        Returns: values written keyed on address
+        """
+        section_restore: SectionRestore[WritableAsyncRegister] = SectionRestore(
+            self._get_registers_in_section(), image,
+            address_span=range(self.address, self.address + self.size))
+        callbacks = self._callbacks
+
+        if current is None:
+            read_runs = section_restore.read_runs
+            current = section_restore.current_values(
+                read_runs, [await async_read_register_run(callbacks, run) for run in read_runs])
+
+        written, write_runs = section_restore.write_runs(current)
+        for run, data in write_runs:
+            await async_write_register_run(callbacks, run, data)
+
+        return written
+
+    @asynccontextmanager
+    async def write_transaction(self,
+                                ordering: WriteTransactionOrdering =
+                                WriteTransactionOrdering.ADDRESS) -> AsyncGenerator[Self]:
+        """
+        Context manager in which the writes to registers (and memories) within this node and its
+        child sections are held in a shadow rather than written to the hardware. At the end of
+        the context manager the registers that were written are sorted into runs at contiguous
+        addresses and each run is written with a single write_block_callback (if available).
+
+        Within the context manager, reading a register that has been written returns the value
+        held in the shadow, so a sequence of field writes to the same register only reads the
+        hardware once, all other reads go to the hardware. If an exception occurs within the
+        context manager, the writes are discarded.
+
+        The verification of register writes made with ``verify=True`` within the context manager
+        is deferred until after the registers have been written, in the same way as
+        :meth:`verify_scope`.
+
+        Args:
+            ordering: order in which the registers are written at the end of the context manager
+        """
+        write_shadow = AsyncWriteShadow(callbacks=self._callbacks, ordering=ordering)
+        with self.__scopes.write_transaction(self, write_shadow) as verify_queue:
+            yield self
+        await write_shadow.flush()
+        if verify_queue is not None:
+            await self.__verify_writes(verify_queue)
+
+    @asynccontextmanager
+    async def verify_scope(self) -> AsyncGenerator[Self]:
+        """
+        Context manager in which the verification of register writes made with ``verify=True``
+        within this node and its child sections is deferred rather than made straight after each
+        write. At the end of the context manager, the registers written are read back in runs at
+        contiguous addresses (in the same way as a :meth:`snapshot`) and all the registers that
+        do not match are reported in a single :class:`WriteVerifyError`.
+
+        If a register is written more than once, only the last value written is verified. If
+        this node is already within a verify scope (or write transaction), the writes are
+        verified at the end of that instead. If an exception occurs within the context manager,
+        the verification is abandoned.
+        """
+        with self.__scopes.verify_scope(self) as verify_queue:
+            yield self
+        if verify_queue is not None:
+            await self.__verify_writes(verify_queue)
+
+    async def __verify_writes(self, verify_queue: AsyncWriteVerifyQueue) -> None:
+        self._uncache_registers(verify_queue.registers)
+        await verify_queue.verify(self._callbacks)
+
+    @property
+    def _write_verify_queue(self) -> Optional[AsyncWriteVerifyQueue]:
+        if self.__scopes.write_verify_queue is not None:
+            return self.__scopes.write_verify_queue
+        return cast(Optional[AsyncWriteVerifyQueue], super()._write_verify_queue)
+
+    @property
+    def _write_shadow(self) -> Optional[AsyncWriteShadow]:
+        """
+        Write shadow of the write transaction in progress on this node (if there is one)
+        """
+        return self.__scopes.write_shadow
+
     @property
     @abstractmethod
     def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
@@ -312,7 +872,7 @@ class AsyncAddressMap(AsyncSection, ABC):
         circumstances however, it is useful for type checking
     """
 
-    __slots__: list[str] = ['__callbacks']
+    __slots__: list[str] = ['__callbacks', '__shadow_cache']
 
     def __init__(self, *,
                  callbacks: Optional[Union[AsyncCallbackSet, AsyncCallbackSetLegacy]],
@@ -336,6 +896,7 @@ class AsyncAddressMap(AsyncSection, ABC):
                 raise RuntimeError('Callbacks must be None when a parent is set')
             if not isinstance(parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
                 raise TypeError(f'callback type wrong, got {type(callbacks)}')
+        self.__shadow_cache: Optional[AsyncShadowCache] = None
 
         super().__init__(address=address,
                          logger_handle=logger_handle,
@@ -381,16 +942,67 @@ class AsyncAddressMap(AsyncSection, ABC):
 
         yield from filter(is_mem, self.get_children(unroll=unroll))
 
+    def enable_shadow_cache(self) -> AsyncShadowCache:
+        """
+        Attach a shadow cache to the register model, this can only be done on the top level
+        address map. The cache holds the values of the registers whose readable fields are all
+        non-volatile (so can not be changed by the hardware), after the first read of one of
+        these registers (or a refresh) further reads are served from the cache. Writes made
+        through the register model are passed to the hardware and update the cache. The
+        register at an address is found when the address is first accessed, so enabling the
+        cache does not build the nodes of a lazily built register model.
+
+        Returns: the shadow cache, this provides the statistics of the cache
+        """
+        if self.parent is not None:
+            raise RuntimeError('The shadow cache can only be enabled on the top level address map')
+        if self.__shadow_cache is not None:
+            raise RuntimeError('The shadow cache is already enabled')
+        if self._write_shadow is not None:
+            raise RuntimeError('The shadow cache can not be enabled during a write transaction')
+
+        self.__shadow_cache = AsyncShadowCache(callbacks=self.__callbacks,
+                                               lookup=self._shadow_cache_lookup)
+        # the children of this node have bound the callbacks of this node, these need to be
+        # rebound to pick up the cache callbacks
+        invalidate_bound_callbacks(self)
+        return self.__shadow_cache
+
+    def disable_shadow_cache(self) -> None:
+        """
+        Remove the shadow cache from the register model, all reads are made from the hardware
+        """
+        if self.__shadow_cache is None:
+            raise RuntimeError('The shadow cache is not enabled')
+        if self._write_shadow is not None:
+            raise RuntimeError('The shadow cache can not be disabled during a write transaction')
+        self.__shadow_cache = None
+        invalidate_bound_callbacks(self)
+
+    @property
+    def shadow_cache(self) -> Optional[AsyncShadowCache]:
+        """
+        Shadow cache attached to the register model (if enabled), see
+        :meth:`enable_shadow_cache`
+        """
+        return self.__shadow_cache
+
     @property
     def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
-        # pylint: disable=protected-access
+        write_shadow = self._write_shadow
+        if write_shadow is not None:
+            return write_shadow.callbacks
+
         if self.parent is None:
+            if self.__shadow_cache is not None:
+                return self.__shadow_cache.callbacks
             return self.__callbacks
 
-        if isinstance(self.parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
-            return self.parent._callbacks
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
+            return callbacks
 
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
 
 
@@ -487,14 +1099,15 @@ class RegFile(Section, ABC):
 
     @property
     def _callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
-        # pylint: disable=protected-access
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
+        write_shadow = self._write_shadow
+        if write_shadow is not None:
+            return write_shadow.callbacks
 
-        if isinstance(self.parent._callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
-            return self.parent._callbacks
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (NormalCallbackSet, NormalCallbackSetLegacy)):
+            return callbacks
 
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
 
 
@@ -541,14 +1154,15 @@ class AsyncRegFile(AsyncSection, ABC):
 
     @property
     def _callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
-        # pylint: disable=protected-access
-        if self.parent is None:
-            raise RuntimeError('Parent must be set')
+        write_shadow = self._write_shadow
+        if write_shadow is not None:
+            return write_shadow.callbacks
 
-        if isinstance(self.parent._callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
-            return self.parent._callbacks
+        callbacks = self._parent_callbacks
+        if isinstance(callbacks, (AsyncCallbackSet, AsyncCallbackSetLegacy)):
+            return callbacks
 
-        raise TypeError(f'unhandled parent callback type: {type(self.parent._callbacks)}')
+        raise TypeError(f'unhandled parent callback type: {type(callbacks)}')
 
 
 class RegFileArray(NodeArray[RegFile], ABC):
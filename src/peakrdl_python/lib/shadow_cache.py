@@ -0,0 +1,470 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides a shadow cache which can be attached to the top level address
+map to serve the reads of registers that are not changed by the hardware from a local copy
+"""
+from typing import Union, Optional, Protocol
+from collections.abc import Callable, Iterable, Iterator
+from array import array as Array
+
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
+from .callbacks import derived_callback_set
+from .utility_functions import get_array_typecode
+from .section_access import AddressedEntry, RegisterRun, contiguous_register_runs
+from .section_access import block_register_run
+from .section_access import read_register_run, async_read_register_run
+from .section_access import write_register_run, async_write_register_run
+
+
+class CacheableEntry(AddressedEntry, Protocol):
+    """
+    A register that may be held in the shadow cache
+    """
+
+    @property
+    def _shadow_cache_bitmasks(self) -> Optional[tuple[int, int]]:
+        """
+        bitmask of the read only fields and the read/write fields, None if the register can not
+        be cached
+        """
+
+
+# Finds what is at an address of the register model, this is the readable register at the
+# address, the span of addresses of a memory (whose entries are not cached) or None
+ShadowCacheLookup = Callable[[int], Union[CacheableEntry, range, None]]
+
+
+class ShadowCacheStatistics:
+    """
+    Counts of the register reads made through a shadow cache, a block read counts as one read of
+    each register in the block
+    """
+    __slots__: list[str] = ['__hits', '__misses', '__uncached']
+
+    def __init__(self) -> None:
+        self.__hits = 0
+        self.__misses = 0
+        self.__uncached = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of register reads served from the cache
+        """
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of reads of cacheable registers which had to be read from the hardware
+        """
+        return self.__misses
+
+    @property
+    def uncached(self) -> int:
+        """
+        Number of reads of registers (or memory entries) that can not be cached
+        """
+        return self.__uncached
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Proportion of the reads of cacheable registers that were served from the cache, this is
+        0.0 if there have been no reads
+        """
+        cacheable_reads = self.__hits + self.__misses
+        if cacheable_reads == 0:
+            return 0.0
+        return self.__hits / cacheable_reads
+
+    def reset(self) -> None:
+        """
+        Set all the counts back to zero
+        """
+        self.__hits = 0
+        self.__misses = 0
+        self.__uncached = 0
+
+    def _record(self, hits: int = 0, misses: int = 0, uncached: int = 0) -> None:
+        self.__hits += hits
+        self.__misses += misses
+        self.__uncached += uncached
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(hits={self.__hits:d}, misses={self.__misses:d}, '
+                f'uncached={self.__uncached:d})')
+
+
+# pylint: disable-next=too-few-public-methods
+class _ShadowCacheEntry:
+    """
+    Description of a register that can be held in the shadow cache
+    """
+    __slots__: list[str] = ['width', 'read_only_bitmask', 'read_write_bitmask']
+
+    def __init__(self, width: int, read_only_bitmask: int, read_write_bitmask: int):
+        self.width = width
+        self.read_only_bitmask = read_only_bitmask
+        self.read_write_bitmask = read_write_bitmask
+
+
+class _ShadowCacheBase:
+    """
+    Holds the values of the registers whose readable fields are not volatile (i.e. can not be
+    changed by the hardware). The value is held from the first time the register is read and
+    is updated by the writes made through the cache.
+
+    The register at an address is looked up the first time the address is accessed, so that
+    enabling the cache does not build all the nodes of a lazily built register model.
+    """
+    __slots__: list[str] = ['__lookup', '__entries', '__uncached_spans', '__values',
+                            '__statistics']
+
+    def __init__(self, lookup: ShadowCacheLookup):
+        self.__lookup = lookup
+        # description of the register at each address that has been looked up, None if there
+        # is no register that can be cached at the address
+        self.__entries: dict[int, Optional[_ShadowCacheEntry]] = {}
+        # addresses of the memories found by the lookups, these are never cached
+        self.__uncached_spans: list[range] = []
+        self.__values: dict[int, int] = {}
+        self.__statistics = ShadowCacheStatistics()
+
+    @property
+    def statistics(self) -> ShadowCacheStatistics:
+        """
+        Counts of the reads made through the cache
+        """
+        return self.__statistics
+
+    def is_cached(self, register: AddressedEntry) -> bool:
+        """
+        Check if the cache currently holds the value of a register
+
+        Args:
+            register: register to check
+        """
+        return self.__is_cacheable(register.address, register.width) and \
+            register.address in self.__values
+
+    def invalidate(self, registers: Optional[Iterable[AddressedEntry]] = None) -> None:
+        """
+        Discard values held in the cache, so that the next read of the register is made from
+        the hardware
+
+        Args:
+            registers: registers to discard, all the values are discarded if this is None
+        """
+        if registers is None:
+            self.__values.clear()
+            return
+        for register in registers:
+            self.__values.pop(register.address, None)
+
+    def __entry(self, addr: int) -> Optional[_ShadowCacheEntry]:
+        if addr in self.__entries:
+            return self.__entries[addr]
+        if any(addr in span for span in self.__uncached_spans):
+            return None
+        found = self.__lookup(addr)
+        if isinstance(found, range):
+            self.__uncached_spans.append(found)
+            return None
+        entry = None
+        if found is not None:
+            # pylint: disable-next=protected-access
+            bitmasks = found._shadow_cache_bitmasks
+            if bitmasks is not None:
+                entry = _ShadowCacheEntry(found.width, *bitmasks)
+        self.__entries[addr] = entry
+        return entry
+
+    def __is_cacheable(self, addr: int, width: int) -> bool:
+        entry = self.__entry(addr)
+        return entry is not None and entry.width == width
+
+    @staticmethod
+    def __addresses(addr: int, width: int, length: int) -> range:
+        return range(addr, addr + (length * (width >> 3)), width >> 3)
+
+    def _cached_values(self, addr: int, width: int, length: int) -> Optional[list[int]]:
+        """
+        Values of a block of registers if they are all held in the cache, otherwise None
+        """
+        addresses = self.__addresses(addr, width, length)
+        if not all(self.__is_cacheable(address, width) and address in self.__values
+                   for address in addresses):
+            return None
+        self.__statistics._record(hits=length)  # pylint: disable=protected-access
+        return [self.__values[address] for address in addresses]
+
+    def _record_read(self, addr: int, width: int, data: list[int]) -> None:
+        """
+        Store the values of the cacheable registers in a block read from the hardware
+        """
+        misses = 0
+        for address, value in zip(self.__addresses(addr, width, len(data)), data):
+            if self.__is_cacheable(address, width):
+                self.__values[address] = value
+                misses += 1
+        # pylint: disable-next=protected-access
+        self.__statistics._record(misses=misses, uncached=len(data) - misses)
+
+    def _record_write(self, addr: int, width: int, data: list[int]) -> None:
+        """
+        Update the cache with a block of values written to the hardware, the read/write fields
+        take the written value and the read only fields keep their cached value. If the register
+        has read only fields and is not already in the cache, it is left out of the cache.
+        """
+        for address, value in zip(self.__addresses(addr, width, len(data)), data):
+            entry = self.__entry(address)
+            if entry is None or entry.width != width:
+                continue
+            cached_value = self.__values.get(address)
+            if cached_value is None:
+                if entry.read_only_bitmask != 0:
+                    continue
+                cached_value = 0
+            self.__values[address] = (cached_value & entry.read_only_bitmask) | \
+                (value & entry.read_write_bitmask)
+
+    def _record_buffer_read(self, width: int, nbytes: int) -> None:
+        """
+        Count a buffer read (used by the memories) as uncached reads, each entry of the buffer
+        occupies the width rounded up to a power of two bytes
+        """
+        # pylint: disable-next=protected-access
+        self.__statistics._record(uncached=nbytes // ((1 << (width - 1).bit_length()) >> 3))
+
+    def _record_buffer_write(self, addr: int, nbytes: int) -> None:
+        """
+        Discard any values held for the addresses written by a buffer write
+        """
+        for address in [address for address in self.__values
+                        if addr <= address < addr + nbytes]:
+            del self.__values[address]
+
+    def _refresh_runs(self, registers: Iterable[AddressedEntry]) -> \
+            Iterator[RegisterRun[AddressedEntry]]:
+        """
+        Runs of the cacheable registers amongst a set of registers
+        """
+        yield from contiguous_register_runs(
+            register for register in registers
+            if self.__is_cacheable(register.address, register.width))
+
+    def _store(self, run: RegisterRun[AddressedEntry], data: list[int]) -> None:
+        """
+        Store the values of a run of cacheable registers
+        """
+        for register, value in zip(run.registers, data):
+            self.__values[register.address] = value
+
+
+class ShadowCache(_ShadowCacheBase):
+    """
+    Shadow cache for the non-async register model, see ``enable_shadow_cache`` on the AddressMap
+
+    Note:
+        It is not expected that this class will be instantiated by users, it is built by the
+        ``enable_shadow_cache`` method of the top level AddressMap
+    """
+    __slots__: list[str] = ['__callbacks', '__cache_callbacks']
+
+    def __init__(self, callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy],
+                 lookup: ShadowCacheLookup):
+        super().__init__(lookup=lookup)
+        self.__callbacks = callbacks
+        # the block callbacks are only provided if the underlying callback set has them, so that
+        # the choice of callbacks made by the register model is not changed by the cache
+        legacy = isinstance(callbacks, NormalCallbackSetLegacy)
+        self.__cache_callbacks = derived_callback_set(
+            callbacks,
+            read_callback=self.__read,
+            write_callback=self.__write,
+            read_block_callback=None if callbacks.read_block_callback is None else
+            self.__read_block_legacy if legacy else self.__read_block,
+            write_block_callback=None if callbacks.write_block_callback is None else
+            self.__write_block_legacy if legacy else self.__write_block,
+            read_block_into_callback=None if callbacks.read_block_into_callback is None else
+            self.__read_block_into,
+            write_block_buffer_callback=None if callbacks.write_block_buffer_callback is None
+            else self.__write_block_buffer)
+
+    @property
+    def callbacks(self) -> Union[NormalCallbackSet, NormalCallbackSetLegacy]:
+        """
+        callbacks that the register model uses when the cache is enabled
+        """
+        return self.__cache_callbacks
+
+    def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        return self.__read_block(addr=addr, width=width, accesswidth=accesswidth, length=1)[0]
+
+    def __read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        data = self._cached_values(addr=addr, width=width, length=length)
+        if data is None:
+            run = block_register_run(addr=addr, width=width, accesswidth=accesswidth,
+                                     length=length)
+            data = read_register_run(self.__callbacks, run)
+            self._record_read(addr=addr, width=width, data=data)
+        return data
+
+    def __read_block_legacy(self, addr: int, width: int, accesswidth: int, length: int) -> Array:
+        return Array(get_array_typecode(width),
+                     self.__read_block(addr=addr, width=width, accesswidth=accesswidth,
+                                       length=length))
+
+    def __write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        self.__write_block(addr=addr, width=width, accesswidth=accesswidth, data=[data])
+
+    def __write_block(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        run = block_register_run(addr=addr, width=width, accesswidth=accesswidth,
+                                 length=len(data))
+        write_register_run(self.__callbacks, run, data)
+        self._record_write(addr=addr, width=width, data=data)
+
+    def __write_block_legacy(self, addr: int, width: int, accesswidth: int, data: Array) -> None:
+        self.__write_block(addr=addr, width=width, accesswidth=accesswidth, data=data.tolist())
+
+    def __read_block_into(self, addr: int, width: int, accesswidth: int,
+                          buffer: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        self.__callbacks.read_block_into_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, buffer=buffer)
+        self._record_buffer_read(width=width, nbytes=buffer.nbytes)
+
+    def __write_block_buffer(self, addr: int, width: int, accesswidth: int,
+                             data: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        self.__callbacks.write_block_buffer_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+        self._record_buffer_write(addr=addr, nbytes=data.nbytes)
+
+    def refresh(self, registers: Iterable[AddressedEntry]) -> None:
+        """
+        Read a set of registers from the hardware and hold the values of those that can be
+        cached, registers at contiguous addresses are read with a single block read
+
+        Args:
+            registers: registers to read
+        """
+        for run in self._refresh_runs(registers):
+            self._store(run, read_register_run(self.__callbacks, run))
+
+
+class AsyncShadowCache(_ShadowCacheBase):
+    """
+    Shadow cache for the async register model, see ``enable_shadow_cache`` on the
+    AsyncAddressMap
+
+    Note:
+        It is not expected that this class will be instantiated by users, it is built by the
+        ``enable_shadow_cache`` method of the top level AsyncAddressMap
+    """
+    __slots__: list[str] = ['__callbacks', '__cache_callbacks']
+
+    def __init__(self, callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy],
+                 lookup: ShadowCacheLookup):
+        super().__init__(lookup=lookup)
+        self.__callbacks = callbacks
+        # the block callbacks are only provided if the underlying callback set has them, so that
+        # the choice of callbacks made by the register model is not changed by the cache
+        legacy = isinstance(callbacks, AsyncCallbackSetLegacy)
+        self.__cache_callbacks = derived_callback_set(
+            callbacks,
+            read_callback=self.__read,
+            write_callback=self.__write,
+            read_block_callback=None if callbacks.read_block_callback is None else
+            self.__read_block_legacy if legacy else self.__read_block,
+            write_block_callback=None if callbacks.write_block_callback is None else
+            self.__write_block_legacy if legacy else self.__write_block,
+            read_block_into_callback=None if callbacks.read_block_into_callback is None else
+            self.__read_block_into,
+            write_block_buffer_callback=None if callbacks.write_block_buffer_callback is None
+            else self.__write_block_buffer)
+
+    @property
+    def callbacks(self) -> Union[AsyncCallbackSet, AsyncCallbackSetLegacy]:
+        """
+        callbacks that the register model uses when the cache is enabled
+        """
+        return self.__cache_callbacks
+
+    async def __read(self, addr: int, width: int, accesswidth: int) -> int:
+        return (await self.__read_block(addr=addr, width=width, accesswidth=accesswidth,
+                                        length=1))[0]
+
+    async def __read_block(self, addr: int, width: int, accesswidth: int,
+                           length: int) -> list[int]:
+        data = self._cached_values(addr=addr, width=width, length=length)
+        if data is None:
+            run = block_register_run(addr=addr, width=width, accesswidth=accesswidth,
+                                     length=length)
+            data = await async_read_register_run(self.__callbacks, run)
+            self._record_read(addr=addr, width=width, data=data)
+        return data
+
+    async def __read_block_legacy(self, addr: int, width: int, accesswidth: int,
+                                  length: int) -> Array:
+        return Array(get_array_typecode(width),
+                     await self.__read_block(addr=addr, width=width, accesswidth=accesswidth,
+                                             length=length))
+
+    async def __write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        await self.__write_block(addr=addr, width=width, accesswidth=accesswidth, data=[data])
+
+    async def __write_block(self, addr: int, width: int, accesswidth: int,
+                            data: list[int]) -> None:
+        run = block_register_run(addr=addr, width=width, accesswidth=accesswidth,
+                                 length=len(data))
+        await async_write_register_run(self.__callbacks, run, data)
+        self._record_write(addr=addr, width=width, data=data)
+
+    async def __write_block_legacy(self, addr: int, width: int, accesswidth: int,
+                                   data: Array) -> None:
+        await self.__write_block(addr=addr, width=width, accesswidth=accesswidth,
+                                 data=data.tolist())
+
+    async def __read_block_into(self, addr: int, width: int, accesswidth: int,
+                                buffer: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        await self.__callbacks.read_block_into_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, buffer=buffer)
+        self._record_buffer_read(width=width, nbytes=buffer.nbytes)
+
+    async def __write_block_buffer(self, addr: int, width: int, accesswidth: int,
+                                   data: memoryview) -> None:
+        # pylint: disable-next=not-callable
+        await self.__callbacks.write_block_buffer_callback(  # type: ignore[misc]
+            addr=addr, width=width, accesswidth=accesswidth, data=data)
+        self._record_buffer_write(addr=addr, nbytes=data.nbytes)
+
+    async def refresh(self, registers: Iterable[AddressedEntry]) -> None:
+        """
+        Read a set of registers from the hardware and hold the values of those that can be
+        cached, registers at contiguous addresses are read with a single block read
+
+        Args:
+            registers: registers to read
+        """
+        for run in self._refresh_runs(registers):
+            self._store(run, await async_read_register_run(self.__callbacks, run))
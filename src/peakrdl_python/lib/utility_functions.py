@@ -18,6 +18,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 This module is intended to distributed as part of automatically generated code by the
 peakrdl-python tool. It provides a set of base classes used by the autogenerated code
 """
+from typing import Optional
+from collections.abc import Iterable, Iterator
+
+
+# lookup table of every byte value with its bit order reversed, this is used to build up the
+# reversal of wider values a byte at a time rather than bit by bit
+_BIT_REVERSED_BYTES = bytes(int(f'{byte_value:08b}'[::-1], 2) for byte_value in range(256))
 
 
 def swap_msb_lsb_ordering(width: int, value: int) -> int:
@@ -27,12 +34,15 @@ def swap_msb_lsb_ordering(width: int, value: int) -> int:
     Returns:
         swapped value
     """
-    value_to_return = 0
-    for bit_positions in zip(range(0, width), range(width-1, -1, -1)):
-        bit_value = (value >> bit_positions[0]) & 0x1
-        value_to_return |= bit_value << bit_positions[1]
+    value &= (1 << width) - 1
+    if width <= 8:
+        return _BIT_REVERSED_BYTES[value] >> (8 - width)
 
-    return value_to_return
+    # for wider values, reverse the byte order and the bits within each byte using the
+    # lookup table, then remove the padding needed to get to a whole number of bytes
+    width_in_bytes = (width + 7) >> 3
+    reversed_bytes = value.to_bytes(width_in_bytes, 'little').translate(_BIT_REVERSED_BYTES)
+    return int.from_bytes(reversed_bytes, 'big') >> ((width_in_bytes << 3) - width)
 
 
 class UnsupportedWidthError(Exception):
@@ -99,3 +109,28 @@ def calculate_bitmask(high:int, low:int) -> int:
         raise ValueError(f'low must be great than or equal to high, got: {low=}, {high=}')
 
     return ((1 << (high - low + 1)) - 1) << low
+
+
+def contiguous_index_ranges(indices: Iterable[int], max_gap: int = 0) -> Iterator[range]:
+    """
+    Group a set of integer indices into ranges of consecutive indices, in ascending order
+
+    Args:
+        indices: indices to group, these do not need to be sorted and duplicates are ignored
+        max_gap: largest number of missing indices between two indices that are put in the
+                 same range, the range then includes the missing indices
+
+    Returns: ranges of consecutive indices
+    """
+    run_start: Optional[int] = None
+    run_stop = 0
+    for index in sorted(set(indices)):
+        if run_start is not None and index <= run_stop + max_gap:
+            run_stop = index + 1
+            continue
+        if run_start is not None:
+            yield range(run_start, run_stop)
+        run_start = index
+        run_stop = index + 1
+    if run_start is not None:
+        yield range(run_start, run_stop)
@@ -0,0 +1,232 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+This module is intended to distributed as part of automatically generated code by the
+peakrdl-python tool. It provides the deferred verification of register writes, where the
+registers written within a section verify scope (or write transaction) are read back at the end
+of it with the minimum number of callback operations
+"""
+from typing import Union
+from collections.abc import Iterable, Iterator
+
+from .callbacks import NormalCallbackSet, NormalCallbackSetLegacy
+from .callbacks import AsyncCallbackSet, AsyncCallbackSetLegacy
+from .section_access import AddressedEntry, RegisterRun, contiguous_register_runs
+from .section_access import read_register_run, async_read_register_run
+
+
+class RegisterWriteVerifyError(Exception):
+    """
+    Exception that occurs when the read after a write does not match the expected value
+    """
+
+
+class WriteVerifyMismatch:
+    """
+    A register whose value read back at the end of a verify scope did not match the value
+    written to it
+    """
+    __slots__: list[str] = ['__address', '__expected', '__read_back', '__inst_name']
+
+    def __init__(self, address: int, expected: int, read_back: int, inst_name: str):
+        self.__address = address
+        self.__expected = expected
+        self.__read_back = read_back
+        self.__inst_name = inst_name
+
+    @property
+    def address(self) -> int:
+        """
+        address of the register
+        """
+        return self.__address
+
+    @property
+    def expected(self) -> int:
+        """
+        value last written to the register
+        """
+        return self.__expected
+
+    @property
+    def read_back(self) -> int:
+        """
+        value read back from the register
+        """
+        return self.__read_back
+
+    @property
+    def inst_name(self) -> str:
+        """
+        full instance name of the register (or register array) that was written
+        """
+        return self.__inst_name
+
+    def __repr__(self) -> str:
+        return (f'{self.__inst_name} @ 0x{self.__address:X}: '
+                f'readback {self.__read_back:X} after writing {self.__expected:X}')
+
+
+class WriteVerifyError(RegisterWriteVerifyError):
+    """
+    Exception that occurs at the end of a verify scope when one or more of the registers read
+    back do not match the value written, all the mismatches are reported together
+    """
+
+    def __init__(self, mismatches: tuple[WriteVerifyMismatch, ...]):
+        self.mismatches = mismatches
+        super().__init__(f'{len(mismatches)} register(s) failed write verification: ' +
+                         ', '.join(repr(mismatch) for mismatch in mismatches))
+
+
+# pylint: disable-next=too-few-public-methods
+class _WriteVerifyEntry:
+    """
+    A register value waiting to be verified
+    """
+    __slots__: list[str] = ['address', 'width', 'accesswidth', 'expected', 'inst_name']
+
+    def __init__(self, address: int, width: int, accesswidth: int, expected: int,
+                 inst_name: str):
+        self.address = address
+        self.width = width
+        self.accesswidth = accesswidth
+        self.expected = expected
+        self.inst_name = inst_name
+
+
+class _WriteVerifyQueueBase:
+    """
+    Holds the register writes to be verified at the end of a verify scope. If a register is
+    written more than once, only the last value is verified.
+
+    Note:
+        It is not expected that this class will be instantiated by users, it is used by the
+        ``verify_scope`` and ``write_transaction`` context managers of the AddressMap and RegFile
+    """
+    __slots__: list[str] = ['__entries']
+
+    def __init__(self) -> None:
+        self.__entries: dict[int, _WriteVerifyEntry] = {}
+
+    def defer(self, addr: int, width: int, accesswidth: int, data: int,
+              inst_name: str) -> None:
+        """
+        Add a register write to be verified
+
+        Args:
+            addr: address of the register
+            width: width of the register in bits
+            accesswidth: accesswidth of the register in bits
+            data: value written to the register
+            inst_name: full instance name of the register for the mismatch report
+        """
+        self.__entries[addr] = _WriteVerifyEntry(address=addr, width=width,
+                                                 accesswidth=accesswidth, expected=data,
+                                                 inst_name=inst_name)
+
+    def defer_block(self, addr: int, width: int, accesswidth: int, data: Iterable[int],
+                    inst_name: str) -> None:
+        """
+        Add a block of register writes at contiguous addresses to be verified
+
+        Args:
+            addr: address of the first register
+            width: width of the registers in bits
+            accesswidth: accesswidth of the registers in bits
+            data: values written to the registers
+            inst_name: full instance name of the register array for the mismatch report
+        """
+        for entry_index, entry_data in enumerate(data):
+            self.defer(addr=addr + (entry_index * (width >> 3)), width=width,
+                       accesswidth=accesswidth, data=entry_data, inst_name=inst_name)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def registers(self) -> Iterable[AddressedEntry]:
+        """
+        registers waiting to be verified
+        """
+        return self.__entries.values()
+
+    @property
+    def _runs(self) -> Iterator[RegisterRun[_WriteVerifyEntry]]:
+        return contiguous_register_runs(self.__entries.values())
+
+    def _clear(self) -> None:
+        self.__entries.clear()
+
+    @staticmethod
+    def _mismatches(run: RegisterRun[_WriteVerifyEntry],
+                    data: list[int]) -> Iterator[WriteVerifyMismatch]:
+        for entry, read_back in zip(run.registers, data):
+            if read_back != entry.expected:
+                yield WriteVerifyMismatch(address=entry.address, expected=entry.expected,
+                                          read_back=read_back, inst_name=entry.inst_name)
+
+
+class WriteVerifyQueue(_WriteVerifyQueueBase):
+    """
+    Write verify queue used by the non-async sections
+    """
+    __slots__: list[str] = []
+
+    def verify(self, callbacks: Union[NormalCallbackSet, NormalCallbackSetLegacy]) -> None:
+        """
+        Read back all the registers in the queue, in runs of contiguous addresses and empty the
+        queue
+
+        Args:
+            callbacks: callbacks to read the registers with
+
+        Raises:
+            WriteVerifyError: if any of the registers read back do not match the value written
+        """
+        mismatches: list[WriteVerifyMismatch] = []
+        for run in self._runs:
+            mismatches.extend(self._mismatches(run, read_register_run(callbacks, run)))
+        self._clear()
+        if mismatches:
+            raise WriteVerifyError(tuple(mismatches))
+
+
+class AsyncWriteVerifyQueue(_WriteVerifyQueueBase):
+    """
+    Write verify queue used by the async sections
+    """
+    __slots__: list[str] = []
+
+    async def verify(self, callbacks: Union[AsyncCallbackSet, AsyncCallbackSetLegacy]) -> None:
+        """
+        Read back all the registers in the queue, in runs of contiguous addresses and empty the
+        queue
+
+        Args:
+            callbacks: callbacks to read the registers with
+
+        Raises:
+            WriteVerifyError: if any of the registers read back do not match the value written
+        """
+        mismatches: list[WriteVerifyMismatch] = []
+        for run in self._runs:
+            mismatches.extend(self._mismatches(run, await async_read_register_run(callbacks,
+                                                                                   run)))
+        self._clear()
+        if mismatches:
+            raise WriteVerifyError(tuple(mismatches))
@@ -22,6 +22,7 @@ import unittest
 from abc import ABC, abstractmethod
 from typing import Union, Optional
 from itertools import product
+from types import MappingProxyType
 
 from ..lib import FieldReadWrite, FieldReadOnly, FieldWriteOnly
 from ..lib import FieldEnumReadWrite, FieldEnumReadOnly, FieldEnumWriteOnly
@@ -127,6 +128,7 @@ class CommonTestBase(unittest.TestCase, ABC):
                                     low: int,
                                     high: int,
                                     is_volatile: bool,
+                                    has_side_effect: bool,
                                     default: Optional[int],
                                     rdl_name: Optional[str],
                                     rdl_desc: Optional[str],
@@ -143,6 +145,7 @@ class CommonTestBase(unittest.TestCase, ABC):
         self.assertEqual(fut.width, width)
         self.assertEqual(fut.max_value, (2 ** width) - 1)
         self.assertEqual(fut.is_volatile, is_volatile)
+        self.assertEqual(fut.has_side_effect, has_side_effect)
 
         if default is None:
             self.assertIsNone(fut.default)
@@ -336,6 +339,12 @@ class CommonTestBase(unittest.TestCase, ABC):
         """
         self.assertCountEqual(dut.systemrdl_python_child_name_map, child_names)
         self.assertEqual(set(dut.systemrdl_python_child_name_map.keys()), child_names)
+        # the map is a class level constant so must be the same object every time and read-only
+        self.assertIsInstance(dut.systemrdl_python_child_name_map, MappingProxyType)
+        self.assertIs(dut.systemrdl_python_child_name_map, dut.systemrdl_python_child_name_map)
+        with self.assertRaises(TypeError):
+            # any key will do as the map is read-only, so use the name of the node itself
+            dut.systemrdl_python_child_name_map[dut.inst_name] = dut.inst_name  # type: ignore[index]
         for child_name in child_names:
             self.assertEqual(dut.get_child_by_system_rdl_name(child_name).inst_name, child_name)
 
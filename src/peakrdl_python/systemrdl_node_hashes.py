@@ -39,6 +39,7 @@ from .systemrdl_node_utility_functions import get_properties_to_include
 from .systemrdl_node_utility_functions import HideNodeCallback
 from .systemrdl_node_utility_functions import ShowUDPCallback
 from .systemrdl_node_utility_functions import get_field_default_value
+from .systemrdl_node_utility_functions import field_has_side_effect
 from .systemrdl_node_utility_functions import get_reg_regwidth
 from .systemrdl_node_utility_functions import get_reg_accesswidth
 from .systemrdl_node_utility_functions import get_memory_accesswidth
@@ -249,6 +250,7 @@ def __reg_hash(node: RegNode,
             value_to_hash.append(field.high)
             value_to_hash.append(get_field_default_value(field))
             value_to_hash.append(field.is_hw_writable)
+            value_to_hash.append(field_has_side_effect(field))
             value_to_hash.append(field.inst_name)
             # no need to include the enum class as that is already included
 
@@ -18,7 +18,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 A set of utility functions that perform supplementary processing on a node in a compiled
 system RDL dataset.
 """
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Any
 from collections.abc import Iterable
 from itertools import filterfalse
 
@@ -33,6 +33,7 @@ from systemrdl.node import MemNode
 from systemrdl.node import SignalNode
 
 from systemrdl.rdltypes.user_enum import UserEnumMeta
+from systemrdl.rdltypes.user_struct import UserStruct
 
 from .lib.utility_functions import calculate_bitmask
 from .sim_lib.field import FieldType
@@ -428,6 +429,20 @@ def get_field_default_value(node: FieldNode) -> Optional[int]:
     raise TypeError(f'unhandled type for field default type={type(value)}')
 
 
+def field_has_side_effect(node: FieldNode) -> bool:
+    """
+    Determines if an access to the field has a side effect, i.e. a read changes the field
+    (for example rclr or rset) or a write does not simply set the field to the value written
+    (for example woclr, woset or singlepulse)
+    """
+    if not isinstance(node, FieldNode):
+        raise TypeError(f'node is not a {type(FieldNode)} got {type(node)}')
+
+    return node.get_property('onread') is not None or \
+        node.get_property('onwrite') is not None or \
+        node.get_property('singlepulse')
+
+
 def get_enum_values(enum: UserEnumMeta) -> list[int]:
     """
 
@@ -458,6 +473,24 @@ def get_properties_to_include(node: Node, udp_to_include_callback: ShowUDPCallba
     nodal_properties = node.list_properties(include_udp=True, include_native=False)
     return list(filter(udp_to_include_callback, nodal_properties))
 
+def property_references_node(value: Any) -> bool:
+    """
+    Determines if a User Defined Property value references another node in the register model,
+    either directly or within a struct or list
+
+    Args:
+        value: value of the property
+
+    Returns: True if the value references a node
+    """
+    if isinstance(value, Node):
+        return True
+    if isinstance(value, UserStruct):
+        return any(property_references_node(member) for member in value.members.values())
+    if isinstance(value, list):
+        return any(property_references_node(entry) for entry in value)
+    return False
+
 def is_encoded_field(node: FieldNode) -> bool:
     """
     Determines if a field node is encoded (using an enumerated value)
@@ -39,6 +39,7 @@ from .systemrdl_node_hashes import node_hash, enum_hash, NodeHashingMethod
 from .systemrdl_node_utility_functions import HideNodeCallback
 from .systemrdl_node_utility_functions import ShowUDPCallback
 from .systemrdl_node_utility_functions import get_properties_to_include
+from .systemrdl_node_utility_functions import property_references_node
 from .systemrdl_node_utility_functions import get_reg_regwidth, get_reg_accesswidth
 from .systemrdl_node_utility_functions import get_memory_accesswidth
 from .class_names import get_base_class_name
@@ -80,6 +81,15 @@ class PeakRDLPythonUniqueComponents:
             node=self.instance,
             udp_to_include_callback=self.parent_walker.udp_include_func)
 
+    @property
+    def properties_reference_nodes(self) -> bool:
+        """
+        True if any of the User Defined Properties to include reference another node in the
+        register model, in which case they can not be a class level constant
+        """
+        return any(property_references_node(self.instance.get_property(property_name))
+                   for property_name in self.properties_to_include)
+
     def __determine_python_class_name(self) -> tuple[str, bool]:
         """
         Returns the fully qualified class type name with a pre-calculated hash to save time
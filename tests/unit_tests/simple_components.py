@@ -19,8 +19,9 @@ Components to use in unit tests
 """
 import unittest
 from unittest.mock import NonCallableMagicMock
+from functools import partial
 from collections.abc import Iterator
-from typing import Any, Union
+from typing import Any, Optional, Union
 from abc import ABC
 import logging
 
@@ -271,9 +272,6 @@ class ReadWriteRegisterToTest(RegReadWrite):
         """
         return self.__field
 
-    def write_fields(self,  **kwargs: Any) -> None:
-        raise NotImplementedError('Not implemented for the purpose of tests')
-
     @property
     def systemrdl_python_child_name_map(self) -> dict[str, str]:
         """
@@ -307,6 +305,20 @@ class ReadOnlyRegisterArrayToTest(RegReadOnlyArray):
         return ReadOnlyRegisterToTest
 
 
+# number of elements held in the cache of LazyReadOnlyRegisterArrayToTest
+LAZY_ARRAY_CACHE_SIZE = 8
+
+
+class LazyReadOnlyRegisterArrayToTest(ReadOnlyRegisterArrayToTest):
+    """
+    Class to represent a register array in the register model, where the elements are only built
+    when they are accessed
+    """
+    __slots__: list[str] = []
+    _lazy_elements = True
+    _element_cache_size = LAZY_ARRAY_CACHE_SIZE
+
+
 class WriteOnlyRegisterArrayToTest(RegWriteOnlyArray):
     """
     Class to represent a register array in the register model
@@ -382,6 +394,45 @@ class ReadOnlyMemoryToTest(MemoryReadOnly):
         # Empty generator in case there are no children of this type
         yield None
 
+class ReadWriteMemoryToTest(MemoryReadWrite):  # pylint: disable=too-many-ancestors
+    """
+    Class to represent a memory in the register model
+    """
+    __slots__: list[str] = []
+    DEFINED_ENTRIES = 6
+    DEFINED_WIDTH = 32
+
+    # pylint: disable=duplicate-code,too-many-arguments
+    def __init__(self, *,
+                 address: int,
+                 logger_handle: str,
+                 inst_name: str,
+                 parent: AddressMap):
+        super().__init__(address=address,
+                         entries=self.DEFINED_ENTRIES,
+                         accesswidth=self.DEFINED_WIDTH,
+                         width=self.DEFINED_WIDTH,
+                         logger_handle=logger_handle,
+                         inst_name=inst_name,
+                         parent=parent)
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        """
+        In some cases systemRDL names need to be converted make them python safe, this dictionary
+        is used to map the original systemRDL names to the names of the python attributes of this
+        class
+
+        Returns: dictionary whose key is the systemRDL names and value it the property name
+        """
+        return {
+
+        }
+
+    def __iter__(self) -> Iterator[Union[Reg, RegArray]]:
+        # Empty generator in case there are no children of this type
+        yield None
+
 class ReadOnlyMemoryArrayToTest(MemoryReadOnlyArray):
     """
     Class to represent a register array in the register model
@@ -394,6 +445,237 @@ class ReadOnlyMemoryArrayToTest(MemoryReadOnlyArray):
         return ReadOnlyMemoryToTest
 
 
+class AddressMapToTest(AddressMap):
+    """
+    Address map with a mixture of registers and gaps in the address space:
+
+    - 0x00 read only register
+    - 0x04 - 0x10 array of 4 read/write registers
+    - 0x14 write only register
+    - 0x18 read/write register
+    - 0x20 read/write register
+    """
+
+    # pylint: disable=duplicate-code
+    def __init__(self, *, callbacks: Optional[CallbackSet]):
+
+        super().__init__(callbacks=callbacks, address=0, logger_handle='dut',
+                         inst_name='dut', parent=None)
+
+        self.__reg_ro = ReadOnlyRegisterToTest(address=0x0, logger_handle='dut.reg_ro',
+                                               inst_name='reg_ro', parent=self)
+        self.__reg_array = ReadWriteRegisterArrayToTest(address=0x4, logger_handle='dut.reg_array',
+                                                        inst_name='reg_array', parent=self,
+                                                        stride=4, dimensions=(4,))
+        self.__reg_wo = WriteOnlyRegisterToTest(address=0x14, logger_handle='dut.reg_wo',
+                                                inst_name='reg_wo', parent=self)
+        self.__reg_rw_a = ReadWriteRegisterToTest(address=0x18, logger_handle='dut.reg_rw_a',
+                                                  inst_name='reg_rw_a', parent=self)
+        self.__reg_rw_b = ReadWriteRegisterToTest(address=0x20, logger_handle='dut.reg_rw_b',
+                                                  inst_name='reg_rw_b', parent=self)
+
+    def __iter__(self) -> Iterator[Union[Node, NodeArray]]:
+        # deliberately not in address order
+        yield self.reg_rw_b
+        yield self.reg_ro
+        yield self.reg_array
+        yield self.reg_wo
+        yield self.reg_rw_a
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {
+            'reg_ro': 'reg_ro',
+            'reg_array': 'reg_array',
+            'reg_wo': 'reg_wo',
+            'reg_rw_a': 'reg_rw_a',
+            'reg_rw_b': 'reg_rw_b'
+        }
+
+    # pylint: enable=duplicate-code
+
+    @property
+    def reg_ro(self) -> ReadOnlyRegisterToTest:
+        """
+        read only register at 0x00
+        """
+        return self.__reg_ro
+
+    @property
+    def reg_array(self) -> ReadWriteRegisterArrayToTest:
+        """
+        read/write register array at 0x04
+        """
+        return self.__reg_array
+
+    @property
+    def reg_wo(self) -> WriteOnlyRegisterToTest:
+        """
+        write only register at 0x14
+        """
+        return self.__reg_wo
+
+    @property
+    def reg_rw_a(self) -> ReadWriteRegisterToTest:
+        """
+        read/write register at 0x18
+        """
+        return self.__reg_rw_a
+
+    @property
+    def reg_rw_b(self) -> ReadWriteRegisterToTest:
+        """
+        read/write register at 0x20
+        """
+        return self.__reg_rw_b
+
+    @property
+    def size(self) -> int:
+        return 0x24
+
+
+class AsyncReadWriteRegisterToTest(RegAsyncReadWrite):
+    """
+    Class to represent a register in an async register model
+    """
+    __slots__: list[str] = ['__field']
+
+    # pylint: disable=duplicate-code,too-many-arguments
+    class FieldToTest(FieldAsyncReadWrite):
+        """
+        Class to represent a register field in the register model
+        """
+        __slots__: list[str] = []
+
+    def __init__(self, *,
+                 address: int,
+                 logger_handle: str,
+                 inst_name: str,
+                 parent: AsyncAddressMap):
+        super().__init__(address=address,
+                         logger_handle=logger_handle,
+                         inst_name=inst_name,
+                         parent=parent)
+
+        # build the field attributes, the field occupies the whole register
+        self.__field = self.FieldToTest(
+            parent_register=self,
+            size_props=FieldSizeProps(
+                width=32,
+                lsb=0,
+                msb=31,
+                low=0,
+                high=31),
+            misc_props=FieldMiscProps(
+                default=None,
+                is_volatile=False),
+            logger_handle=logger_handle + '.field',
+            inst_name='field',
+            field_type=int)
+
+    @property
+    def width(self) -> int:
+        return 32
+
+    @property
+    def accesswidth(self) -> int:
+        return 32
+
+    @property
+    def readable_fields(self) -> Iterator[FieldAsyncReadOnly]:
+        """
+        generator that produces has all the readable fields within the register
+        """
+        yield self.field
+
+    def __iter__(self) -> Iterator[FieldAsyncReadOnly]:
+        """
+        generator that produces has all the readable fields within the register
+        """
+        yield self.field
+
+    @property
+    def writable_fields(self) -> Iterator[Union['FieldAsyncWriteOnly', 'FieldAsyncReadWrite']]:
+        """
+        generator that produces has all the readable fields within the register
+        """
+        yield self.field
+
+    # build the properties for the fields
+    @property
+    def field(self) -> FieldToTest:
+        """
+        Property to access field of the register
+        """
+        return self.__field
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {
+            'field': 'field',
+        }
+
+
+class LazyAsyncReadWriteRegisterArrayToTest(RegAsyncReadWriteArray):
+    """
+    Class to represent a register array in an async register model, where the elements are only
+    built when they are accessed
+    """
+    __slots__: list[str] = []
+    _lazy_elements = True
+    _element_cache_size = LAZY_ARRAY_CACHE_SIZE
+
+    @property
+    def width(self) -> int:
+        return 32
+
+    @property
+    def accesswidth(self) -> int:
+        return 32
+
+    @property
+    def _element_datatype(self) -> type[Node]:
+        return AsyncReadWriteRegisterToTest
+
+
+class AsyncAddressMapToTest(AsyncAddressMap):
+    """
+    Async address map with an array of 32 read/write registers, built on demand
+    """
+
+    # pylint: disable=duplicate-code
+    def __init__(self, *, callbacks: Optional[AsyncCallbackSet]):
+
+        super().__init__(callbacks=callbacks, address=0, logger_handle='dut',
+                         inst_name='dut', parent=None)
+
+        self.__reg_array = LazyAsyncReadWriteRegisterArrayToTest(
+            address=0x0, logger_handle='dut.reg_array', inst_name='reg_array', parent=self,
+            stride=4, dimensions=(32,))
+
+    def __iter__(self) -> Iterator[Union[Node, NodeArray]]:
+        yield self.reg_array
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {
+            'reg_array': 'reg_array'
+        }
+
+    # pylint: enable=duplicate-code
+
+    @property
+    def reg_array(self) -> LazyAsyncReadWriteRegisterArrayToTest:
+        """
+        read/write register array at 0x00
+        """
+        return self.__reg_array
+
+    @property
+    def size(self) -> int:
+        return 0x80
+
+
 class CallBackTestWrapper(unittest.TestCase, ABC):
     """
     Class be used in test cases to provide mockable callbacks
@@ -484,7 +766,18 @@ class CallBackTestWrapper(unittest.TestCase, ABC):
         attrs = {'read_callback': None,
                  'write_callback': None,
                  'read_block_callback': None,
-                 'write_block_callback': None}
+                 'write_block_callback': None,
+                 'single_access_executor': None,
+                 'ordered_writes': True,
+                 'read_block_into_callback': None,
+                 'write_block_buffer_callback': None,
+                 'max_block_bytes': None}
         mocked_callback_set.configure_mock(**attrs)
+        # block accesses without a block callback use these to call the (patched) single
+        # callbacks, so they need their real behaviour
+        mocked_callback_set.read_each.side_effect = \
+            partial(NormalCallbackSet.read_each, mocked_callback_set)
+        mocked_callback_set.write_each.side_effect = \
+            partial(NormalCallbackSet.write_each, mocked_callback_set)
         self.callbacks = mocked_callback_set
         self.logger = logging.Logger('test case')
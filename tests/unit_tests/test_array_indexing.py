@@ -19,15 +19,20 @@ Tests for the array indexing in the base library
 """
 
 import unittest
+import sys
 from typing import Optional, Union
-from collections.abc import Iterator
+from collections.abc import Iterator, Callable
+from types import MappingProxyType
 from abc import ABC, abstractmethod
 from itertools import product
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
 
 # pylint: disable-next=unused-wildcard-import, wildcard-import
 from peakrdl_python.lib import *
 
 from .simple_components import ReadOnlyRegisterArrayToTest, ReadOnlyMemoryArrayToTest
+from .simple_components import LazyReadOnlyRegisterArrayToTest, LAZY_ARRAY_CACHE_SIZE
 from .simple_components import CallBackTestWrapper
 
 # pylint: disable=logging-not-lazy,logging-fstring-interpolation
@@ -78,6 +83,13 @@ class RegArrayBase(ArrayBase, ABC):
         """
         return self.__dut_warpper.dut
 
+    @property
+    def dut_cls(self) -> type[ReadOnlyRegisterArrayToTest]:
+        """
+        Class of the Register Array under test
+        """
+        return ReadOnlyRegisterArrayToTest
+
     def setUp(self) -> None:
 
         class DUTWrapper(AddressMap):
@@ -91,18 +103,19 @@ class RegArrayBase(ArrayBase, ABC):
                          address: int,
                          logger_handle: str,
                          inst_name: str,
+                         dut_cls: type[ReadOnlyRegisterArrayToTest],
                          dut_stride : int,
                          dut_dimensions : tuple[int, ...]):
 
                 super().__init__(callbacks=callbacks, address=address, logger_handle=logger_handle,
                                  inst_name=inst_name, parent=None )
 
-                self.__dut = ReadOnlyRegisterArrayToTest(logger_handle='dut',
-                                                         inst_name='dut',
-                                                         parent=self,
-                                                         address=address,
-                                                         stride=dut_stride,
-                                                         dimensions=dut_dimensions)
+                self.__dut = dut_cls(logger_handle='dut',
+                                     inst_name='dut',
+                                     parent=self,
+                                     address=address,
+                                     stride=dut_stride,
+                                     dimensions=dut_dimensions)
 
 
             @property
@@ -131,6 +144,7 @@ class RegArrayBase(ArrayBase, ABC):
         super().setUp()
         self.__dut_warpper = DUTWrapper(callbacks=self.callbacks, address=self.base_address,
                                         logger_handle='dut_wrapper', inst_name='dut_wrapper',
+                                        dut_cls=self.dut_cls,
                                         dut_stride=self.stride, dut_dimensions=self.dimensions)
 
 class MemArrayBase(ArrayBase, ABC):
@@ -315,6 +329,27 @@ class Test2DRegArray(RegArrayBase):
         for index in product(*[range(dim) for dim in self.dimensions]):
             self.assertEqual(self.dut[index].address, self.calculate_address(index))
 
+    def test_full_inst_name_lookup(self) -> None:
+        """
+        Test looking up array elements and their fields from the full systemRDL name
+        """
+        element = self.dut[1, 2]
+        self.assertEqual(element.full_inst_name, 'dut_wrapper.dut[1][2]')
+        self.assertIs(self.dut.get_by_full_inst_name('dut_wrapper.dut[1][2]'), element)
+        # a repeat look-up should return the same instance from the index
+        self.assertIs(self.dut.get_by_full_inst_name('dut_wrapper.dut[1][2]'), element)
+        self.assertIs(element.get_by_full_inst_name('dut_wrapper.dut[1][2].field'),
+                      element.field)
+        self.assertIs(element.get_by_full_inst_name('dut_wrapper.dut'), self.dut)
+        self.assertIs(element.get_by_full_inst_name('dut_wrapper'), self.dut.parent)
+
+        for bad_name in ['dut_wrapper.dut[10000][20]', 'dut_wrapper.dut[1][2].missing',
+                         'dut_wrapper.dut[1][2].field.missing', 'dut_wrapper.other',
+                         'other.dut[1][2]']:
+            with self.subTest(bad_name=bad_name):
+                with self.assertRaises(ValueError):
+                    _ = self.dut.get_by_full_inst_name(bad_name)
+
     def test_inner_slice_access(self) -> None:
         """
         Test accessing an inner slice of the array elements
@@ -344,6 +379,186 @@ class Test2DRegArray(RegArrayBase):
         for index, entry in zip(product(range(2,8), range(3,9)), chunk):
             self.assertEqual(entry.address, self.calculate_address(index))
 
+    def test_strided_view(self) -> None:
+        """
+        Test a strided slice of the array shares the elements of the array it was taken from
+        """
+        view = self.dut[::2, 3]
+        expected_indices = list(product(range(0, self.dimensions[0], 2), range(3, 4)))
+        self.assertEqual(len(view), len(expected_indices))
+        self.assertEqual([index for index, _ in view.items()], expected_indices)
+        for index in expected_indices:
+            self.assertIs(view[index], self.dut[index])
+        with self.assertRaises(IndexError):
+            _ = view[1, 3]
+        with self.assertRaises(IndexError):
+            _ = view[0, 4]
+
+        # slice of a slice
+        sub_view = view[4::4, 3]
+        self.assertEqual([index for index, _ in sub_view.items()],
+                         list(product(range(4, self.dimensions[0], 4), range(3, 4))))
+        for index, entry in sub_view.items():
+            self.assertIs(entry, self.dut[index])
+        with self.assertRaises(IndexError):
+            _ = view[1::2, 3]
+
+        # reversed slice
+        reversed_view = self.dut[::-1, 0]
+        self.assertEqual([entry.address for entry in reversed_view],
+                         [self.calculate_address((index, 0))
+                          for index in reversed(range(self.dimensions[0]))])
+
+class Test1DLazyRegArray(Test1DRegArray):
+    """
+    Test for 1D arrays where the elements are built on demand
+    """
+
+    @property
+    def dut_cls(self) -> type[ReadOnlyRegisterArrayToTest]:
+        return LazyReadOnlyRegisterArrayToTest
+
+    def test_element_cache(self) -> None:
+        """
+        Check that elements are reused until they are evicted from the bounded cache
+        """
+        first_element = self.dut[0]
+        self.assertIs(self.dut[0], first_element)
+
+        # access enough elements to evict the first one
+        for index in range(1, LAZY_ARRAY_CACHE_SIZE + 1):
+            _ = self.dut[index]
+
+        rebuilt_element = self.dut[0]
+        self.assertIsNot(rebuilt_element, first_element)
+        self.assertEqual(rebuilt_element.address, first_element.address)
+        self.assertEqual(rebuilt_element.full_inst_name, first_element.full_inst_name)
+
+    def test_full_inst_name_lookup_eviction(self) -> None:
+        """
+        Check the look-up by full systemRDL name agrees with the array once an element has been
+        evicted from the cache
+        """
+        first_element = self.dut.get_by_full_inst_name('dut_wrapper.dut[0]')
+        self.assertIs(first_element, self.dut[0])
+
+        # access enough elements to evict the first one
+        for index in range(1, LAZY_ARRAY_CACHE_SIZE + 1):
+            _ = self.dut[index]
+
+        rebuilt_element = self.dut.get_by_full_inst_name('dut_wrapper.dut[0]')
+        self.assertIsNot(rebuilt_element, first_element)
+        self.assertIs(rebuilt_element, self.dut[0])
+        self.assertIs(self.dut.get_by_full_inst_name('dut_wrapper.dut[0].field'),
+                      rebuilt_element.field)
+
+    def test_udp_with_references(self) -> None:
+        """
+        Check the user defined properties that reference an element of the array (or that belong
+        to one) are not held by the top level, so they never refer to an evicted element
+        """
+        wrapper = self.dut.parent
+        build_count = 0
+
+        def build_udp(reference: Base) -> Callable[[], UDPStruct]:
+            def build() -> UDPStruct:
+                nonlocal build_count
+                build_count += 1
+                return MappingProxyType({'reference': (reference,)})
+            return build
+
+        # pylint: disable=protected-access
+        # properties referencing a node outside the array are held
+        udp = self.dut._udp_with_references(build_udp(wrapper))
+        self.assertIs(self.dut._udp_with_references(build_udp(wrapper)), udp)
+        self.assertEqual(build_count, 1)
+
+        # properties of an element or that reference an element are built on every access
+        for node, reference in [(self.dut[0], wrapper), (wrapper, self.dut[1])]:
+            build_count = 0
+            for _ in range(2):
+                udp = node._udp_with_references(build_udp(reference))
+                self.assertIs(udp['reference'][0], reference)
+            self.assertEqual(build_count, 2)
+        # pylint: enable=protected-access
+
+    def test_element_cache_threads(self) -> None:
+        """
+        Check the elements can be accessed from several threads, each element that is in the cache
+        must only be built once and accesses must be safe while the cache is evicting elements
+        """
+        # switch threads as often as possible to make the accesses interleave
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        number_threads = 8
+        start_barrier = Barrier(number_threads)
+
+        def access_cached_elements(_: int) -> list[int]:
+            start_barrier.wait()
+            return [id(self.dut[index]) for index in range(LAZY_ARRAY_CACHE_SIZE)]
+
+        def access_elements(offset: int) -> list[int]:
+            return [self.dut[(offset + index) % len(self.dut)].address
+                    for index in range(200 * LAZY_ARRAY_CACHE_SIZE)]
+
+        with ThreadPoolExecutor(max_workers=number_threads) as executor:
+            element_ids = list(executor.map(access_cached_elements, range(number_threads)))
+            self.assertEqual(element_ids, [element_ids[0]] * number_threads)
+
+            for offset, addresses in zip(range(number_threads),
+                                         executor.map(access_elements, range(number_threads))):
+                self.assertEqual(addresses,
+                                 [self.calculate_address(((offset + index) % len(self.dut),))
+                                  for index in range(200 * LAZY_ARRAY_CACHE_SIZE)])
+
+    def test_items(self) -> None:
+        """
+        Check the items method yields the indices and elements in order
+        """
+        for expected_index, (index, element) in enumerate(self.dut.items()):
+            self.assertEqual(index, (expected_index,))
+            self.assertEqual(element.address, self.calculate_address(index))
+
+
+class Test2DLazyRegArray(Test2DRegArray):
+    """
+    Test for 2D arrays where the elements are built on demand
+    """
+
+    @property
+    def dut_cls(self) -> type[ReadOnlyRegisterArrayToTest]:
+        return LazyReadOnlyRegisterArrayToTest
+
+
+class TestLargeLazyRegArray(Test2DLazyRegArray):
+    """
+    Test for a large array where the elements are built on demand, the properties of the array
+    must be available without building all the elements
+    """
+
+    @property
+    def dimensions(self) -> tuple[int, ...]:
+        return (4096, 8,)
+
+    def test_individual_access(self) -> None:
+        self.assertEqual(len(self.dut), 4096 * 8)
+        self.assertEqual(self.dut.dimensions, self.dimensions)
+        self.assertEqual(self.dut.size, 4096 * 8 * self.stride)
+        self.assertEqual(self.dut[4095, 7].address, self.calculate_address((4095, 7)))
+        with self.assertRaises(IndexError):
+            _ = self.dut[4096, 0]
+
+    def test_inner_section(self) -> None:
+        chunk = self.dut[2:8, 3:-3]
+        for index, entry in zip(product(range(2,8), range(3,5)), chunk):
+            self.assertEqual(entry.address, self.calculate_address(index))
+
+    def test_inner_slice_access(self) -> None:
+        inner_chunk = self.dut[0, :]
+        for index, entry in enumerate(inner_chunk):
+            self.assertEqual(entry.address, self.calculate_address((0, index)))
+
+
 class Test1DMemArray(MemArrayBase):
     """
     Test for 1D arrays of Memories
@@ -23,6 +23,7 @@ from collections.abc import Iterator
 from unittest.mock import patch, MagicMock
 from enum import IntEnum
 from itertools import product
+import random
 
 
 from peakrdl_python.lib.base_field import FieldType
@@ -66,6 +67,19 @@ class TestMsbAndLsbSwapping(unittest.TestCase):
                 self.assertEqual(swap_msb_lsb_ordering(width=field_length, value=1 << pos),
                                  1 << field_length - 1 - pos)
 
+    def test_swap_matches_reference(self):
+        """
+        Check the table based swap against a simple bit by bit implementation
+        """
+        def reference_swap(width, value):
+            return int(f'{value:0{width}b}'[::-1], 2)
+
+        for field_length in range(1, 130):
+            for _ in range(20):
+                value = random.randint(0, (1 << field_length) - 1)
+                self.assertEqual(swap_msb_lsb_ordering(width=field_length, value=value),
+                                 reference_swap(field_length, value))
+
 class TestBitmaskGeneration(unittest.TestCase):
     """
     Test utility function for making a bit mask
@@ -0,0 +1,243 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Tests for the fleet, which accesses many devices through one register model
+"""
+import sys
+import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# pylint: disable-next=unused-wildcard-import, wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest
+
+
+class Device:
+    """
+    A device with its own address space, accessed through a callback set
+    """
+
+    def __init__(self, barrier: threading.Barrier):
+        self.barrier = barrier
+        self.memory: dict[int, int] = {}
+
+    def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback, this waits for all the other devices to be reading at the same time
+        """
+        assert width == accesswidth
+        self.barrier.wait(timeout=5)
+        return self.memory.get(addr, 0)
+
+    def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback
+        """
+        assert width == accesswidth
+        self.memory[addr] = data
+
+    def read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        """
+        read block callback
+        """
+        return [self.read(addr=addr + (entry * (width >> 3)), width=width,
+                          accesswidth=accesswidth) for entry in range(length)]
+
+    def callbacks(self, block: bool = True) -> NormalCallbackSet:
+        """
+        callback set for the device
+        """
+        return NormalCallbackSet(read_callback=self.read, write_callback=self.write,
+                                 read_block_callback=self.read_block if block else None)
+
+
+class TestFleet(unittest.TestCase):
+    """
+    Tests for the fleet
+    """
+
+    number_devices = 4
+
+    def setUp(self) -> None:
+        self.barrier = threading.Barrier(self.number_devices)
+        self.devices = [Device(self.barrier) for _ in range(self.number_devices)]
+        self.fleet = Fleet(AddressMapToTest, [device.callbacks() for device in self.devices])
+
+    def test_run(self):
+        """
+        Check an operation is run on each device with its own callbacks, concurrently (the read
+        callbacks wait for all the devices to read at the same time)
+        """
+        self.assertEqual(len(self.fleet), self.number_devices)
+        self.assertIsInstance(self.fleet.model, AddressMapToTest)
+        for index, device in enumerate(self.devices):
+            device.memory[0x18] = index
+
+        results = self.fleet.run(lambda dut: dut.reg_rw_a.read())
+        self.assertListEqual([result.device for result in results],
+                             list(range(self.number_devices)))
+        self.assertListEqual([result.result() for result in results],
+                             list(range(self.number_devices)))
+        self.assertTrue(all(result.succeeded for result in results))
+
+        # a field write is a read-modify-write on each device
+        self.fleet.run(lambda dut: dut.reg_rw_a.field.write(1))
+        self.assertListEqual([device.memory[0x18] for device in self.devices],
+                             [index | 1 for index in range(self.number_devices)])
+
+        # a snapshot uses the block read of each device
+        results = self.fleet.run(lambda dut: dut.snapshot()[0x18])
+        self.assertListEqual([result.result() for result in results],
+                             [index | 1 for index in range(self.number_devices)])
+
+    def test_field_accesses(self):
+        """
+        Check the field reads and read-modify-writes of the devices do not interfere with each
+        other, the read callbacks wait for all the devices so the accesses overlap
+        """
+        def operation(dut: AddressMapToTest) -> tuple[dict, int]:
+            dut.reg_rw_a.write_fields(field=1)
+            return dut.reg_rw_a.read_fields(), dut.reg_rw_a.read()
+
+        switch_interval = sys.getswitchinterval()
+        # switch threads as often as possible to make any sharing of state show up
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(30):
+                for index, device in enumerate(self.devices):
+                    device.memory[0x18] = index << 4
+                results = self.fleet.run(operation)
+                self.assertListEqual([result.result() for result in results],
+                                     [({'field': 1}, (index << 4) | 1)
+                                      for index in range(self.number_devices)])
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_errors(self):
+        """
+        Check an exception on one device is reported against it without stopping the others
+        """
+        def operation(dut: AddressMapToTest) -> None:
+            dut.reg_rw_b.write(0x1)
+            if dut.reg_rw_b.read() == 0x1:
+                raise ValueError('device failed')
+
+        self.devices[2].write = lambda addr, width, accesswidth, data: None
+        fleet = Fleet(AddressMapToTest, [device.callbacks() for device in self.devices])
+        results = fleet.run(operation)
+        self.assertListEqual([result.succeeded for result in results],
+                             [False, False, True, False])
+        self.assertIsInstance(results[0].error, ValueError)
+        self.assertIsNone(results[2].error)
+        with self.assertRaises(ValueError):
+            results[0].result()
+
+    def test_devices(self):
+        """
+        Check an operation can be run on a subset of the devices
+        """
+        fleet = Fleet(AddressMapToTest, [device.callbacks() for device in self.devices],
+                      max_workers=1)
+        fleet.run(lambda dut: dut.reg_rw_b.write(0x1), devices=[1, 3])
+        self.assertListEqual([0x20 in device.memory for device in self.devices],
+                             [False, True, False, True])
+        with self.assertRaises(IndexError):
+            fleet.run(lambda dut: dut.reg_rw_b.write(0x1), devices=[4])
+
+    def test_model_outside_run(self):
+        """
+        Check the register model can not be used outside an operation
+        """
+        with self.assertRaises(RuntimeError):
+            self.fleet.model.reg_rw_a.read()
+
+    def test_callbacks(self):
+        """
+        Check the callbacks given to the register model are those that all the devices have
+        """
+        fleet = Fleet(AddressMapToTest, [self.devices[0].callbacks(),
+                                   self.devices[1].callbacks(block=False)])
+        # pylint: disable-next=protected-access
+        model_callbacks = fleet.model._callbacks
+        self.assertIsNotNone(model_callbacks.read_callback)
+        self.assertIsNone(model_callbacks.read_block_callback)
+        self.assertIsNone(model_callbacks.write_block_callback)
+
+        with self.assertRaises(TypeError):
+            Fleet(AddressMapToTest, [self.devices[0].callbacks(),
+                               NormalCallbackSetLegacy(read_callback=self.devices[1].read)])
+        with self.assertRaises(ValueError):
+            Fleet(AddressMapToTest, [])
+
+    def test_callback_options(self):
+        """
+        Check the register model is given the options of the devices, with the single accesses
+        of each device made on its own executor
+        """
+        # the reads of these devices do not wait for each other
+        devices = [Device(threading.Barrier(1)) for _ in range(2)]
+        read_threads: list[set[str]] = [set(), set()]
+
+        def recorded_read(device: int, addr: int, width: int, accesswidth: int) -> int:
+            assert width == accesswidth
+            read_threads[device].add(threading.current_thread().name.split('_')[0])
+            return devices[device].memory.get(addr, 0) | (device << 4)
+
+        def buffer_read(addr: int, width: int, accesswidth: int, buffer: memoryview) -> None:
+            assert width == accesswidth
+            buffer[:] = bytes(range(addr, addr + buffer.nbytes))
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='devicea') as executor_a, \
+                ThreadPoolExecutor(max_workers=2, thread_name_prefix='deviceb') as executor_b:
+            fleet = Fleet(AddressMapToTest, [
+                NormalCallbackSet(
+                    read_callback=lambda **kwargs: recorded_read(0, **kwargs),
+                    single_access_executor=executor_a, ordered_writes=False,
+                    read_block_into_callback=buffer_read, max_block_bytes=8),
+                NormalCallbackSet(
+                    read_callback=lambda **kwargs: recorded_read(1, **kwargs),
+                    single_access_executor=executor_b, ordered_writes=True,
+                    read_block_into_callback=buffer_read)])
+            # pylint: disable-next=protected-access
+            model_callbacks = fleet.model._callbacks
+            self.assertIsNotNone(model_callbacks.single_access_executor)
+            self.assertTrue(model_callbacks.ordered_writes)
+            self.assertEqual(model_callbacks.max_block_bytes, 8)
+            self.assertIsNotNone(model_callbacks.read_block_into_callback)
+            self.assertIsNone(model_callbacks.write_block_buffer_callback)
+
+            # the snapshot reads the run of registers from 0x0 to 0x10 with the single reads
+            results = fleet.run(lambda dut: dut.snapshot()[0x10])
+            self.assertListEqual([result.result() for result in results], [0x0, 0x10])
+            # the registers outside the run are read on the thread of the fleet
+            self.assertListEqual(read_threads, [{'devicea', 'peakrdl'}, {'deviceb', 'peakrdl'}])
+
+            def read_buffer(dut: AddressMapToTest) -> bytes:
+                buffer = memoryview(bytearray(16))
+                # pylint: disable-next=protected-access
+                dut._callbacks.read_block_into_callback(addr=0x40, width=32, accesswidth=32,
+                                                        buffer=buffer)
+                return buffer.tobytes()
+
+            results = fleet.run(read_buffer, devices=[0])
+            self.assertEqual(results[0].result(), bytes(range(0x40, 0x50)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Tests for the export options that build parts of the register model on demand
+"""
+import unittest
+import os
+import tempfile
+import sys
+from pathlib import Path
+from contextlib import contextmanager
+
+from peakrdl_python import PythonExporter
+from peakrdl_python import compiler_with_udp_registers
+from peakrdl_python.lib import Node, NodeArray
+from peakrdl_python.lib import NormalCallbackSet
+from peakrdl_python.sim_lib.dummy_callbacks import dummy_read
+
+# this assumes the current file is in the unit_test folder under tests
+test_path = Path(__file__).parent.parent
+test_cases = test_path / 'testcases'
+
+
+class TestLazyConstruction(unittest.TestCase):
+    """
+    Test class for the export options that build parts of the register model on demand
+    """
+
+    test_case_path = test_cases
+    test_case_name = 'regfile_and_arrays.rdl'
+    test_case_top_level = 'regfile_and_arrays'
+
+    @contextmanager
+    def build_python_wrappers_and_make_instance(self, lazy_array_elements, lazy_children,
+                                                lazy_fields):
+        """
+        Context manager to build the python wrappers for a value of lazy_array_elements,
+        lazy_children and lazy_fields, then import them and clean up afterwards
+        """
+        # pylint: disable=duplicate-code
+
+        # compile the code for the test
+        rdlc = compiler_with_udp_registers()
+        rdlc.compile_file(os.path.join(self.test_case_path, self.test_case_name))
+        spec = rdlc.elaborate(top_def_name=self.test_case_top_level).top
+
+        exporter = PythonExporter()
+
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            # the temporary package, within which the real package is placed is needed to ensure
+            # that there are two separate entries in the python import cache and this avoids the
+            # test failing for strange reasons
+            temp_package_name = 'lazy'
+            if lazy_array_elements:
+                temp_package_name += '_array_elements'
+            if lazy_children:
+                temp_package_name += '_children'
+            if lazy_fields:
+                temp_package_name += '_fields'
+            fq_package_path = os.path.join(tmpdirname, temp_package_name)
+            os.makedirs(fq_package_path)
+            with open(os.path.join(fq_package_path, '__init__.py'), 'w', encoding='utf-8') as fid:
+                fid.write('pass\n')
+
+            exporter.export(node=spec,
+                            path=fq_package_path,
+                            asyncoutput=False,
+                            delete_existing_package_content=False,
+                            skip_test_case_generation=True,
+                            skip_library_copy=True,
+                            lazy_array_elements=lazy_array_elements,
+                            lazy_children=lazy_children,
+                            lazy_fields=lazy_fields)
+
+            # add the temp directory to the python path so that it can be imported from
+            sys.path.append(tmpdirname)
+
+            reg_model_module = __import__(
+                temp_package_name + '.' + self.test_case_top_level + '.reg_model',
+                globals(), locals(), ['RegModel'], 0)
+            dut_cls = getattr(reg_model_module, 'RegModel')
+
+            # no read/write are attempted so this can yield out a version with no callbacks
+            # configured
+            yield dut_cls(callbacks=NormalCallbackSet(read_callback=dummy_read))
+
+            sys.path.remove(tmpdirname)
+
+    @classmethod
+    def walk(cls, node):
+        """
+        Walk the register model and return the name and address (for nodes) of every item
+        """
+        yield node.full_inst_name, node.address if isinstance(node, Node) else None
+        if isinstance(node, NodeArray):
+            for element in node:
+                yield from cls.walk(element)
+        elif isinstance(node, Node):
+            for child_node in node:
+                yield from cls.walk(child_node)
+
+    def test_lazy_construction(self):
+        """
+        Check the register models built on demand have the same structure as those built
+        up-front
+        """
+        with self.build_python_wrappers_and_make_instance(lazy_array_elements=False,
+                                                          lazy_children=False,
+                                                          lazy_fields=False) as dut:
+            eager_nodes = list(self.walk(dut))
+
+        for lazy_array_elements, lazy_children, lazy_fields in [(True, False, False),
+                                                                (False, True, False),
+                                                                (False, False, True),
+                                                                (True, True, True)]:
+            with self.build_python_wrappers_and_make_instance(
+                    lazy_array_elements=lazy_array_elements,
+                    lazy_children=lazy_children,
+                    lazy_fields=lazy_fields) as dut, \
+                    self.subTest(lazy_array_elements=lazy_array_elements,
+                                 lazy_children=lazy_children,
+                                 lazy_fields=lazy_fields):
+                # pylint: disable-next=protected-access
+                self.assertEqual(dut.layer0_reg_a._lazy_elements, lazy_array_elements)
+                # the children must be the same object each time they are accessed
+                self.assertIs(dut.layer1_regfile_b, dut.layer1_regfile_b)
+                register = dut.layer0_reg_a[0]
+                self.assertIs(register.basicfield_a, register.basicfield_a)
+                self.assertEqual(list(self.walk(dut)), eager_nodes)
+
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,402 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Tests for the buffer based memory accesses
+"""
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from typing import Optional, Union
+from collections.abc import Iterator
+from array import array as Array
+from unittest.mock import patch
+
+# pylint: disable-next=unused-wildcard-import, wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import ReadWriteMemoryToTest, CallBackTestWrapper
+
+
+class NarrowMemoryToTest(ReadWriteMemoryToTest):  # pylint: disable=too-many-ancestors
+    """
+    Memory whose entries do not fill the 32 bits used to hold each of them
+    """
+    __slots__: list[str] = []
+    DEFINED_WIDTH = 24
+
+
+class MemoryDUTWrapper(AddressMap):
+    """
+    Address map with two memories:
+
+    - 0x100 - 0x114 6 entry 32 bit memory
+    - 0x200 - 0x214 6 entry 24 bit memory
+    """
+
+    # pylint: disable=duplicate-code
+    def __init__(self, *, callbacks: Optional[CallbackSet]):
+
+        super().__init__(callbacks=callbacks, address=0, logger_handle='dut',
+                         inst_name='dut', parent=None)
+
+        self.__mem = ReadWriteMemoryToTest(address=0x100, logger_handle='dut.mem',
+                                           inst_name='mem', parent=self)
+        self.__narrow_mem = NarrowMemoryToTest(address=0x200, logger_handle='dut.narrow_mem',
+                                               inst_name='narrow_mem', parent=self)
+
+    def __iter__(self) -> Iterator[Union[Node, NodeArray]]:
+        yield self.mem
+        yield self.narrow_mem
+
+    @property
+    def systemrdl_python_child_name_map(self) -> dict[str, str]:
+        return {
+            'mem': 'mem',
+            'narrow_mem': 'narrow_mem'
+        }
+
+    @property
+    def mem(self) -> ReadWriteMemoryToTest:
+        """
+        32 bit memory
+        """
+        return self.__mem
+
+    @property
+    def narrow_mem(self) -> NarrowMemoryToTest:
+        """
+        24 bit memory
+        """
+        return self.__narrow_mem
+
+    @property
+    def size(self) -> int:
+        return 0x218
+
+
+class TestMemoryBuffer(CallBackTestWrapper):
+    """
+    Tests for the memory accesses using objects that support the buffer protocol
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dut = MemoryDUTWrapper(callbacks=self.callbacks)
+
+    def test_buffer_callbacks(self):
+        """
+        Check the buffer is passed to the buffer callbacks without being converted
+        """
+        def read_block_into(addr: int, width: int, accesswidth: int, buffer: memoryview) -> None:
+            self.assertEqual((addr, width, accesswidth), (0x104, 32, 32))
+            buffer.cast('I')[:] = Array('I', [1, 2, 3])
+
+        with patch.object(self.callbacks, 'read_block_into_callback',
+                          side_effect=read_block_into) as read_patch, \
+                patch.object(self.callbacks, 'write_block_buffer_callback') as write_patch, \
+                patch.object(self.callbacks, 'read_block_callback') as read_block_patch:
+            buffer = Array('I', [0, 0, 0])
+            self.assertEqual(self.dut.mem.read_into(1, buffer), 3)
+            self.assertEqual(buffer, Array('I', [1, 2, 3]))
+            read_patch.assert_called_once()
+
+            self.assertEqual(self.dut.mem.read_buffer(1, 3).tolist(), [1, 2, 3])
+            self.assertEqual(self.dut.mem.buffer_format, 'I')
+
+            self.dut.mem.write_from_buffer(2, buffer)
+            write_patch.assert_called_once()
+            self.assertEqual(write_patch.call_args.kwargs['addr'], 0x108)
+            self.assertEqual(write_patch.call_args.kwargs['data'].tobytes(), buffer.tobytes())
+            read_block_patch.assert_not_called()
+
+    def test_block_callbacks(self):
+        """
+        Check the buffer accesses use the block callbacks if there are no buffer callbacks
+        """
+        with patch.object(self.callbacks, 'read_block_callback',
+                          return_value=[4, 5]) as read_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_patch:
+            buffer = bytearray(8)
+            self.assertEqual(self.dut.mem.read_into(4, buffer), 2)
+            self.assertEqual(Array('I', buffer), Array('I', [4, 5]))
+            read_patch.assert_called_once_with(addr=0x110, width=32, accesswidth=32, length=2)
+
+            self.dut.mem.write_from_buffer(0, Array('I', [6, 7, 8]))
+            write_patch.assert_called_once_with(addr=0x100, width=32, accesswidth=32,
+                                                data=[6, 7, 8])
+
+    def test_buffer_checks(self):
+        """
+        Check unsuitable buffers and out of range data are rejected before any access
+        """
+        with patch.object(self.callbacks, 'read_block_into_callback') as read_patch, \
+                patch.object(self.callbacks, 'write_block_buffer_callback') as write_patch:
+            with self.assertRaises(ValueError):
+                # too many entries
+                self.dut.mem.read_into(4, Array('I', [0, 0, 0]))
+            with self.assertRaises(ValueError):
+                # not a whole number of entries
+                self.dut.mem.read_into(0, bytearray(6))
+            with self.assertRaises(TypeError):
+                self.dut.mem.read_into(0, bytes(4))
+            with self.assertRaises(TypeError):
+                self.dut.mem.write_from_buffer(0, [1, 2])
+            with self.assertRaises(ValueError):
+                self.dut.narrow_mem.write_from_buffer(0, Array('I', [1, 1 << 24]))
+            read_patch.assert_not_called()
+            write_patch.assert_not_called()
+
+            self.dut.narrow_mem.write_from_buffer(0, Array('I', [1, (1 << 24) - 1]))
+            write_patch.assert_called_once()
+
+    def test_streaming(self):
+        """
+        Check a memory can be read and written in chunks
+        """
+        # pylint: disable-next=unused-argument
+        def read_block(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+            return list(range((addr - 0x100) >> 2, ((addr - 0x100) >> 2) + length))
+
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=read_block) as read_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_patch:
+            chunks = self.dut.mem.iter_read(1, 5, chunk_entries=2)
+            read_patch.assert_not_called()
+            self.assertEqual(list(chunks), [[1, 2], [3, 4], [5]])
+            self.assertEqual([call.kwargs['addr'] for call in read_patch.call_args_list],
+                             [0x104, 0x10C, 0x114])
+            with self.assertRaises(ValueError):
+                self.dut.mem.iter_read(1, 6)
+
+            self.assertEqual(self.dut.mem.write_from_iterable(
+                2, (value for value in range(3)), chunk_entries=2), 3)
+            self.assertEqual([(call.kwargs['addr'], call.kwargs['data'])
+                              for call in write_patch.call_args_list],
+                             [(0x108, [0, 1]), (0x110, [2])])
+            write_patch.reset_mock()
+            with self.assertRaises(ValueError):
+                self.dut.mem.write_from_iterable(4, iter(range(3)))
+            write_patch.assert_called_once_with(addr=0x110, width=32, accesswidth=32,
+                                                data=[0, 1])
+
+
+class TestMaxBlockBytes(unittest.TestCase):
+    """
+    Tests for limiting the size of the block accesses made by a callback set
+    """
+
+    def test_block_callbacks_split(self):
+        """
+        Check the block accesses are split into bursts no larger than the limit
+        """
+        memory = dict.fromkeys(range(0x100, 0x118, 4), 0)
+        accesses = []
+
+        # pylint: disable-next=unused-argument
+        def read_block(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+            accesses.append(('read', addr, length))
+            return [memory[addr + (4 * entry)] for entry in range(length)]
+
+        # pylint: disable-next=unused-argument
+        def write_block(addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+            accesses.append(('write', addr, len(data)))
+            for entry, value in enumerate(data):
+                memory[addr + (4 * entry)] = value
+
+        callbacks = NormalCallbackSet(read_block_callback=read_block,
+                                      write_block_callback=write_block,
+                                      max_block_bytes=8)
+        self.assertEqual(callbacks.max_block_bytes, 8)
+        dut = MemoryDUTWrapper(callbacks=callbacks)
+
+        dut.mem.write(1, [1, 2, 3, 4, 5])
+        self.assertEqual(dut.mem.read(0, 6), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(accesses, [('write', 0x104, 2), ('write', 0x10C, 2),
+                                    ('write', 0x114, 1), ('read', 0x100, 2),
+                                    ('read', 0x108, 2), ('read', 0x110, 2)])
+
+        # streaming uses the limit as its default chunk size
+        accesses.clear()
+        self.assertEqual(list(dut.mem.iter_read(3, 3)), [[3, 4], [5]])
+        self.assertEqual(accesses, [('read', 0x10C, 2), ('read', 0x114, 1)])
+
+    def test_max_block_bytes_checks(self):
+        """
+        Check invalid limits are rejected
+        """
+        with self.assertRaises(TypeError):
+            NormalCallbackSet(max_block_bytes=8.0)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            NormalCallbackSet(max_block_bytes=0)
+
+
+class MemoryContentTestBase(CallBackTestWrapper):
+    """
+    Base class for tests where the block callbacks access the content of the 32 bit memory
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dut = MemoryDUTWrapper(callbacks=self.callbacks)
+        self.memory_content = dict.fromkeys(range(0x100, 0x118, 4), 0)
+
+    # pylint: disable-next=unused-argument
+    def read_block(self, addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        """
+        read from the memory content
+        """
+        return [self.memory_content[addr + (4 * entry)] for entry in range(length)]
+
+    # pylint: disable-next=unused-argument
+    def write_block(self, addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+        """
+        write to the memory content
+        """
+        for entry, value in enumerate(data):
+            self.memory_content[addr + (4 * entry)] = value
+
+
+class TestMemoryFile(MemoryContentTestBase):
+    """
+    Tests for loading and dumping memories to files
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_raw_file(self):
+        """
+        Check a raw file can be dumped and loaded in either byte order
+        """
+        path = os.path.join(self.temp_dir.name, 'mem.bin')
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block) as read_patch, \
+                patch.object(self.callbacks, 'write_block_callback',
+                             side_effect=self.write_block):
+            self.memory_content[0x104] = 0x01020304
+            self.memory_content[0x108] = 0xA0B0C0D0
+
+            self.assertEqual(self.dut.mem.dump_to_file(path, 1, chunk_entries=2), 5)
+            self.assertEqual(read_patch.call_count, 3)
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), bytes.fromhex('04030201 D0C0B0A0') + bytes(12))
+
+            self.dut.mem.dump_to_file(path, 1, 2, byteorder='big')
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), bytes.fromhex('01020304 A0B0C0D0'))
+
+            self.assertEqual(self.dut.mem.load_from_file(path, 3, byteorder='big'), 2)
+            self.assertEqual(self.dut.mem.read(3, 2), [0x01020304, 0xA0B0C0D0])
+
+            with self.assertRaises(ValueError):
+                # the file only holds two entries
+                self.dut.mem.load_from_file(path, 0, 3)
+            with self.assertRaises(ValueError):
+                self.dut.mem.dump_to_file(path, file_format='json')  # type: ignore[arg-type]
+
+    def test_hex_file(self):
+        """
+        Check a hex file can be dumped and loaded
+        """
+        path = os.path.join(self.temp_dir.name, 'mem.hex')
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block), \
+                patch.object(self.callbacks, 'write_block_callback',
+                             side_effect=self.write_block):
+            self.memory_content[0x100] = 0x12
+            self.memory_content[0x114] = 0xFEDCBA98
+            self.assertEqual(self.dut.mem.dump_to_file(path, 4, file_format='hex'), 2)
+            with open(path, encoding='ascii') as file:
+                self.assertEqual(file.read(), '00000000\nfedcba98\n')
+
+            with open(path, 'w', encoding='ascii') as file:
+                file.write('// comment\n1 2\n\n  abc  // value\n')
+            self.assertEqual(self.dut.mem.load_from_file(path, 1, file_format='hex'), 3)
+            self.assertEqual(self.dut.mem.read(0, 5), [0x12, 1, 2, 0xABC, 0])
+
+            with self.assertRaises(ValueError):
+                self.dut.mem.load_from_file(path, 0, 4, file_format='hex')
+            with open(path, 'w', encoding='ascii') as file:
+                file.write('@10\n1\n')
+            with self.assertRaises(ValueError):
+                self.dut.mem.load_from_file(path, file_format='hex')
+
+
+class TestMemoryEntries(MemoryContentTestBase):
+    """
+    Tests for accessing entries that are not consecutive
+    """
+
+    def test_read_entries(self):
+        """
+        Check the entries are read in runs and returned in the order requested
+        """
+        for entry in range(6):
+            self.memory_content[0x100 + (4 * entry)] = entry + 10
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block) as read_patch:
+            self.assertEqual(self.dut.mem.read_entries([5, 0, 1, 3, 0]), [15, 10, 11, 13, 10])
+            self.assertEqual([(call.kwargs['addr'], call.kwargs['length'])
+                              for call in read_patch.call_args_list],
+                             [(0x100, 2), (0x10C, 1), (0x114, 1)])
+
+            read_patch.reset_mock()
+            self.assertEqual(self.dut.mem.read_entries([5, 0, 1, 3], max_gap=1), [15, 10, 11, 13])
+            self.assertEqual([(call.kwargs['addr'], call.kwargs['length'])
+                              for call in read_patch.call_args_list],
+                             [(0x100, 6)])
+
+            read_patch.reset_mock()
+            with self.assertRaises(ValueError):
+                self.dut.mem.read_entries([0, 6])
+            with self.assertRaises(ValueError):
+                self.dut.mem.read_entries([0], max_gap=-1)
+            read_patch.assert_not_called()
+
+    def test_write_entries(self):
+        """
+        Check the entries are written in runs, with any gaps bridged keeping their value
+        """
+        self.memory_content[0x108] = 0x22
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block) as read_patch, \
+                patch.object(self.callbacks, 'write_block_callback',
+                             side_effect=self.write_block) as write_patch:
+            self.dut.mem.write_entries({4: 4, 0: 1, 1: 2})
+            read_patch.assert_not_called()
+            self.assertEqual([(call.kwargs['addr'], call.kwargs['data'])
+                              for call in write_patch.call_args_list],
+                             [(0x100, [1, 2]), (0x110, [4])])
+
+            write_patch.reset_mock()
+            self.dut.mem.write_entries({3: 7, 1: 5}, max_gap=1)
+            read_patch.assert_called_once_with(addr=0x104, width=32, accesswidth=32, length=3)
+            write_patch.assert_called_once_with(addr=0x104, width=32, accesswidth=32,
+                                                data=[5, 0x22, 7])
+
+            write_patch.reset_mock()
+            with self.assertRaises(ValueError):
+                self.dut.mem.write_entries({0: 1, 2: 1 << 32})
+            with self.assertRaises(TypeError):
+                self.dut.mem.write_entries({0: 1, 2: 1.0})  # type: ignore[dict-item]
+            write_patch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,17 +19,19 @@ Tests for the array indexing in the base library
 """
 
 import unittest
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union, cast
 from collections.abc import Iterator
 from abc import ABC, abstractmethod
-from unittest.mock import patch
+from unittest.mock import patch, call
 from array import array as Array
 
 # pylint: disable-next=unused-wildcard-import, wildcard-import
 from peakrdl_python.lib import *
 
 from .simple_components import ReadWriteRegisterArrayToTest, ReadOnlyRegisterArrayToTest, \
-    WriteOnlyRegisterArrayToTest, CallBackTestWrapper
+    WriteOnlyRegisterArrayToTest, AddressMapToTest, CallBackTestWrapper
 
 # pylint: disable=logging-not-lazy,logging-fstring-interpolation
 
@@ -199,8 +201,9 @@ class Test1DArrayReadWrite(ArrayBase):
                 follow_along_array[4] = 1 # filed is in bit 0
 
             read_patch.assert_called_once_with(addr=0, width=32, accesswidth=32, length=10)
-            write_patch.assert_called_once_with(addr=0, width=32,
-                                                accesswidth=32, data=follow_along_array)
+            # only the entries that were written are written back
+            write_patch.assert_called_once_with(addr=8, width=32,
+                                                accesswidth=32, data=follow_along_array[2:5])
 
         # try with write-back skip
         with patch.object(self.callbacks, 'read_block_callback',
@@ -221,6 +224,126 @@ class Test1DArrayReadWrite(ArrayBase):
                 with self.dut.single_read_modify_write(verify=True) as dut_context:
                     dut_context[2].write(4)
 
+    def test_context_manager_callback_binding(self):
+        """
+        check that the registers in the array, which bind their callbacks on first use, pick up
+        the cache callbacks in the context manager and release them afterwards
+        """
+        with patch.object(self.callbacks, 'read_callback', return_value=0) as read_patch, \
+                patch.object(self.callbacks, 'read_block_callback',
+                             return_value=[0 for x in range(10)]) as read_block_patch, \
+                patch.object(self.callbacks, 'write_block_callback'):
+
+            # first access binds the normal callbacks to the register
+            self.assertEqual(self.dut[2].read(), 0)
+            read_patch.assert_called_once_with(addr=8, width=32, accesswidth=32)
+            read_patch.reset_mock()
+
+            with self.dut.single_read_modify_write() as dut_context:
+                dut_context[2].write(4)
+                self.assertEqual(dut_context[2].read(), 4)
+            read_patch.assert_not_called()
+            read_block_patch.assert_called_once()
+
+            # after the context manager the register should use the normal callbacks again
+            self.assertEqual(self.dut[2].read(), 0)
+            read_patch.assert_called_once_with(addr=8, width=32, accesswidth=32)
+
+    def test_callback_binding_per_model(self):
+        """
+        check that the callback bindings are shared within a register model but using the
+        cached access context manager of one model does not invalidate the bindings of another
+        """
+        other_model = type(self.dut.parent)(callbacks=self.callbacks,
+                                            address=self.base_address,
+                                            logger_handle='other_wrapper',
+                                            inst_name='other_wrapper',
+                                            dut_stride=self.stride,
+                                            dut_dimensions=self.dimensions,
+                                            RegisterArrayType=self.RegisterArrayType)
+
+        # pylint: disable=protected-access
+        self.assertIs(self.dut[2]._callback_binding, self.dut.parent._callback_binding)
+        self.assertIs(self.dut._callback_binding, self.dut.parent._callback_binding)
+        self.assertIsNot(other_model.dut._callback_binding, self.dut._callback_binding)
+
+        epoch = other_model._callback_binding.epoch
+        with patch.object(self.callbacks, 'read_block_callback',
+                          return_value=[0 for x in range(10)]), \
+                patch.object(self.callbacks, 'write_block_callback'):
+            with self.dut.single_read_modify_write():
+                pass
+        self.assertEqual(other_model._callback_binding.epoch, epoch)
+        # pylint: enable=protected-access
+
+    @staticmethod
+    def read_block_address_pattern(addr: int, width: int,
+                                   accesswidth: int, length: int) -> list[int]:
+        """
+        read block callback which returns the address of each register as its value
+        """
+        assert accesswidth == width
+        return [addr + (entry * (width >> 3)) for entry in range(length)]
+
+    def test_context_manager_write_back(self):
+        """
+        check that the modified entries are written back in runs, unless a single block covering
+        the whole array is cheaper
+        """
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block_address_pattern), \
+                patch.object(self.callbacks, 'write_block_callback') as write_patch:
+
+            # nothing written, so nothing is written back
+            with self.dut.single_read_modify_write() as dut_context:
+                _ = dut_context[5].read()
+            write_patch.assert_not_called()
+
+            # two entries far apart, a single block is cheaper than two callbacks
+            with self.dut.single_read_modify_write() as dut_context:
+                dut_context[0].write(1)
+                dut_context[9].write(2)
+            write_patch.assert_called_once_with(addr=0, width=32, accesswidth=32,
+                                                data=[1, 4, 8, 12, 16, 20, 24, 28, 32, 2])
+            write_patch.reset_mock()
+
+            # with a lower callback cost the entries are written separately
+            with patch.object(type(self.dut), '_write_back_callback_cost', 1):
+                with self.dut.single_read_modify_write() as dut_context:
+                    dut_context[0].write(1)
+                    dut_context[9].write(2)
+            self.assertListEqual(write_patch.call_args_list, [
+                call(addr=0, width=32, accesswidth=32, data=[1]),
+                call(addr=36, width=32, accesswidth=32, data=[2])])
+
+    def test_slice_context_manager(self):
+        """
+        check that the context manager on a slice of the array only accesses the span of the
+        slice
+        """
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block_address_pattern) as read_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_patch:
+
+            with self.dut[3:6].single_read_modify_write() as dut_context:
+                self.assertEqual(len(dut_context), 3)
+                self.assertEqual(dut_context[3].read(), 12)
+                dut_context[4].write(0x55)
+                self.assertEqual(dut_context[4].read(), 0x55)
+                # the elements of the slice are the elements of the full array
+                self.assertEqual(self.dut[4].read(), 0x55)
+                with self.assertRaises(ValueError):
+                    _ = self.dut[7].read()
+
+            read_patch.assert_called_once_with(addr=12, width=32, accesswidth=32, length=3)
+            write_patch.assert_called_once_with(addr=16, width=32, accesswidth=32, data=[0x55])
+            read_patch.reset_mock()
+
+            # a slice with a step covers the span from the first to last element
+            with self.dut[8:1:-3].single_read_modify_write(skip_write=True):
+                pass
+            read_patch.assert_called_once_with(addr=8, width=32, accesswidth=32, length=7)
+
     def test_blockless_context_manager(self):
         """
         test the context manager that will perform a set of read operation,
@@ -354,5 +477,82 @@ class Test1DArrayWriteOnly(ArrayBase):
         """
 
 
+class TestSingleAccessExecutor(unittest.TestCase):
+    """
+    Tests for block accesses made with the single callbacks through an executor
+    """
+
+    def setUp(self) -> None:
+        self.memory: dict[int, int] = {}
+        self.write_order: list[int] = []
+        self.barrier = threading.Barrier(4)
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(self.executor.shutdown)
+
+    def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback, this waits for all the entries of the array to be read at the same time
+        """
+        assert width == accesswidth
+        self.barrier.wait(timeout=5)
+        return self.memory.get(addr, 0)
+
+    def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback
+        """
+        assert width == accesswidth
+        self.write_order.append(addr)
+        self.memory[addr] = data
+
+    def test_read(self):
+        """
+        Check the reads of an array are made concurrently and returned in order
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read, write_callback=self.write,
+            single_access_executor=self.executor))
+        for entry in range(4):
+            self.memory[0x4 + (entry * 4)] = entry + 1
+        with dut.reg_array.single_read_modify_write(skip_write=True) as reg_array:
+            self.assertListEqual([entry.read() for entry in reg_array], [1, 2, 3, 4])
+
+        dut = AddressMapToTest(callbacks=NormalCallbackSetLegacy(
+            read_callback=self.read, write_callback=self.write,
+            single_access_executor=self.executor))
+        with dut.reg_array.single_read_modify_write(skip_write=True) as reg_array:
+            self.assertListEqual([entry.read() for entry in reg_array], [1, 2, 3, 4])
+
+    def test_write(self):
+        """
+        Check the writes of an array are made in address order unless ordered_writes is False
+        """
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read, write_callback=self.write,
+            single_access_executor=self.executor))
+        with dut.reg_array.single_read_modify_write() as reg_array:
+            for value, entry in enumerate(reg_array, start=1):
+                entry.write(value)
+        self.assertListEqual(self.write_order, [0x4, 0x8, 0xC, 0x10])
+
+        self.write_order.clear()
+        dut = AddressMapToTest(callbacks=NormalCallbackSet(
+            read_callback=self.read, write_callback=self.write,
+            single_access_executor=self.executor, ordered_writes=False))
+        with dut.reg_array.single_read_modify_write() as reg_array:
+            for value, entry in enumerate(reg_array, start=5):
+                entry.write(value)
+        self.assertCountEqual(self.write_order, [0x4, 0x8, 0xC, 0x10])
+        self.assertListEqual([self.memory[0x4 + (entry * 4)] for entry in range(4)],
+                             [5, 6, 7, 8])
+
+    def test_executor_type(self):
+        """
+        Check the executor must be an Executor
+        """
+        with self.assertRaises(TypeError):
+            NormalCallbackSet(read_callback=self.read, single_access_executor=4)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 Test for basic register reading
 """
 import unittest
+import logging
 from typing import Optional, cast, Union
 from collections.abc import Iterator
 from abc import ABC, abstractmethod
@@ -236,6 +237,23 @@ class TestWrite(RegTestBase):
                                                accesswidth=self.dut.accesswidth, data=1)
             read_patch.assert_not_called()
 
+    def test_register_write_logging(self) -> None:
+        """
+        Test that the logger of a register is only created when it is first used and the write
+        is logged against it
+        """
+        logger_handle = 'lazy_logger_dut'
+        dut = WriteOnlyRegisterToTest(logger_handle=logger_handle, inst_name='dut',
+                                      parent=self.dut_wrapper, address=0)
+        self.assertNotIn(logger_handle, logging.Logger.manager.loggerDict)
+
+        with patch.object(self.callbacks, 'write_callback') as write_patch:
+            with self.assertLogs(logger_handle, level='INFO') as logs:
+                dut.write(10)
+            write_patch.assert_called_once()
+        self.assertEqual(logs.output, [f'INFO:{logger_handle}:Writing data:0xA to 0x0'])
+        self.assertIn(logger_handle, logging.Logger.manager.loggerDict)
+
 
 class TestReadWrite(RegTestBase):
     """
@@ -431,6 +449,30 @@ class TestReadWrite(RegTestBase):
                                                accesswidth=self.dut.accesswidth)
             write_patch.assert_not_called()
 
+    def test_field_update_bitmasks(self) -> None:
+        """
+        Check the bitmasks used to apply a field update to any register value, without accessing
+        the register
+        """
+        with patch.object(self.callbacks, 'read_callback') as read_patch, \
+                patch.object(self.callbacks, 'write_callback') as write_patch:
+            for field_value in [0, 1]:
+                # pylint: disable-next=protected-access
+                keep_bitmask, set_bitmask = self.dut._field_update_bitmasks({'field': field_value})
+                self.assertEqual(keep_bitmask, 0xFFFF_FFFE)
+                self.assertEqual(set_bitmask, field_value)
+                for reg_value in [0x0, 0x1, 0xA5A5_A5A4, 0xFFFF_FFFF]:
+                    # pylint: disable-next=protected-access
+                    expected = self.dut._encode_fields(reg_value, {'field': field_value})
+                    self.assertEqual((reg_value & keep_bitmask) | set_bitmask, expected)
+
+            with self.assertRaises(ValueError):
+                # pylint: disable-next=protected-access
+                self.dut._field_update_bitmasks({'field': 2})
+
+            read_patch.assert_not_called()
+            write_patch.assert_not_called()
+
     def test_context_manager_read(self) -> None:
         """
         Check the write back has occurred, this happens by default even if nothing has changed in
@@ -0,0 +1,649 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Tests for the section level operations that access many registers at once
+"""
+import unittest
+import asyncio
+from typing import Optional, Union
+from array import array as Array
+from collections.abc import Iterator
+from unittest.mock import patch, call, PropertyMock
+
+# pylint: disable-next=unused-wildcard-import, wildcard-import
+from peakrdl_python.lib import *
+from peakrdl_python.lib.section_access import contiguous_register_runs, bounded_gather
+
+from .simple_components import ReadWriteRegisterArrayToTest, AddressMapToTest, \
+    AsyncAddressMapToTest, CallBackTestWrapper, LAZY_ARRAY_CACHE_SIZE
+
+
+class TestSnapshot(CallBackTestWrapper):
+    """
+    Tests for the section snapshot
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dut = AddressMapToTest(callbacks=self.callbacks)
+
+    @staticmethod
+    def read_block_address_pattern(addr: int, width: int,
+                                   accesswidth: int, length: int) -> list[int]:
+        """
+        read block callback which returns the address (plus one) of each register as its value
+        """
+        assert accesswidth == width
+        return [addr + (entry * (width >> 3)) + 1 for entry in range(length)]
+
+    def test_runs(self):
+        """
+        Check the registers are grouped into contiguous runs
+        """
+        readable_runs = [(run.address, run.length) for run in
+                         contiguous_register_runs(self.dut.get_readable_registers(unroll=True))]
+        self.assertListEqual(readable_runs, [(0x0, 5), (0x18, 1), (0x20, 1)])
+
+        # pylint: disable-next=protected-access
+        all_registers = self.dut._get_registers_in_section()
+        all_runs = [(run.address, run.length, run.size) for run in
+                    contiguous_register_runs(all_registers)]
+        self.assertListEqual(all_runs, [(0x0, 7, 28), (0x20, 1, 4)])
+
+    def test_get_register_runs(self):
+        """
+        Check the registers are produced in address order grouped into runs, without sorting
+        """
+        runs = list(self.dut.get_register_runs())
+        self.assertListEqual([(run.address, run.length) for run in runs], [(0x0, 7), (0x20, 1)])
+        self.assertListEqual([register.address for register in runs[0].registers],
+                             list(range(0x0, 0x1C, 4)))
+        self.assertIs(runs[0].registers[0], self.dut.reg_ro)
+        self.assertIs(runs[0].registers[2], self.dut.reg_array[1])
+
+        with patch('peakrdl_python.lib.section_access.sorted', create=True) as sorted_patch, \
+                patch.object(self.callbacks, 'read_callback', return_value=0):
+            _ = list(self.dut.get_register_runs())
+            _ = self.dut.snapshot()
+        sorted_patch.assert_not_called()
+
+    def test_interleaved_arrays(self):
+        """
+        Check the elements of arrays that are interleaved in the address space are merged
+        into address order
+        """
+        class InterleavedDUT(AddressMap):
+            """
+            two arrays of registers with a stride of 8, one at 0x0 and one at 0x4
+            """
+            # pylint: disable-next=duplicate-code
+            def __init__(self, *, callbacks: Optional[CallbackSet]):
+                super().__init__(callbacks=callbacks, address=0, logger_handle='dut',
+                                 inst_name='dut', parent=None)
+                self.array_b = ReadWriteRegisterArrayToTest(address=0x4,
+                                                            logger_handle='dut.array_b',
+                                                            inst_name='array_b', parent=self,
+                                                            stride=8, dimensions=(3,))
+                self.array_a = ReadWriteRegisterArrayToTest(address=0x0,
+                                                            logger_handle='dut.array_a',
+                                                            inst_name='array_a', parent=self,
+                                                            stride=8, dimensions=(3,))
+
+            def __iter__(self) -> Iterator[Union[Node, NodeArray]]:
+                yield self.array_b
+                yield self.array_a
+
+            @property
+            def systemrdl_python_child_name_map(self) -> dict[str, str]:
+                return {'array_a': 'array_a', 'array_b': 'array_b'}
+
+            @property
+            def size(self) -> int:
+                return 0x18
+
+        dut = InterleavedDUT(callbacks=self.callbacks)
+        runs = list(dut.get_register_runs())
+        self.assertEqual(len(runs), 1)
+        self.assertListEqual([register.full_inst_name for register in runs[0].registers],
+                             ['dut.array_a[0]', 'dut.array_b[0]', 'dut.array_a[1]',
+                              'dut.array_b[1]', 'dut.array_a[2]', 'dut.array_b[2]'])
+
+    def test_snapshot_block_reads(self):
+        """
+        Check the snapshot uses a block read for each run of readable registers
+        """
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block_address_pattern) as read_block_patch:
+            snapshot = self.dut.snapshot()
+
+        read_block_patch.assert_has_calls([
+            call(addr=0x0, width=32, accesswidth=32, length=5),
+            call(addr=0x18, width=32, accesswidth=32, length=1),
+            call(addr=0x20, width=32, accesswidth=32, length=1)])
+        self.assertEqual(read_block_patch.call_count, 3)
+
+        self.assertListEqual(list(snapshot), [0x0, 0x4, 0x8, 0xC, 0x10, 0x18, 0x20])
+        self.assertDictEqual(dict(snapshot), {address: address + 1 for address in snapshot})
+        self.assertNotIn(0x14, snapshot)
+        self.assertIs(snapshot.register_at(0x8), self.dut.reg_array[1])
+        self.assertEqual(snapshot.register_value(self.dut.reg_array[1]), 0x9)
+        self.assertEqual(snapshot.read_fields(self.dut.reg_ro), {'field': 1})
+        self.assertEqual(snapshot.read_fields(self.dut.reg_array[1]), {'field': 1})
+        self.assertEqual(snapshot.read_fields(self.dut.reg_rw_b), {'field': 1})
+        with self.assertRaises(KeyError):
+            _ = snapshot.register_at(0x14)
+
+    def test_snapshot_single_reads(self):
+        """
+        Check the snapshot uses the single read callback if there are is no block callback and
+        for runs of one register
+        """
+        with patch.object(self.callbacks, 'read_callback', return_value=0) as read_patch:
+            snapshot = self.dut.snapshot()
+        self.assertEqual(read_patch.call_count, 7)
+        self.assertEqual(len(snapshot), 7)
+
+        with patch.object(self.callbacks, 'read_callback', return_value=0) as read_patch, \
+                patch.object(self.callbacks, 'read_block_callback',
+                             side_effect=self.read_block_address_pattern) as read_block_patch:
+            snapshot = self.dut.snapshot()
+        read_block_patch.assert_called_once_with(addr=0x0, width=32, accesswidth=32, length=5)
+        read_patch.assert_has_calls([call(addr=0x18, width=32, accesswidth=32),
+                                     call(addr=0x20, width=32, accesswidth=32)])
+        self.assertEqual(snapshot[0x18], 0)
+        self.assertEqual(snapshot[0x10], 0x11)
+
+    def test_snapshot_bad_block_read(self):
+        """
+        Check a block read returning the wrong number of entries is caught
+        """
+        with patch.object(self.callbacks, 'read_block_callback', return_value=[0]):
+            with self.assertRaises(ValueError):
+                _ = self.dut.snapshot()
+
+    def test_snapshot_duplicate_address(self):
+        """
+        Check a snapshot can not be made with two registers at the same address
+        """
+        registers = [self.dut.reg_ro, self.dut.reg_rw_a]
+        snapshot = SectionSnapshot(registers=registers, values=[1, 2])
+        self.assertDictEqual(dict(snapshot), {register.address: value for register, value
+                                              in zip(registers, [1, 2])})
+        with self.assertRaises(ValueError):
+            SectionSnapshot(registers=[self.dut.reg_ro, self.dut.reg_ro], values=[1, 2])
+
+
+class TestWriteTransaction(CallBackTestWrapper):
+    """
+    Tests for the section write transaction
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dut = AddressMapToTest(callbacks=self.callbacks)
+
+    def write_registers(self) -> None:
+        """
+        perform a set of writes which are not in address order
+        """
+        self.dut.reg_rw_b.write(0x20)
+        self.dut.reg_array[3].write(0x10)
+        self.dut.reg_wo.write(0x14)
+        self.dut.reg_rw_a.write(0x18)
+        self.dut.reg_array[0].write(0x4)
+        self.dut.reg_array[1].write(0x8)
+
+    def test_address_ordering(self):
+        """
+        Check the writes are merged into block writes of contiguous registers in address order
+        """
+        with patch.object(self.callbacks, 'write_block_callback') as write_block_patch, \
+                patch.object(self.callbacks, 'write_callback') as write_patch:
+            with self.dut.write_transaction() as dut:
+                self.assertIs(dut, self.dut)
+                self.write_registers()
+                write_block_patch.assert_not_called()
+                write_patch.assert_not_called()
+
+            self.assertListEqual(write_block_patch.call_args_list, [
+                call(addr=0x4, width=32, accesswidth=32, data=[0x4, 0x8]),
+                call(addr=0x10, width=32, accesswidth=32, data=[0x10, 0x14, 0x18])])
+            write_patch.assert_called_once_with(addr=0x20, width=32, accesswidth=32, data=0x20)
+
+    def test_program_ordering(self):
+        """
+        Check the writes are done in the order they were made, with only consecutive writes
+        merged
+        """
+        with patch.object(self.callbacks, 'write_block_callback') as write_block_patch:
+            with self.dut.write_transaction(ordering=WriteTransactionOrdering.PROGRAM):
+                self.write_registers()
+
+            self.assertListEqual(write_block_patch.call_args_list, [
+                call(addr=0x20, width=32, accesswidth=32, data=[0x20]),
+                call(addr=0x10, width=32, accesswidth=32, data=[0x10, 0x14, 0x18]),
+                call(addr=0x4, width=32, accesswidth=32, data=[0x4, 0x8])])
+
+    def test_read_modify_write(self):
+        """
+        Check that reads within the transaction use the shadow for register that have been
+        written and the hardware for the others
+        """
+        with patch.object(self.callbacks, 'read_callback', return_value=0xF0) as read_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_block_patch:
+            with self.dut.write_transaction():
+                self.assertEqual(self.dut.reg_rw_a.read(), 0xF0)
+                read_patch.assert_called_once_with(addr=0x18, width=32, accesswidth=32)
+                read_patch.reset_mock()
+
+                self.dut.reg_rw_a.field.write(1)
+                read_patch.assert_called_once_with(addr=0x18, width=32, accesswidth=32)
+                read_patch.reset_mock()
+                self.assertEqual(self.dut.reg_rw_a.read(), 0xF1)
+                self.dut.reg_rw_a.field.write(0)
+                self.assertEqual(self.dut.reg_rw_a.read(), 0xF0)
+                read_patch.assert_not_called()
+
+                # a block read over the array should only read the hardware for the entries
+                # that have not been written
+                self.dut.reg_array[1].write(0x55)
+                with self.dut.reg_array.single_read_modify_write(skip_write=True) as array:
+                    self.assertEqual(array[0].read(), 0xF0)
+                    self.assertEqual(array[1].read(), 0x55)
+
+            self.assertListEqual(write_block_patch.call_args_list, [
+                call(addr=0x8, width=32, accesswidth=32, data=[0x55]),
+                call(addr=0x18, width=32, accesswidth=32, data=[0xF0])])
+            self.assertEqual(read_patch.call_count, 4)
+
+        # after the transaction the callbacks are used directly again
+        with patch.object(self.callbacks, 'write_callback') as write_patch:
+            self.dut.reg_rw_a.write(0x1)
+            write_patch.assert_called_once_with(addr=0x18, width=32, accesswidth=32, data=0x1)
+
+    def test_exception_discards_writes(self):
+        """
+        Check that an exception in the transaction discards the writes
+        """
+        with patch.object(self.callbacks, 'write_block_callback') as write_block_patch, \
+                patch.object(self.callbacks, 'write_callback') as write_patch:
+            with self.assertRaises(ZeroDivisionError):
+                with self.dut.write_transaction():
+                    self.write_registers()
+                    _ = 1 / 0
+            write_block_patch.assert_not_called()
+            write_patch.assert_not_called()
+
+            with self.dut.write_transaction():
+                with self.assertRaises(RuntimeError):
+                    with self.dut.write_transaction():
+                        pass
+
+    def test_legacy_callbacks(self):
+        """
+        Check a transaction on a register model with legacy callbacks (whose block callbacks use
+        arrays) keeps the type and options of the callback set
+        """
+        memory = {0x4: 0x1, 0x8: 0x2, 0xC: 0x3, 0x10: 0x4}
+        block_writes: list[tuple[int, Array]] = []
+
+        def read_block(addr: int, width: int, accesswidth: int, length: int) -> Array:
+            assert width == accesswidth
+            return Array('L', [memory.get(addr + (entry * 4), 0) for entry in range(length)])
+
+        def write_block(addr: int, width: int, accesswidth: int, data: Array) -> None:
+            assert width == accesswidth
+            block_writes.append((addr, data))
+
+        callbacks = NormalCallbackSetLegacy(read_block_callback=read_block,
+                                            write_block_callback=write_block,
+                                            max_block_bytes=64)
+        with self.assertWarns(DeprecationWarning):
+            dut = AddressMapToTest(callbacks=callbacks)
+        with dut.write_transaction():
+            # pylint: disable-next=protected-access
+            transaction_callbacks = dut._callbacks
+            self.assertIsInstance(transaction_callbacks, NormalCallbackSetLegacy)
+            self.assertEqual(transaction_callbacks.max_block_bytes, 64)
+            dut.reg_array[1].write(0x55)
+            with dut.reg_array.single_read_modify_write(skip_write=True) as array:
+                self.assertListEqual([reg.read() for reg in array], [0x1, 0x55, 0x3, 0x4])
+            with dut.reg_array.single_read_modify_write() as array:
+                array[0].field.write(0)
+
+        self.assertListEqual([(addr, data.tolist()) for addr, data in block_writes],
+                             [(0x4, [0x0, 0x55])])
+        self.assertTrue(all(isinstance(data, Array) for _, data in block_writes))
+
+
+class TestVerifyScope(CallBackTestWrapper):
+    """
+    Tests for the deferred write verification
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dut = AddressMapToTest(callbacks=self.callbacks)
+
+    @staticmethod
+    def read_block_address_pattern(addr: int, width: int,
+                                   accesswidth: int, length: int) -> list[int]:
+        """
+        read block callback which returns the address of each register as its value
+        """
+        assert accesswidth == width
+        return [addr + (entry * (width >> 3)) for entry in range(length)]
+
+    def test_verify_scope(self):
+        """
+        Check the verification reads are made at the end of the scope as block reads and all
+        the mismatches are reported
+        """
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block_address_pattern) as read_block_patch, \
+                patch.object(self.callbacks, 'write_callback'), \
+                patch.object(self.callbacks, 'write_block_callback'):
+            with self.assertRaises(WriteVerifyError) as context:
+                with self.dut.verify_scope() as dut:
+                    self.assertIs(dut, self.dut)
+                    self.dut.reg_rw_b.write(0x20, verify=True)
+                    self.dut.reg_rw_a.write(0x0, verify=True)
+                    self.dut.reg_rw_a.write(0x18, verify=True)
+                    # writes without verify are not read back
+                    self.dut.reg_array[3].write(0x0)
+                    read_block_patch.assert_not_called()
+                    # the initial read of the array is made as normal
+                    with self.dut.reg_array[0:2].single_read_modify_write(verify=True) as array:
+                        array[0].write(0x4)
+                        array[1].write(0x1)
+                    read_block_patch.assert_called_once()
+
+            self.assertListEqual(read_block_patch.call_args_list, [
+                call(addr=0x4, width=32, accesswidth=32, length=2),
+                call(addr=0x4, width=32, accesswidth=32, length=2),
+                call(addr=0x18, width=32, accesswidth=32, length=1),
+                call(addr=0x20, width=32, accesswidth=32, length=1)])
+
+        mismatches = context.exception.mismatches
+        self.assertEqual(len(mismatches), 1)
+        self.assertEqual(mismatches[0].address, 0x8)
+        self.assertEqual(mismatches[0].expected, 0x1)
+        self.assertEqual(mismatches[0].read_back, 0x8)
+        self.assertEqual(mismatches[0].inst_name, 'dut.reg_array')
+        self.assertIsInstance(context.exception, RegisterWriteVerifyError)
+
+    def test_write_transaction(self):
+        """
+        Check the verification of writes in a write transaction is made after the registers
+        have been written
+        """
+        accesses = []
+
+        def write_block(addr: int, width: int, accesswidth: int, data: list[int]) -> None:
+            self.write_block_addr_space(addr=addr, width=width, accesswidth=accesswidth,
+                                        data=data)
+            accesses.append(('write', addr))
+
+        def read_block(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+            accesses.append(('read', addr))
+            return self.read_block_address_pattern(addr=addr, width=width,
+                                                   accesswidth=accesswidth, length=length)
+
+        with patch.object(self.callbacks, 'read_block_callback', side_effect=read_block), \
+                patch.object(self.callbacks, 'write_block_callback', side_effect=write_block):
+            with self.dut.write_transaction():
+                # a verify scope within the transaction joins it
+                with self.dut.verify_scope():
+                    self.dut.reg_rw_a.write(0x18, verify=True)
+                self.dut.reg_rw_b.write(0x20, verify=True)
+
+        self.assertListEqual(accesses, [('write', 0x18), ('write', 0x20),
+                                        ('read', 0x18), ('read', 0x20)])
+
+    def test_exception_abandons_verify(self):
+        """
+        Check that an exception in the scope abandons the verification
+        """
+        with patch.object(self.callbacks, 'read_block_callback') as read_block_patch, \
+                patch.object(self.callbacks, 'read_callback', return_value=0x0) as read_patch, \
+                patch.object(self.callbacks, 'write_callback'):
+            with self.assertRaises(ZeroDivisionError):
+                with self.dut.verify_scope():
+                    self.dut.reg_rw_a.write(0x1, verify=True)
+                    _ = 1 / 0
+            read_block_patch.assert_not_called()
+            read_patch.assert_not_called()
+
+            # outside the scope the verification is immediate
+            with self.assertRaises(RegisterWriteVerifyError):
+                self.dut.reg_rw_a.write(0x1, verify=True)
+            read_patch.assert_called_once_with(addr=0x18, width=32, accesswidth=32)
+
+
+class TestRestore(CallBackTestWrapper):
+    """
+    Tests for restoring a section from a saved image
+    """
+
+    image = {0x0: 0x1, 0x4: 0x1, 0x8: 0x0, 0xC: 0x1, 0x10: 0x0, 0x14: 0x1, 0x18: 0x1, 0x20: 0x0}
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dut = AddressMapToTest(callbacks=self.callbacks)
+
+    @staticmethod
+    def read_block_pattern(addr: int, width: int, accesswidth: int, length: int) -> list[int]:
+        """
+        read block callback which returns 0xF0 for each register
+        """
+        assert addr >= 0
+        assert accesswidth == width
+        return [0xF0 for _ in range(length)]
+
+    def test_restore(self):
+        """
+        Check that only the registers which differ from the image are written, merged into
+        runs, the read only register is not written and the write only register is always
+        written
+        """
+        with patch.object(self.callbacks, 'read_callback', return_value=0xF0) as read_patch, \
+                patch.object(self.callbacks, 'read_block_callback',
+                             side_effect=self.read_block_pattern) as read_block_patch, \
+                patch.object(self.callbacks, 'write_callback') as write_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_block_patch:
+            written = self.dut.restore(self.image)
+
+        read_block_patch.assert_called_once_with(addr=0x4, width=32, accesswidth=32, length=4)
+        self.assertListEqual(read_patch.call_args_list, [
+            call(addr=0x18, width=32, accesswidth=32),
+            call(addr=0x20, width=32, accesswidth=32)])
+        # the bits outside the field keep the value read from the register, apart from the
+        # write only register which can not be read
+        self.assertDictEqual(written, {0x4: 0xF1, 0xC: 0xF1, 0x14: 0x1, 0x18: 0xF1})
+        self.assertListEqual(write_patch.call_args_list, [
+            call(addr=0x4, width=32, accesswidth=32, data=0xF1),
+            call(addr=0xC, width=32, accesswidth=32, data=0xF1)])
+        write_block_patch.assert_called_once_with(addr=0x14, width=32, accesswidth=32,
+                                                  data=[0x1, 0xF1])
+
+    def test_restore_from_snapshot(self):
+        """
+        Check the current values can be provided (rather than read), only the register whose
+        field differs from the snapshot is written (the snapshot does not include the write only
+        register)
+        """
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block_pattern):
+            snapshot = self.dut.snapshot()
+        current = dict(snapshot)
+        # only the field (bit 0) is compared
+        current[0x4] = 0xE
+        current[0x18] = 0xF1
+
+        with patch.object(self.callbacks, 'read_block_callback') as read_block_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_block_patch:
+            self.assertDictEqual(self.dut.restore(snapshot, current=current), {0x18: 0xF0})
+            read_block_patch.assert_not_called()
+            write_block_patch.assert_called_once_with(addr=0x18, width=32, accesswidth=32,
+                                                      data=[0xF0])
+
+    def test_restore_volatile(self):
+        """
+        Check that volatile fields are not restored
+        """
+        field_type = type(self.dut.reg_rw_a.field)
+        with patch.object(field_type, 'is_volatile', new_callable=PropertyMock,
+                          return_value=True), \
+                patch.object(self.callbacks, 'read_callback') as read_patch, \
+                patch.object(self.callbacks, 'write_callback') as write_patch:
+            self.assertDictEqual(self.dut.restore(self.image), {0x14: 0x1})
+            read_patch.assert_not_called()
+            write_patch.assert_called_once_with(addr=0x14, width=32, accesswidth=32, data=0x1)
+
+    def test_restore_bad_image(self):
+        """
+        Check that an image which does not match the registers is rejected
+        """
+        with patch.object(self.callbacks, 'write_callback') as write_patch:
+            with self.assertRaises(ValueError):
+                self.dut.restore({0x1C: 0})
+            with self.assertRaises(ValueError):
+                self.dut.restore({0x18: 1 << 32})
+            with self.assertRaises(TypeError):
+                self.dut.restore({0x18: '1'})
+            write_patch.assert_not_called()
+
+            # addresses outside the section are ignored
+            self.dut.restore({0x100: 0, 0x14: 0})
+            write_patch.assert_called_once_with(addr=0x14, width=32, accesswidth=32, data=0x0)
+
+
+class TestAsyncWriteRegistersFields(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the concurrent read-modify-write of the fields of many registers
+    """
+
+    def setUp(self) -> None:
+        self.memory: dict[int, int] = {}
+        self.reads: list[int] = []
+        self.writes: list[int] = []
+        self.dut = AsyncAddressMapToTest(callbacks=AsyncCallbackSet(
+            read_callback=self.read, write_callback=self.write))
+
+    async def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback, recording the address read
+        """
+        assert width == accesswidth
+        self.reads.append(addr)
+        return self.memory.get(addr, 0)
+
+    async def write(self, addr: int, width: int, accesswidth: int, data: int) -> None:
+        """
+        write callback, recording the address written
+        """
+        assert width == accesswidth
+        self.writes.append(addr)
+        self.memory[addr] = data
+
+    async def test_evicted_element(self):
+        """
+        Check that two objects for the same register (an element of an array which builds its
+        elements on demand, taken either side of it being evicted) are read and written once
+        with the updates applied in order
+        """
+        first_element = self.dut.reg_array[0]
+        for index in range(1, LAZY_ARRAY_CACHE_SIZE + 1):
+            _ = self.dut.reg_array[index]
+        rebuilt_element = self.dut.reg_array[0]
+        self.assertIsNot(rebuilt_element, first_element)
+
+        await async_write_registers_fields([(first_element, {'field': 1}),
+                                            (self.dut.reg_array[1], {'field': 3}),
+                                            (rebuilt_element, {'field': 2})])
+        self.assertListEqual(sorted(self.reads), [0x0, 0x4])
+        self.assertListEqual(sorted(self.writes), [0x0, 0x4])
+        self.assertDictEqual(self.memory, {0x0: 2, 0x4: 3})
+
+
+class TestBoundedGather(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the concurrent calls used by the async bulk reads
+    """
+
+    def setUp(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight_seen = 0
+        self.started: list[int] = []
+        self.completed: list[int] = []
+
+    async def access(self, item: int) -> int:
+        """
+        dummy access that completes in the reverse order to which it was started
+        """
+        self.started.append(item)
+        self.in_flight += 1
+        self.max_in_flight_seen = max(self.max_in_flight_seen, self.in_flight)
+        if item == 99:
+            self.in_flight -= 1
+            raise ValueError('access failed')
+        await asyncio.sleep(0.001 * (10 - item))
+        self.in_flight -= 1
+        self.completed.append(item)
+        return item * 2
+
+    async def test_order(self):
+        """
+        Check the results are in the order of the items whatever order they complete in
+        """
+        self.assertListEqual(await bounded_gather(self.access, range(10)),
+                             [item * 2 for item in range(10)])
+        self.assertEqual(self.max_in_flight_seen, 10)
+
+    async def test_max_in_flight(self):
+        """
+        Check the number of calls outstanding is limited
+        """
+        self.assertListEqual(await bounded_gather(self.access, range(10), max_in_flight=3),
+                             [item * 2 for item in range(10)])
+        self.assertEqual(self.max_in_flight_seen, 3)
+
+        self.max_in_flight_seen = 0
+        self.started.clear()
+        self.assertListEqual(await bounded_gather(self.access, range(10), max_in_flight=1),
+                             [item * 2 for item in range(10)])
+        self.assertEqual(self.max_in_flight_seen, 1)
+        self.assertListEqual(self.started, list(range(10)))
+
+        with self.assertRaises(ValueError):
+            await bounded_gather(self.access, range(10), max_in_flight=0)
+        with self.assertRaises(TypeError):
+            await bounded_gather(self.access, range(10), max_in_flight=1.5)  # type: ignore[arg-type]
+
+    async def test_error(self):
+        """
+        Check an exception from one call is raised and the other calls are cancelled
+        """
+        with self.assertRaises(ValueError):
+            await bounded_gather(self.access, [1, 99, 2, 3, 4], max_in_flight=2)
+        await asyncio.sleep(0.02)
+        self.assertNotIn(4, self.started)
+        self.assertListEqual(self.completed, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,312 @@
+"""
+peakrdl-python is a tool to generate Python Register Access Layer (RAL) from SystemRDL
+Copyright (C) 2021 - 2025
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as
+published by the Free Software Foundation, either version 3 of
+the License, or (at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Tests for the shadow cache attached to the top level address map
+"""
+import unittest
+from unittest.mock import patch, call, PropertyMock
+from concurrent.futures import ThreadPoolExecutor
+
+# pylint: disable-next=unused-wildcard-import, wildcard-import
+from peakrdl_python.lib import *
+
+from .simple_components import AddressMapToTest, AsyncAddressMapToTest, CallBackTestWrapper
+from .simple_components import AsyncReadWriteRegisterToTest
+
+
+class TestShadowCache(CallBackTestWrapper):
+    """
+    Tests for the shadow cache
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.dut = AddressMapToTest(callbacks=self.callbacks)
+
+    @staticmethod
+    def read_block_address_pattern(addr: int, width: int,
+                                   accesswidth: int, length: int) -> list[int]:
+        """
+        read block callback which returns the address of each register as its value
+        """
+        assert accesswidth == width
+        return [addr + (entry * (width >> 3)) for entry in range(length)]
+
+    def test_read(self):
+        """
+        Check the second read of a register is served from the cache
+        """
+        shadow_cache = self.dut.enable_shadow_cache()
+        self.assertIs(self.dut.shadow_cache, shadow_cache)
+
+        with patch.object(self.callbacks, 'read_callback', return_value=0xF0) as read_patch:
+            self.assertEqual(self.dut.reg_rw_a.read(), 0xF0)
+            self.assertEqual(self.dut.reg_rw_a.read(), 0xF0)
+            self.assertEqual(self.dut.reg_ro.field.read(), 0)
+            self.assertEqual(self.dut.reg_ro.read(), 0xF0)
+            self.assertListEqual(read_patch.call_args_list, [
+                call(addr=0x18, width=32, accesswidth=32),
+                call(addr=0x0, width=32, accesswidth=32)])
+
+        self.assertEqual(shadow_cache.statistics.hits, 2)
+        self.assertEqual(shadow_cache.statistics.misses, 2)
+        self.assertEqual(shadow_cache.statistics.uncached, 0)
+        self.assertAlmostEqual(shadow_cache.statistics.hit_rate, 0.5)
+        shadow_cache.statistics.reset()
+        self.assertEqual(shadow_cache.statistics.hit_rate, 0.0)
+
+        # once the cache is disabled, the reads go to the hardware again
+        self.dut.disable_shadow_cache()
+        self.assertIsNone(self.dut.shadow_cache)
+        with patch.object(self.callbacks, 'read_callback', return_value=0x1) as read_patch:
+            self.assertEqual(self.dut.reg_rw_a.read(), 0x1)
+            read_patch.assert_called_once_with(addr=0x18, width=32, accesswidth=32)
+
+    def test_write(self):
+        """
+        Check the writes are passed to the hardware and update the cache
+        """
+        self.dut.enable_shadow_cache()
+
+        with patch.object(self.callbacks, 'read_callback', return_value=0xF0) as read_patch, \
+                patch.object(self.callbacks, 'write_callback') as write_patch:
+            # a register that has not been read takes the written value for its read/write
+            # field (bits outside the fields read back as zero)
+            self.dut.reg_rw_b.write(0x11)
+            write_patch.assert_called_once_with(addr=0x20, width=32, accesswidth=32, data=0x11)
+            self.assertEqual(self.dut.reg_rw_b.read(), 0x1)
+
+            # a read-modify-write of a field only reads the hardware once
+            self.dut.reg_rw_a.field.write(0)
+            self.dut.reg_rw_a.field.write(1)
+            self.assertEqual(self.dut.reg_rw_a.read(), 0x1)
+            read_patch.assert_called_once_with(addr=0x18, width=32, accesswidth=32)
+
+    def test_block_read(self):
+        """
+        Check a block read is served from the cache if all the registers are cached
+        """
+        with patch.object(self.callbacks, 'read_block_callback',
+                          side_effect=self.read_block_address_pattern) as read_block_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_block_patch:
+            # the block callbacks are only offered to the register model if the underlying
+            # callback set has them when the cache is enabled
+            shadow_cache = self.dut.enable_shadow_cache()
+            with self.dut.reg_array.single_read_modify_write() as reg_array:
+                reg_array[1].write(0x1)
+            read_block_patch.assert_called_once_with(addr=0x4, width=32, accesswidth=32,
+                                                     length=4)
+            write_block_patch.assert_called_once_with(addr=0x8, width=32, accesswidth=32,
+                                                      data=[0x1])
+            read_block_patch.reset_mock()
+
+            with self.dut.reg_array.single_read_modify_write(skip_write=True) as reg_array:
+                self.assertEqual(reg_array[0].read(), 0x4)
+                self.assertEqual(reg_array[1].read(), 0x1)
+            read_block_patch.assert_not_called()
+            self.assertEqual(shadow_cache.statistics.hits, 4)
+            self.assertEqual(shadow_cache.statistics.misses, 4)
+
+    def test_volatile(self):
+        """
+        Check registers with volatile fields are not cached
+        """
+        field_type = type(self.dut.reg_rw_a.field)
+        shadow_cache = self.dut.enable_shadow_cache()
+
+        # the registers are looked up when they are first accessed
+        with patch.object(field_type, 'is_volatile', new_callable=PropertyMock,
+                          return_value=True), \
+                patch.object(self.callbacks, 'read_callback', return_value=0x0) as read_patch:
+            self.dut.reg_rw_a.read()
+            self.dut.reg_rw_a.read()
+            self.dut.reg_ro.read()
+            self.dut.reg_ro.read()
+            self.assertEqual(read_patch.call_count, 3)
+
+        self.assertEqual(shadow_cache.statistics.uncached, 2)
+        self.assertFalse(shadow_cache.is_cached(self.dut.reg_rw_a))
+        self.assertTrue(shadow_cache.is_cached(self.dut.reg_ro))
+
+    def test_side_effect(self):
+        """
+        Check registers with a field that has a side effect (for example rclr or woclr) are not
+        cached, even if the field is not readable
+        """
+        field_type = type(self.dut.reg_rw_a.field)
+        shadow_cache = self.dut.enable_shadow_cache()
+
+        with patch.object(field_type, 'has_side_effect', new_callable=PropertyMock,
+                          return_value=True), \
+                patch.object(self.callbacks, 'read_callback', return_value=0x0) as read_patch, \
+                patch.object(self.callbacks, 'write_callback'):
+            self.dut.reg_rw_a.read()
+            self.dut.reg_rw_a.read()
+            self.dut.reg_rw_b.write(0x1)
+            self.dut.reg_rw_b.read()
+            self.assertEqual(read_patch.call_count, 3)
+
+        self.assertEqual(shadow_cache.statistics.uncached, 3)
+        self.assertFalse(shadow_cache.is_cached(self.dut.reg_rw_a))
+        self.assertFalse(shadow_cache.is_cached(self.dut.reg_rw_b))
+
+    def test_lookup(self):
+        """
+        Check the lookup of the register at an address used by the cache
+        """
+        # pylint: disable=protected-access
+        self.assertIs(self.dut._shadow_cache_lookup(0x0), self.dut.reg_ro)
+        self.assertIs(self.dut._shadow_cache_lookup(0xC), self.dut.reg_array[2])
+        self.assertIs(self.dut._shadow_cache_lookup(0x20), self.dut.reg_rw_b)
+        # not the start of a register
+        self.assertIsNone(self.dut._shadow_cache_lookup(0xE))
+        # a register that can not be read
+        self.assertIsNone(self.dut._shadow_cache_lookup(0x14))
+        # outside the address map
+        self.assertIsNone(self.dut._shadow_cache_lookup(0x100))
+
+    def test_invalidate_and_refresh(self):
+        """
+        Check the cache can be invalidated and refreshed for a section
+        """
+        with self.assertRaises(RuntimeError):
+            self.dut.refresh()
+
+        shadow_cache = self.dut.enable_shadow_cache()
+        with self.assertRaises(RuntimeError):
+            self.dut.enable_shadow_cache()
+
+        with patch.object(self.callbacks, 'read_callback', return_value=0x0) as read_patch, \
+                patch.object(self.callbacks, 'read_block_callback',
+                             side_effect=self.read_block_address_pattern) as read_block_patch:
+            self.dut.refresh()
+            read_block_patch.assert_called_once_with(addr=0x0, width=32, accesswidth=32,
+                                                     length=5)
+            self.assertListEqual(read_patch.call_args_list, [
+                call(addr=0x18, width=32, accesswidth=32),
+                call(addr=0x20, width=32, accesswidth=32)])
+            read_patch.reset_mock()
+
+            self.assertEqual(self.dut.reg_array[2].read(), 0xC)
+            self.assertTrue(shadow_cache.is_cached(self.dut.reg_rw_b))
+            read_patch.assert_not_called()
+
+            self.dut.invalidate()
+            self.assertFalse(shadow_cache.is_cached(self.dut.reg_rw_b))
+            self.assertEqual(self.dut.reg_rw_b.read(), 0x0)
+            read_patch.assert_called_once_with(addr=0x20, width=32, accesswidth=32)
+
+    def test_write_transaction(self):
+        """
+        Check the writes made in a write transaction update the cache when they are written
+        """
+        self.dut.enable_shadow_cache()
+        with patch.object(self.callbacks, 'read_callback', return_value=0x0) as read_patch, \
+                patch.object(self.callbacks, 'write_block_callback') as write_block_patch:
+            with self.dut.write_transaction():
+                with self.assertRaises(RuntimeError):
+                    self.dut.disable_shadow_cache()
+                self.dut.reg_rw_a.write(0x1)
+                self.dut.reg_rw_b.write(0x1)
+            self.assertEqual(write_block_patch.call_count, 2)
+            self.assertEqual(self.dut.reg_rw_a.read(), 0x1)
+            self.assertEqual(self.dut.reg_rw_b.read(), 0x1)
+            read_patch.assert_not_called()
+
+    def test_callback_options(self):
+        """
+        Check the callbacks of the cache keep the options of the underlying callback set and pass
+        the buffer callbacks through to it
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor, \
+                patch.object(self.callbacks, 'single_access_executor', executor), \
+                patch.object(self.callbacks, 'ordered_writes', False), \
+                patch.object(self.callbacks, 'max_block_bytes', 64), \
+                patch.object(self.callbacks, 'read_block_into_callback') as read_into_patch, \
+                patch.object(self.callbacks, 'write_block_buffer_callback') as write_buffer_patch, \
+                patch.object(self.callbacks, 'read_callback', return_value=0x3) as read_patch:
+            shadow_cache = self.dut.enable_shadow_cache()
+            cache_callbacks = shadow_cache.callbacks
+            self.assertIsInstance(cache_callbacks, NormalCallbackSet)
+            self.assertIs(cache_callbacks.single_access_executor, executor)
+            self.assertFalse(cache_callbacks.ordered_writes)
+            self.assertEqual(cache_callbacks.max_block_bytes, 64)
+
+            # without a block callback, the registers of the array are read on the executor
+            with self.dut.reg_array.single_read_modify_write(skip_write=True) as reg_array:
+                self.assertEqual(reg_array[3].read(), 0x3)
+            self.assertEqual(read_patch.call_count, 4)
+
+            buffer = memoryview(bytearray(8))
+            cache_callbacks.read_block_into_callback(addr=0x100, width=32, accesswidth=32,
+                                                     buffer=buffer)
+            read_into_patch.assert_called_once_with(addr=0x100, width=32, accesswidth=32,
+                                                    buffer=buffer)
+            self.assertEqual(shadow_cache.statistics.uncached, 2)
+
+            # a buffer write drops any cached value it covers
+            self.assertTrue(shadow_cache.is_cached(self.dut.reg_array[1]))
+            data = memoryview(bytes(4))
+            cache_callbacks.write_block_buffer_callback(addr=0x8, width=32, accesswidth=32,
+                                                        data=data)
+            write_buffer_patch.assert_called_once_with(addr=0x8, width=32, accesswidth=32,
+                                                       data=data)
+            self.assertFalse(shadow_cache.is_cached(self.dut.reg_array[1]))
+            self.assertTrue(shadow_cache.is_cached(self.dut.reg_array[0]))
+
+
+
+class TestAsyncShadowCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the shadow cache of an async register model with an array that builds its elements
+    on demand
+    """
+
+    def setUp(self) -> None:
+        self.reads: list[int] = []
+        self.dut = AsyncAddressMapToTest(callbacks=AsyncCallbackSet(read_callback=self.read))
+
+    async def read(self, addr: int, width: int, accesswidth: int) -> int:
+        """
+        read callback, recording the address read
+        """
+        assert width == accesswidth
+        self.reads.append(addr)
+        return addr
+
+    async def test_lazy_lookup(self):
+        """
+        Check enabling the cache does not build the elements of the array, only the register
+        accessed is looked up
+        """
+        with patch.object(AsyncReadWriteRegisterToTest, '__init__', autospec=True,
+                          side_effect=AsyncReadWriteRegisterToTest.__init__) as build_patch:
+            shadow_cache = self.dut.enable_shadow_cache()
+            build_patch.assert_not_called()
+
+            register = self.dut.reg_array[20]
+            self.assertEqual(await register.read(), 0x50)
+            self.assertEqual(await register.read(), 0x50)
+            build_patch.assert_called_once()
+
+        self.assertListEqual(self.reads, [0x50])
+        self.assertEqual(shadow_cache.statistics.hits, 1)
+        self.assertEqual(shadow_cache.statistics.misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()